@@ -1,4 +1,7 @@
 from .archivo import RecursoArchivo
+from .directorio import Directorio
+from .disco import Disco, SolicitudIO
+from .cache import CacheBloques
 from .gestorArchivos import GestorArchivos
 
-__all__ = ['RecursoArchivo', 'GestorArchivos']
+__all__ = ['RecursoArchivo', 'Directorio', 'Disco', 'SolicitudIO', 'CacheBloques', 'GestorArchivos']
@@ -16,9 +16,14 @@ class RecursoArchivo:
         self.nombre = nombre
         self.bloqueado = False
         self.proceso_propietario = None
+        self.propietario = None  # Proceso propietario (para herencia de prioridad)
+        self.techo_prioridad = None
+        self.directorio = None  # Directorio que contiene al archivo
         self.cola_espera = deque()
         self.veces_usado = 0
         self.conflictos = 0
+        self.bloque_inicio = 0
+        self.num_bloques = 1
 
     def __str__(self) -> str:
         estado = f"P{self.proceso_propietario}" if self.bloqueado else "LIBRE"
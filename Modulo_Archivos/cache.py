@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+Modulo de Archivos - Clase CacheBloques
+Buffer cache de bloques de disco con reemplazo LRU o 2Q y escritura diferida
+"""
+
+from collections import OrderedDict
+
+
+POLITICAS_CACHE = ('LRU', '2Q')
+
+
+class CacheBloques:
+    """
+    Cache de bloques entre el gestor de archivos y el disco
+    """
+
+    def __init__(self, capacidad: int = 16, politica: str = 'LRU', intervalo_flush: int = 10):
+        """
+        Inicializa la cache
+
+        Args:
+            capacidad: Numero maximo de bloques en memoria
+            politica: Politica de reemplazo (LRU o 2Q)
+            intervalo_flush: Cada cuantos ticks se escriben a disco los bloques sucios
+        """
+        self.capacidad = capacidad
+        self.politica = politica.upper()
+        if self.politica not in POLITICAS_CACHE:
+            raise ValueError(f"Politica de cache desconocida: {politica}")
+        self.intervalo_flush = intervalo_flush
+
+        # LRU usa solo 'principal'; 2Q usa 'a1_entrada' (FIFO), 'principal' (LRU)
+        # y 'a1_salida' (historial de bloques expulsados, sin datos)
+        self.principal = OrderedDict()
+        self.a1_entrada = OrderedDict()
+        self.a1_salida = OrderedDict()
+        self.limite_a1_entrada = max(1, capacidad // 4)
+        self.limite_a1_salida = max(1, capacidad // 2)
+
+        self.sucios = set()
+
+        # Metricas
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.flushes = 0
+        self.bloques_escritos_flush = 0
+        self.bloques_escritos_desalojo = 0
+
+    def contiene(self, bloque: int) -> bool:
+        """
+        Verifica si un bloque esta en la cache
+        """
+        return bloque in self.principal or bloque in self.a1_entrada
+
+    def _tocar(self, bloque: int):
+        """
+        Registra un acceso a un bloque presente
+        """
+        if bloque in self.principal:
+            self.principal.move_to_end(bloque)
+        # En 2Q un acierto en A1in no reordena (se comporta como FIFO)
+
+    def leer(self, bloques) -> bool:
+        """
+        Lee un rango de bloques; devuelve True si todos estaban en cache
+        """
+        acierto_total = True
+        for bloque in bloques:
+            if self.contiene(bloque):
+                self.aciertos += 1
+                self._tocar(bloque)
+            else:
+                self.fallos += 1
+                acierto_total = False
+        return acierto_total
+
+    def escribir(self, bloques) -> list:
+        """
+        Escribe un rango de bloques en cache (write-back)
+
+        Returns:
+            Bloques sucios desalojados que deben escribirse a disco
+        """
+        desalojados = []
+        for bloque in bloques:
+            if self.contiene(bloque):
+                self.aciertos += 1
+                self._tocar(bloque)
+            else:
+                self.fallos += 1
+                desalojados.extend(self.insertar(bloque))
+            self.sucios.add(bloque)
+        return desalojados
+
+    def insertar(self, bloque: int) -> list:
+        """
+        Inserta un bloque limpio tras leerlo de disco
+
+        Returns:
+            Bloques sucios desalojados que deben escribirse a disco
+        """
+        if self.contiene(bloque):
+            self._tocar(bloque)
+            return []
+
+        if self.politica == 'LRU':
+            self.principal[bloque] = None
+        elif bloque in self.a1_salida:
+            # Visto recientemente: pasa directo a la cola principal
+            del self.a1_salida[bloque]
+            self.principal[bloque] = None
+        else:
+            self.a1_entrada[bloque] = None
+
+        return self._desalojar()
+
+    def _desalojar(self) -> list:
+        """
+        Expulsa bloques hasta respetar la capacidad
+        """
+        desalojados = []
+        while len(self.principal) + len(self.a1_entrada) > self.capacidad:
+            if self.politica == '2Q' and (len(self.a1_entrada) > self.limite_a1_entrada or not self.principal):
+                victima, _ = self.a1_entrada.popitem(last=False)
+                self.a1_salida[victima] = None
+                if len(self.a1_salida) > self.limite_a1_salida:
+                    self.a1_salida.popitem(last=False)
+            else:
+                victima, _ = self.principal.popitem(last=False)
+
+            self.desalojos += 1
+            if victima in self.sucios:
+                self.sucios.discard(victima)
+                self.bloques_escritos_desalojo += 1
+                desalojados.append(victima)
+
+        return desalojados
+
+    def debe_flush(self, tiempo_actual: int) -> bool:
+        """
+        Indica si toca ejecutar el flusher periodico
+        """
+        return self.intervalo_flush > 0 and tiempo_actual % self.intervalo_flush == 0 and bool(self.sucios)
+
+    def flush(self) -> list:
+        """
+        Marca como limpios todos los bloques sucios y los devuelve ordenados
+        """
+        bloques = sorted(self.sucios)
+        self.sucios.clear()
+        self.flushes += 1
+        self.bloques_escritos_flush += len(bloques)
+        return bloques
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Obtiene estadisticas de la cache
+        """
+        accesos = self.aciertos + self.fallos
+        tasa_aciertos = self.aciertos / accesos if accesos else 0
+
+        return {
+            'politica': self.politica,
+            'capacidad': self.capacidad,
+            'bloques_en_cache': len(self.principal) + len(self.a1_entrada),
+            'bloques_sucios': len(self.sucios),
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'tasa_aciertos': round(tasa_aciertos * 100, 2),
+            'desalojos': self.desalojos,
+            'flushes': self.flushes,
+            'bloques_escritos_flush': self.bloques_escritos_flush,
+            'bloques_escritos_desalojo': self.bloques_escritos_desalojo
+        }
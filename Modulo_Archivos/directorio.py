@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Modulo de Archivos - Clase Directorio
+Nodo del arbol de nombres (trie por componentes de ruta) con bloqueo a nivel de directorio
+"""
+
+from collections import deque
+
+
+class Directorio:
+    """
+    Representa un directorio del sistema de archivos
+    """
+
+    def __init__(self, nombre: str, padre=None):
+        self.nombre = nombre
+        self.padre = padre
+        self.ruta = '/' if padre is None else (padre.ruta.rstrip('/') + '/' + nombre)
+        self.subdirectorios = {}  # {nombre: Directorio}
+        self.archivos = {}  # {nombre: RecursoArchivo}
+        self.bloqueado = False
+        self.proceso_propietario = None
+        self.cola_espera = deque()  # procesos cuyo acceso a un archivo espera a este directorio
+        self.en_uso = {}  # {id_proceso: archivos/directorios bloqueados por el proceso por debajo}
+
+    def ancestros(self):
+        """
+        Recorre este directorio y todos sus ancestros hasta la raiz
+        """
+        directorio = self
+        while directorio is not None:
+            yield directorio
+            directorio = directorio.padre
+
+    def registrar_uso(self, id_proceso: int, delta: int):
+        """
+        Actualiza el contador de uso de un proceso en este directorio y sus ancestros
+        """
+        for directorio in self.ancestros():
+            total = directorio.en_uso.get(id_proceso, 0) + delta
+            if total > 0:
+                directorio.en_uso[id_proceso] = total
+            else:
+                directorio.en_uso.pop(id_proceso, None)
+
+    def __str__(self) -> str:
+        estado = f"P{self.proceso_propietario}" if self.bloqueado else "LIBRE"
+        return f"{self.ruta}[{estado}]"
+
+    def __repr__(self) -> str:
+        return self.__str__()
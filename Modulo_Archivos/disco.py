@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+Modulo de Archivos - Clase Disco
+Simula un dispositivo de disco con tiempo de busqueda y transferencia
+y un planificador del brazo (FCFS, SSTF, SCAN, C-LOOK)
+"""
+
+import math
+from collections import deque
+
+
+ALGORITMOS_DISCO = ('FCFS', 'SSTF', 'SCAN', 'C-LOOK')
+
+
+class Histograma:
+    """
+    Conteo de valores enteros (ticks) con percentiles exactos
+
+    Ocupa memoria segun la cantidad de valores distintos, no de muestras, y
+    recuerda los ultimos percentiles calculados hasta la siguiente muestra
+    """
+
+    def __init__(self):
+        self.conteos = {}
+        self.total = 0
+        self._calculados = {}
+
+    def registrar(self, valor: int):
+        """
+        Anade una muestra
+        """
+        self.conteos[valor] = self.conteos.get(valor, 0) + 1
+        self.total += 1
+        self._calculados = {}
+
+    def __len__(self) -> int:
+        return self.total
+
+    def percentil(self, percentil: float) -> float:
+        """
+        Calcula un percentil (metodo del rango mas cercano)
+        """
+        if not self.total:
+            return 0
+        if percentil not in self._calculados:
+            rango = max(1, math.ceil(percentil / 100 * self.total))
+            acumulado = 0
+            for valor in sorted(self.conteos):
+                acumulado += self.conteos[valor]
+                if acumulado >= rango:
+                    break
+            self._calculados[percentil] = valor
+        return self._calculados[percentil]
+
+
+class SolicitudIO:
+    """
+    Representa una peticion de I/O pendiente en el disco
+    """
+
+    def __init__(self, proceso, nombre_archivo: str, bloque_inicio: int,
+                 num_bloques: int, tiempo_llegada: int, escritura: bool = False):
+        self.proceso = proceso  # None para escrituras diferidas de la cache
+        self.escritura = escritura
+        self.nombre_archivo = nombre_archivo
+        self.bloque_inicio = bloque_inicio
+        self.num_bloques = num_bloques
+        self.tiempo_llegada = tiempo_llegada
+        self.tiempo_inicio = None
+        self.tiempo_fin = None
+
+    def __str__(self) -> str:
+        origen = f"P{self.proceso.id}" if self.proceso is not None else "CACHE"
+        tipo = "W" if self.escritura else "R"
+        return f"IO-{tipo}({origen}, {self.nombre_archivo}@{self.bloque_inicio})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+class Disco:
+    """
+    Dispositivo de disco con cola de peticiones y planificacion del brazo
+    """
+
+    def __init__(self, bloques_totales: int = 1000, algoritmo: str = 'FCFS',
+                 pistas_por_tick: int = 100, bloques_por_tick: int = 4):
+        """
+        Inicializa el disco
+
+        Args:
+            bloques_totales: Numero de bloques (posiciones del brazo) del disco
+            algoritmo: Planificacion del brazo (FCFS, SSTF, SCAN, C-LOOK)
+            pistas_por_tick: Distancia que recorre el brazo en un tick
+            bloques_por_tick: Bloques transferidos por tick
+        """
+        self.bloques_totales = bloques_totales
+        self.algoritmo = algoritmo.upper()
+        if self.algoritmo not in ALGORITMOS_DISCO:
+            raise ValueError(f"Algoritmo de disco desconocido: {algoritmo}")
+        self.pistas_por_tick = pistas_por_tick
+        self.bloques_por_tick = bloques_por_tick
+
+        self.cabezal = 0
+        self.direccion = 1  # 1 = hacia bloques altos, -1 = hacia bloques bajos (SCAN)
+        self.cola_peticiones = deque()
+        self.solicitud_actual = None
+        self.tiempo_servicio_restante = 0
+        self.tiempo_actual = 0
+
+        # Metricas
+        self.distancia_busqueda_total = 0
+        self.ticks_ocupado = 0
+        self.ticks_totales = 0
+        self.latencias = Histograma()
+        self.solicitudes_completadas = 0
+        self.log_operaciones = []
+
+    def tiempo_servicio(self, solicitud: SolicitudIO, distancia: int) -> int:
+        """
+        Calcula el tiempo de busqueda mas transferencia de una peticion
+        """
+        busqueda = math.ceil(distancia / self.pistas_por_tick)
+        transferencia = math.ceil(solicitud.num_bloques / self.bloques_por_tick)
+        return max(1, busqueda + transferencia)
+
+    def encolar(self, solicitud: SolicitudIO):
+        """
+        Anade una peticion a la cola del disco
+        """
+        self.cola_peticiones.append(solicitud)
+
+    def seleccionar_siguiente(self) -> SolicitudIO:
+        """
+        Selecciona la siguiente peticion segun el algoritmo del brazo
+        """
+        if not self.cola_peticiones:
+            return None
+
+        if self.algoritmo == 'FCFS':
+            solicitud = self.cola_peticiones[0]
+        elif self.algoritmo == 'SSTF':
+            solicitud = self._sstf()
+        elif self.algoritmo == 'SCAN':
+            solicitud = self._scan()
+        else:
+            solicitud = self._clook()
+
+        self.cola_peticiones.remove(solicitud)
+        return solicitud
+
+    def _sstf(self) -> SolicitudIO:
+        """
+        Shortest Seek Time First - la peticion mas cercana al cabezal
+        """
+        return min(self.cola_peticiones, key=lambda s: abs(s.bloque_inicio - self.cabezal))
+
+    def _scan(self) -> SolicitudIO:
+        """
+        SCAN (ascensor) - atiende en la direccion actual y luego invierte
+        """
+        if self.direccion == 1:
+            candidatas = [s for s in self.cola_peticiones if s.bloque_inicio >= self.cabezal]
+            if candidatas:
+                return min(candidatas, key=lambda s: s.bloque_inicio)
+        else:
+            candidatas = [s for s in self.cola_peticiones if s.bloque_inicio <= self.cabezal]
+            if candidatas:
+                return max(candidatas, key=lambda s: s.bloque_inicio)
+
+        # Sin peticiones en esta direccion: el brazo llega al borde e invierte
+        self.cabezal = self.bloques_totales - 1 if self.direccion == 1 else 0
+        self.direccion = -self.direccion
+        return self._scan()
+
+    def _clook(self) -> SolicitudIO:
+        """
+        C-LOOK - solo atiende subiendo; al llegar al final salta a la menor peticion
+        """
+        candidatas = [s for s in self.cola_peticiones if s.bloque_inicio >= self.cabezal]
+        if candidatas:
+            return min(candidatas, key=lambda s: s.bloque_inicio)
+        return min(self.cola_peticiones, key=lambda s: s.bloque_inicio)
+
+    def avanzar(self, tiempo_actual: int) -> list:
+        """
+        Avanza el disco un tick y devuelve las peticiones completadas
+        """
+        self.tiempo_actual = tiempo_actual
+        self.ticks_totales += 1
+        completadas = []
+
+        if self.solicitud_actual is None:
+            self._iniciar_siguiente()
+
+        if self.solicitud_actual is not None:
+            self.ticks_ocupado += 1
+            self.tiempo_servicio_restante -= 1
+            if self.solicitud_actual.proceso is not None:
+                self.solicitud_actual.proceso.tiempo_io_restante = self.tiempo_servicio_restante
+
+            if self.tiempo_servicio_restante <= 0:
+                solicitud = self.solicitud_actual
+                solicitud.tiempo_fin = tiempo_actual
+                self.latencias.registrar(solicitud.tiempo_fin - solicitud.tiempo_llegada)
+                self.solicitudes_completadas += 1
+                self.solicitud_actual = None
+                completadas.append(solicitud)
+
+        return completadas
+
+    def _iniciar_siguiente(self):
+        """
+        Toma la siguiente peticion de la cola y mueve el brazo hacia ella
+        """
+        cabezal_previo = self.cabezal
+        solicitud = self.seleccionar_siguiente()
+        if solicitud is None:
+            return
+
+        # SCAN puede haber llevado el brazo hasta un borde antes de elegir
+        distancia = abs(self.cabezal - cabezal_previo) + abs(solicitud.bloque_inicio - self.cabezal)
+        self.tiempo_servicio_restante = self.tiempo_servicio(solicitud, distancia)
+        self.distancia_busqueda_total += distancia
+        if solicitud.bloque_inicio != self.cabezal:
+            self.direccion = 1 if solicitud.bloque_inicio > self.cabezal else -1
+        self.cabezal = solicitud.bloque_inicio + solicitud.num_bloques - 1
+
+        solicitud.tiempo_inicio = self.tiempo_actual
+        if solicitud.proceso is not None:
+            solicitud.proceso.tiempo_io_restante = self.tiempo_servicio_restante
+        self.solicitud_actual = solicitud
+
+        self.log_operaciones.append(
+            f"T{self.tiempo_actual}: DISCO {self.algoritmo} - atendiendo {solicitud} ({self.tiempo_servicio_restante} ticks)"
+        )
+
+    def esta_ocupado(self) -> bool:
+        """
+        Verifica si el disco tiene trabajo en curso o pendiente
+        """
+        return self.solicitud_actual is not None or len(self.cola_peticiones) > 0
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Obtiene estadisticas del disco
+        """
+        utilizacion = self.ticks_ocupado / self.ticks_totales if self.ticks_totales else 0
+
+        return {
+            'algoritmo': self.algoritmo,
+            'solicitudes_completadas': self.solicitudes_completadas,
+            'solicitudes_pendientes': len(self.cola_peticiones) + (1 if self.solicitud_actual else 0),
+            'distancia_busqueda_total': self.distancia_busqueda_total,
+            'latencia_p50': self.latencias.percentil(50),
+            'latencia_p90': self.latencias.percentil(90),
+            'latencia_p99': self.latencias.percentil(99),
+            'utilizacion': round(utilizacion * 100, 2)
+        }
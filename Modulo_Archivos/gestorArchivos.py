@@ -1,4 +1,6 @@
 from typing import Optional
+from bisect import bisect_right
+from itertools import islice
 import sys
 import os
 
@@ -6,23 +8,292 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from Modulo_Procesos.proceso import Proceso
 from Modulo_Archivos.archivo import RecursoArchivo
+from Modulo_Archivos.directorio import Directorio
+from Modulo_Archivos.disco import Disco, SolicitudIO, Histograma
+from Modulo_Archivos.cache import CacheBloques
+
+
+PROTOCOLOS_PRIORIDAD = ('HERENCIA', 'TECHO')
+PRIORIDAD_ALTA = 2  # prioridades <= 2 cuentan como alta prioridad en las metricas
+# Ticks de CPU que el motor mantiene un archivo bloqueado despues de su I/O
+TICKS_SECCION_CRITICA = 2
+
+
+def normalizar_ruta(ruta: str) -> str:
+    """
+    Ruta canonica de un archivo: sin '/' al principio ni al final y sin componentes vacios
+
+    Raises:
+        ValueError: Si la ruta no tiene ningun componente
+    """
+    partes = [parte for parte in ruta.split('/') if parte]
+    if not partes:
+        raise ValueError(f"Ruta de archivo vacia: {ruta!r}")
+    return '/'.join(partes)
 
 
 class GestorArchivos:
 
-    def __init__(self, nombres_archivos: list):
-        
+    def __init__(self, nombres_archivos: list, disco: Optional[Disco] = None,
+                 bloques_por_archivo: int = 8, cache: Optional[CacheBloques] = None,
+                 archivos_escritura: Optional[list] = None,
+                 protocolo_prioridad: Optional[str] = None,
+                 ticks_seccion_critica: int = 0):
+        """
+        Inicializa el gestor
+
+        Args:
+            ticks_seccion_critica: Ticks de CPU que un proceso conserva el archivo
+                                   despues de completar su I/O (0 = lo libera al
+                                   completarla); mientras tanto vuelve a listos y
+                                   compite por la CPU con el archivo bloqueado
+        """
+
+        # Indice plano por ruta + arbol de directorios (trie por componentes)
         self.archivos = {}
+        self.raiz = Directorio('')
+        self.directorios = {'/': self.raiz}
         for nombre in nombres_archivos:
-            self.archivos[nombre] = RecursoArchivo(nombre)
+            self._registrar_archivo(nombre)
+
+        # Archivos con actividad (bloqueados o con procesos esperando)
+        self.archivos_activos = set()
+        self.directorios_bloqueados = set()
 
         self.log_operaciones = []
         self.conflictos_totales = 0
         self.operaciones_exitosas = 0
         self.tiempo_actual = 0
 
+        # Dispositivo de disco opcional (sin disco el acceso es instantaneo)
+        self.disco = disco
+        self.bloques_por_archivo = bloques_por_archivo
+        self._inicios_bloques = []
+        self._nombres_por_inicio = []
+        if self.disco is not None:
+            self._asignar_bloques(bloques_por_archivo)
+
+        # Buffer cache opcional entre el gestor y el disco
+        self.cache = cache if self.disco is not None else None
+        self.archivos_escritura = {normalizar_ruta(nombre) for nombre in archivos_escritura or []}
+        self.io_desde_cache = []  # [(proceso, nombre_archivo)] servidas sin ir a disco
+
+        # Protocolo contra inversion de prioridad (None, HERENCIA o TECHO)
+        self.protocolo_prioridad = protocolo_prioridad.upper() if protocolo_prioridad else None
+        if self.protocolo_prioridad is not None and self.protocolo_prioridad not in PROTOCOLOS_PRIORIDAD:
+            raise ValueError(f"Protocolo de prioridad desconocido: {protocolo_prioridad}")
+        self.archivos_por_proceso = {}  # {id_proceso: set(nombres)}
+        self.inicio_espera = {}  # {id_proceso: tiempo en que entro a una cola de espera}
+        self.esperas_alta = Histograma()  # ticks esperando un archivo (procesos de alta prioridad)
+        self.elevaciones_prioridad = 0
+        self.ticks_seccion_critica = ticks_seccion_critica
+
+    def _registrar_archivo(self, ruta: str) -> RecursoArchivo:
+        """
+        Anade un archivo al indice y al arbol, creando los directorios intermedios
+
+        El indice usa la ruta normalizada: 'a.txt', '/a.txt' y 'a.txt/' son el mismo archivo.
+
+        Raises:
+            ValueError: Si la ruta esta vacia o choca con un directorio o archivo existente
+        """
+        ruta = normalizar_ruta(ruta)
+        if ruta in self.archivos:
+            return self.archivos[ruta]
+        partes = ruta.split('/')
+        directorio = self.raiz
+        for parte in partes[:-1]:
+            if parte in directorio.archivos:
+                raise ValueError(f"No se puede crear {ruta}: {parte} ya es un archivo")
+            if parte not in directorio.subdirectorios:
+                subdirectorio = Directorio(parte, directorio)
+                directorio.subdirectorios[parte] = subdirectorio
+                self.directorios[subdirectorio.ruta] = subdirectorio
+            directorio = directorio.subdirectorios[parte]
+
+        if partes[-1] in directorio.subdirectorios:
+            raise ValueError(f"No se puede crear {ruta}: ya es un directorio")
+
+        archivo = RecursoArchivo(ruta)
+        archivo.directorio = directorio
+        directorio.archivos[partes[-1]] = archivo
+        self.archivos[ruta] = archivo
+        return archivo
+
+    def registrar_archivos(self, nombres: list) -> list:
+        """
+        Da de alta archivos nuevos (p. ej. los que nombra una traza) y, con disco,
+        vuelve a repartir los bloques; debe llamarse antes de empezar la simulacion
+
+        Returns:
+            Nombres normalizados de los archivos creados
+        """
+        nuevos = []
+        for nombre in nombres:
+            try:
+                clave = normalizar_ruta(nombre)
+                if clave not in self.archivos:
+                    self._registrar_archivo(clave)
+                    nuevos.append(clave)
+            except ValueError as e:
+                self.log_operaciones.append(f"T{self.tiempo_actual}: ERROR - {e}")
+        if nuevos:
+            self.log_operaciones.append(
+                f"T{self.tiempo_actual}: ALTA - {len(nuevos)} archivos nuevos"
+            )
+            if self.disco is not None:
+                self._asignar_bloques(self.bloques_por_archivo)
+        return nuevos
+
+    def existe_archivo(self, nombre_archivo: str) -> bool:
+        """
+        Indica si el nombre (normalizado) corresponde a un archivo registrado
+        """
+        return self._clave(nombre_archivo) in self.archivos
+
+    def _clave(self, nombre_archivo: str) -> str:
+        """
+        Clave del indice para un nombre dado por un proceso (normaliza solo si hace falta)
+        """
+        if nombre_archivo in self.archivos:
+            return nombre_archivo
+        return '/'.join(parte for parte in nombre_archivo.split('/') if parte)
+
+    def buscar_directorio(self, ruta: str) -> Optional[Directorio]:
+        """
+        Busca un directorio por su ruta
+        """
+        partes = [parte for parte in ruta.split('/') if parte]
+        return self.directorios.get('/' + '/'.join(partes))
+
+    def listar_directorio(self, ruta: str) -> dict:
+        """
+        Lista el contenido inmediato de un directorio
+        """
+        directorio = self.buscar_directorio(ruta)
+        if directorio is None:
+            return {'directorios': [], 'archivos': []}
+        return {
+            'directorios': sorted(directorio.subdirectorios),
+            'archivos': sorted(directorio.archivos)
+        }
+
+    def _recorrer_directorio(self, directorio: Directorio):
+        """
+        Recorre en profundidad los archivos de un subarbol (generador)
+        """
+        pendientes = [directorio]
+        while pendientes:
+            actual = pendientes.pop()
+            for archivo in actual.archivos.values():
+                yield archivo.nombre
+            pendientes.extend(reversed(list(actual.subdirectorios.values())))
+
+    def _directorio_bloqueante(self, directorio: Directorio, proceso: Proceso) -> Optional[Directorio]:
+        """
+        Devuelve el primer ancestro bloqueado por otro proceso, si lo hay
+        """
+        for ancestro in directorio.ancestros():
+            if ancestro.bloqueado and ancestro.proceso_propietario != proceso.id:
+                return ancestro
+        return None
+
+    def bloquear_directorio(self, proceso: Proceso, ruta: str) -> bool:
+        """
+        Bloquea un directorio completo (y todo lo que contiene) para un proceso
+        """
+        directorio = self.buscar_directorio(ruta)
+        if directorio is None:
+            self.log_operaciones.append(
+                f"T{self.tiempo_actual}: ERROR - P{proceso.id} solicita directorio inexistente: {ruta}"
+            )
+            return False
+
+        if directorio.bloqueado and directorio.proceso_propietario == proceso.id:
+            return True
+
+        bloqueante = self._directorio_bloqueante(directorio, proceso)
+        otros = [id_proc for id_proc in directorio.en_uso if id_proc != proceso.id]
+        if bloqueante is not None or otros:
+            self.conflictos_totales += 1
+            ocupante = bloqueante.proceso_propietario if bloqueante is not None else otros[0]
+            self.log_operaciones.append(
+                f"T{self.tiempo_actual}: CONFLICTO - P{proceso.id} no puede bloquear {directorio.ruta} (en uso por P{ocupante})"
+            )
+            return False
+
+        directorio.bloqueado = True
+        directorio.proceso_propietario = proceso.id
+        if directorio.padre is not None:
+            directorio.padre.registrar_uso(proceso.id, 1)
+        self.directorios_bloqueados.add(directorio.ruta)
+        self.log_operaciones.append(
+            f"T{self.tiempo_actual}: OK - P{proceso.id} bloqueo el directorio {directorio.ruta}"
+        )
+        return True
+
+    def liberar_directorio(self, ruta: str, proceso: Proceso) -> list:
+        """
+        Libera un directorio y devuelve los procesos que esperaban por el
+        """
+        directorio = self.buscar_directorio(ruta)
+        if directorio is None or not directorio.bloqueado or directorio.proceso_propietario != proceso.id:
+            self.log_operaciones.append(
+                f"T{self.tiempo_actual}: ERROR - P{proceso.id} intenta liberar {ruta} sin ser propietario"
+            )
+            return []
+
+        directorio.bloqueado = False
+        directorio.proceso_propietario = None
+        if directorio.padre is not None:
+            directorio.padre.registrar_uso(proceso.id, -1)
+        self.directorios_bloqueados.discard(directorio.ruta)
+
+        # Los que esperaban reintentan en verificar_desbloqueos_pendientes
+        en_espera = list(directorio.cola_espera)
+        directorio.cola_espera.clear()
+        self.log_operaciones.append(
+            f"T{self.tiempo_actual}: P{proceso.id} libero el directorio {directorio.ruta}"
+        )
+        return en_espera
+
+    def _actualizar_actividad(self, archivo: RecursoArchivo):
+        """
+        Mantiene el conjunto de archivos con actividad
+        """
+        if archivo.bloqueado or archivo.cola_espera:
+            self.archivos_activos.add(archivo.nombre)
+        else:
+            self.archivos_activos.discard(archivo.nombre)
+
+    def _asignar_bloques(self, bloques_por_archivo: int):
+        """
+        Reparte los archivos en rangos de bloques a lo largo del disco
+        """
+        if not self.archivos:
+            return
+        if len(self.archivos) > self.disco.bloques_totales:
+            raise ValueError(
+                f"El disco ({self.disco.bloques_totales} bloques) no alcanza para {len(self.archivos)} archivos"
+            )
+        paso = max(1, self.disco.bloques_totales // len(self.archivos))
+        self._inicios_bloques = []
+        self._nombres_por_inicio = []
+        for i, archivo in enumerate(self.archivos.values()):
+            archivo.bloque_inicio = i * paso
+            archivo.num_bloques = max(1, min(bloques_por_archivo, paso))
+            self._inicios_bloques.append(archivo.bloque_inicio)
+            self._nombres_por_inicio.append(archivo.nombre)
+
+    def _archivo_de_bloque(self, bloque: int) -> str:
+        """
+        Obtiene el nombre del archivo al que pertenece un bloque
+        """
+        return self._nombres_por_inicio[bisect_right(self._inicios_bloques, bloque) - 1]
+
     def solicitar_acceso(self, proceso: Proceso, nombre_archivo: str) -> bool:
     
+        nombre_archivo = self._clave(nombre_archivo)
         if nombre_archivo not in self.archivos:
             self.log_operaciones.append(
                 f"T{self.tiempo_actual}: ERROR - P{proceso.id} solicita archivo inexistente: {nombre_archivo}"
@@ -31,11 +302,27 @@ class GestorArchivos:
 
         archivo = self.archivos[nombre_archivo]
 
+        if archivo.bloqueado and archivo.proceso_propietario == proceso.id:
+            return True  # Ya es el propietario
+
+        # Un directorio ancestro bloqueado por otro proceso impide el acceso
+        bloqueante = self._directorio_bloqueante(archivo.directorio, proceso)
+        if bloqueante is not None:
+            if proceso not in bloqueante.cola_espera:
+                bloqueante.cola_espera.append(proceso)
+                archivo.conflictos += 1
+                self.conflictos_totales += 1
+                self.inicio_espera.setdefault(proceso.id, self.tiempo_actual)
+                self.log_operaciones.append(
+                    f"T{self.tiempo_actual}: CONFLICTO - P{proceso.id} espera por {nombre_archivo} (directorio {bloqueante.ruta} bloqueado por P{bloqueante.proceso_propietario})"
+                )
+            return False
+
         if not archivo.bloqueado:
             # Archivo libre - asignar
-            archivo.bloqueado = True
-            archivo.proceso_propietario = proceso.id
-            archivo.veces_usado += 1
+            if proceso in archivo.cola_espera:
+                archivo.cola_espera.remove(proceso)
+            self._otorgar(archivo, proceso)
             self.operaciones_exitosas += 1
 
             self.log_operaciones.append(
@@ -48,16 +335,94 @@ class GestorArchivos:
                 archivo.cola_espera.append(proceso)
                 archivo.conflictos += 1
                 self.conflictos_totales += 1
+                self.inicio_espera.setdefault(proceso.id, self.tiempo_actual)
+                self.archivos_activos.add(nombre_archivo)
 
                 self.log_operaciones.append(
                     f"T{self.tiempo_actual}: CONFLICTO - P{proceso.id} espera por {nombre_archivo} (ocupado por P{archivo.proceso_propietario})"
                 )
+
+                if self.protocolo_prioridad == 'HERENCIA':
+                    self._heredar_prioridad(archivo, proceso)
             return False
 
+    def _otorgar(self, archivo: RecursoArchivo, proceso: Proceso):
+        """
+        Asigna la propiedad de un archivo a un proceso
+        """
+        archivo.bloqueado = True
+        archivo.proceso_propietario = proceso.id
+        archivo.propietario = proceso
+        archivo.veces_usado += 1
+        archivo.directorio.registrar_uso(proceso.id, 1)
+        self.archivos_por_proceso.setdefault(proceso.id, set()).add(archivo.nombre)
+        self.archivos_activos.add(archivo.nombre)
+
+        if proceso.id in self.inicio_espera:
+            espera = self.tiempo_actual - self.inicio_espera.pop(proceso.id)
+            if proceso.prioridad <= PRIORIDAD_ALTA:
+                self.esperas_alta.registrar(espera)
+
+        if self.protocolo_prioridad is not None:
+            self._recalcular_prioridad(proceso)
+
+    def _heredar_prioridad(self, archivo: RecursoArchivo, proceso_espera: Proceso):
+        """
+        Eleva la prioridad del propietario (y de la cadena de propietarios) a la del proceso que espera
+        """
+        prioridad = proceso_espera.prioridad_efectiva()
+        for _ in range(len(self.archivos)):
+            propietario = archivo.propietario
+            if propietario is None or propietario.prioridad_efectiva() <= prioridad:
+                return
+
+            propietario.prioridad_heredada = prioridad
+            self.elevaciones_prioridad += 1
+            self.log_operaciones.append(
+                f"T{self.tiempo_actual}: HERENCIA - P{propietario.id} hereda prioridad {prioridad} por {archivo.nombre}"
+            )
+
+            # Propagar si el propietario a su vez espera otro archivo
+            siguiente = propietario.archivo_actual and self._clave(propietario.archivo_actual)
+            if siguiente not in self.archivos or self.archivos[siguiente] is archivo:
+                return
+            archivo = self.archivos[siguiente]
+
+    def _recalcular_prioridad(self, proceso: Proceso):
+        """
+        Recalcula la prioridad heredada segun los archivos que el proceso aun posee
+        """
+        prioridad = proceso.prioridad
+        for nombre in self.archivos_por_proceso.get(proceso.id, ()):
+            archivo = self.archivos[nombre]
+            if self.protocolo_prioridad == 'TECHO' and archivo.techo_prioridad is not None:
+                prioridad = min(prioridad, archivo.techo_prioridad)
+            elif self.protocolo_prioridad == 'HERENCIA':
+                for p in archivo.cola_espera:
+                    prioridad = min(prioridad, p.prioridad_efectiva())
+
+        anterior = proceso.prioridad_efectiva()
+        proceso.prioridad_heredada = prioridad if prioridad < proceso.prioridad else None
+        if proceso.prioridad_efectiva() < anterior:
+            self.elevaciones_prioridad += 1
+
+    def calcular_techos(self, procesos: list):
+        """
+        Calcula el techo de prioridad de cada archivo (la mayor prioridad de quienes lo usan)
+        """
+        for proceso in procesos:
+            for nombre in proceso.archivos_necesarios:
+                nombre = self._clave(nombre)
+                if nombre in self.archivos:
+                    archivo = self.archivos[nombre]
+                    if archivo.techo_prioridad is None or proceso.prioridad < archivo.techo_prioridad:
+                        archivo.techo_prioridad = proceso.prioridad
+
     def liberar_archivo(self, nombre_archivo: str, proceso: Proceso) -> Optional[Proceso]:
         """
         Libera un archivo y lo asigna al siguiente en cola
         """
+        nombre_archivo = self._clave(nombre_archivo)
         if nombre_archivo not in self.archivos:
             return None
 
@@ -77,13 +442,16 @@ class GestorArchivos:
         # Liberar el archivo
         archivo.bloqueado = False
         archivo.proceso_propietario = None
+        archivo.propietario = None
+        archivo.directorio.registrar_uso(proceso.id, -1)
+        self.archivos_por_proceso.get(proceso.id, set()).discard(nombre_archivo)
+        if self.protocolo_prioridad is not None:
+            self._recalcular_prioridad(proceso)
 
         # Asignar al siguiente en cola
         if archivo.cola_espera:
             siguiente_proceso = archivo.cola_espera.popleft()
-            archivo.bloqueado = True
-            archivo.proceso_propietario = siguiente_proceso.id
-            archivo.veces_usado += 1
+            self._otorgar(archivo, siguiente_proceso)
 
             self.log_operaciones.append(
                 f"T{self.tiempo_actual}: -> {nombre_archivo} asignado a P{siguiente_proceso.id} (de cola de espera)"
@@ -91,12 +459,175 @@ class GestorArchivos:
 
             return siguiente_proceso
 
+        self._actualizar_actividad(archivo)
         return None
 
+    def iniciar_io(self, proceso: Proceso, nombre_archivo: str) -> bool:
+        """
+        Envia al disco la peticion de I/O de un proceso que ya tiene el archivo
+        """
+        nombre_archivo = self._clave(nombre_archivo)
+        if self.disco is None or nombre_archivo not in self.archivos:
+            return False
+
+        archivo = self.archivos[nombre_archivo]
+        bloques = range(archivo.bloque_inicio, archivo.bloque_inicio + archivo.num_bloques)
+        escritura = nombre_archivo in self.archivos_escritura
+
+        if self.cache is not None:
+            if escritura:
+                # Write-back: la escritura queda en cache y se marca sucia
+                self._escribir_bloques(self.cache.escribir(bloques))
+                self.io_desde_cache.append((proceso, nombre_archivo))
+                self.log_operaciones.append(
+                    f"T{self.tiempo_actual}: CACHE - P{proceso.id} escribe {nombre_archivo} en cache"
+                )
+                return True
+            if self.cache.leer(bloques):
+                self.io_desde_cache.append((proceso, nombre_archivo))
+                self.log_operaciones.append(
+                    f"T{self.tiempo_actual}: CACHE - P{proceso.id} lee {nombre_archivo} desde cache"
+                )
+                return True
+
+        solicitud = SolicitudIO(proceso, nombre_archivo, archivo.bloque_inicio,
+                                archivo.num_bloques, self.tiempo_actual, escritura=escritura)
+        self.disco.encolar(solicitud)
+
+        tipo = "escritura" if escritura else "lectura"
+        self.log_operaciones.append(
+            f"T{self.tiempo_actual}: IO - P{proceso.id} encola {tipo} de {nombre_archivo} (bloques {bloques.start}-{bloques.stop - 1})"
+        )
+        return True
+
+    def _escribir_bloques(self, bloques: list):
+        """
+        Envia al disco bloques sucios agrupados en rangos contiguos por archivo
+        """
+        inicio = None
+        anterior = None
+        for bloque in sorted(bloques) + [None]:
+            if inicio is not None and (bloque is None or bloque != anterior + 1
+                                       or self._archivo_de_bloque(bloque) != self._archivo_de_bloque(inicio)):
+                self.disco.encolar(SolicitudIO(None, self._archivo_de_bloque(inicio), inicio,
+                                               anterior - inicio + 1, self.tiempo_actual, escritura=True))
+                inicio = None
+            if bloque is not None:
+                if inicio is None:
+                    inicio = bloque
+                anterior = bloque
+
+    def avanzar_io(self, planificador) -> list:
+        """
+        Avanza el disco un tick y devuelve a listos los procesos cuya I/O termino
+        """
+        if self.disco is None:
+            return []
+
+        # Flusher periodico de la cache
+        if self.cache is not None and self.cache.debe_flush(self.tiempo_actual):
+            bloques = self.cache.flush()
+            self._escribir_bloques(bloques)
+            self.log_operaciones.append(
+                f"T{self.tiempo_actual}: CACHE - flush de {len(bloques)} bloques sucios"
+            )
+
+        # Peticiones servidas desde cache (sin coste de disco)
+        completadas = self.io_desde_cache
+        self.io_desde_cache = []
+
+        for solicitud in self.disco.avanzar(self.tiempo_actual):
+            if solicitud.proceso is None:
+                continue  # escritura diferida de la cache
+            if self.cache is not None and not solicitud.escritura:
+                bloques = range(solicitud.bloque_inicio, solicitud.bloque_inicio + solicitud.num_bloques)
+                for bloque in bloques:
+                    self._escribir_bloques(self.cache.insertar(bloque))
+            self.log_operaciones.append(
+                f"T{self.tiempo_actual}: IO - P{solicitud.proceso.id} completo {solicitud.nombre_archivo} (latencia {solicitud.tiempo_fin - solicitud.tiempo_llegada})"
+            )
+            completadas.append((solicitud.proceso, solicitud.nombre_archivo))
+
+        procesos_completados = []
+        for proceso, nombre_archivo in completadas:
+            proceso.realizar_io()
+            proceso.tiempo_io_restante = 0
+
+            if self.ticks_seccion_critica > 0:
+                # Vuelve a listos con el archivo bloqueado hasta cumplir su seccion critica
+                proceso.archivo_retenido = nombre_archivo
+                proceso.ticks_seccion_critica = self.ticks_seccion_critica
+                planificador.desbloquear_proceso(proceso)
+                procesos_completados.append(proceso)
+                continue
+
+            siguiente = self.liberar_archivo(nombre_archivo, proceso)
+            planificador.desbloquear_proceso(proceso)
+            procesos_completados.append(proceso)
+
+            if siguiente is not None:
+                self._entregar_a_siguiente(siguiente, nombre_archivo, planificador)
+
+        return procesos_completados
+
+    def avanzar_seccion_critica(self, proceso: Proceso, planificador=None) -> Optional[Proceso]:
+        """
+        Descuenta un tick de CPU de la seccion critica de un proceso y, al
+        completarla, libera el archivo retenido
+
+        Returns:
+            Proceso que recibio el archivo desde la cola de espera, si lo hay
+        """
+        nombre_archivo = proceso.archivo_retenido
+        proceso.ticks_seccion_critica -= 1
+        if nombre_archivo is None or proceso.ticks_seccion_critica > 0:
+            return None
+
+        proceso.archivo_retenido = None
+        siguiente = self.liberar_archivo(nombre_archivo, proceso)
+        if siguiente is not None:
+            self._entregar_a_siguiente(siguiente, nombre_archivo, planificador)
+        return siguiente
+
+    def _entregar_a_siguiente(self, siguiente: Proceso, nombre_archivo: str, planificador):
+        """
+        Continua al proceso que recibio un archivo desde la cola de espera
+        """
+        siguiente.archivo_actual = None
+        if self.disco is not None:
+            # Ya es propietario: pasa directo a esperar al disco
+            self.iniciar_io(siguiente, nombre_archivo)
+        elif planificador is not None:
+            planificador.desbloquear_proceso(siguiente)
+
+    def liberar_archivos_proceso(self, proceso: Proceso, planificador=None) -> list:
+        """
+        Libera todos los archivos y directorios de un proceso (por ejemplo al terminar)
+
+        Returns:
+            Procesos que recibieron alguno de los archivos liberados
+        """
+        self.inicio_espera.pop(proceso.id, None)
+        proceso.archivo_retenido = None
+        siguientes = []
+        for nombre_archivo in sorted(self.archivos_por_proceso.get(proceso.id, ())):
+            siguiente = self.liberar_archivo(nombre_archivo, proceso)
+            if siguiente is not None:
+                self._entregar_a_siguiente(siguiente, nombre_archivo, planificador)
+                siguientes.append(siguiente)
+        self.archivos_por_proceso.pop(proceso.id, None)
+
+        # Los que esperaban un directorio reintentan en verificar_desbloqueos_pendientes
+        for ruta in sorted(self.directorios_bloqueados):
+            if self.directorios[ruta].proceso_propietario == proceso.id:
+                self.liberar_directorio(ruta, proceso)
+        return siguientes
+
     def esta_disponible(self, nombre_archivo: str) -> bool:
         """
         Verifica si un archivo esta disponible
         """
+        nombre_archivo = self._clave(nombre_archivo)
         if nombre_archivo not in self.archivos:
             return False
         return not self.archivos[nombre_archivo].bloqueado
@@ -105,6 +636,7 @@ class GestorArchivos:
         """
         Obtiene el ID del proceso propietario de un archivo
         """
+        nombre_archivo = self._clave(nombre_archivo)
         if nombre_archivo not in self.archivos:
             return None
 
@@ -120,15 +652,49 @@ class GestorArchivos:
             f"T{self.tiempo_actual}: {tipo} - P{proceso.id} en {nombre_archivo} - {estado}"
         )
 
-    def visualizar_estado(self) -> str:
+    def visualizar_estado(self, solo_activos: bool = False, directorio: Optional[str] = None,
+                          pagina: int = 0, tam_pagina: Optional[int] = None) -> str:
         """
         Genera una visualizacion del estado de los archivos
+
+        Args:
+            solo_activos: Mostrar solo archivos bloqueados o con procesos esperando
+            directorio: Limitar la vista al subarbol de este directorio
+            pagina: Pagina a mostrar (empezando en 0)
+            tam_pagina: Archivos por pagina (None = todos)
         """
         resultado = "\n" + "="*80 + "\n"
         resultado += "ESTADO ACTUAL DE LOS ARCHIVOS\n"
         resultado += "="*80 + "\n\n"
 
-        for nombre, archivo in self.archivos.items():
+        # Seleccionar los archivos a mostrar sin recorrer todo el espacio de nombres
+        prefijo = None
+        if directorio is not None:
+            raiz_vista = self.buscar_directorio(directorio)
+            prefijo = '' if raiz_vista is self.raiz else (raiz_vista.ruta.lstrip('/') + '/' if raiz_vista else None)
+        if directorio is not None and raiz_vista is None:
+            nombres = iter(())
+            total = 0
+        elif solo_activos:
+            nombres = sorted(n for n in self.archivos_activos
+                             if prefijo is None or n.lstrip('/').startswith(prefijo))
+            total = len(nombres)
+        elif directorio is not None:
+            nombres = self._recorrer_directorio(raiz_vista) if raiz_vista is not None else iter(())
+            total = None
+        else:
+            nombres = iter(self.archivos)
+            total = len(self.archivos)
+
+        if tam_pagina is not None:
+            inicio = pagina * tam_pagina
+            nombres = islice(nombres, inicio, inicio + tam_pagina)
+            total_texto = f" de {total}" if total is not None else ""
+            resultado += f"Pagina {pagina + 1} - archivos desde el {inicio + 1}{total_texto}"
+            resultado += " (solo con actividad)\n\n" if solo_activos else "\n\n"
+
+        for nombre in nombres:
+            archivo = self.archivos[nombre]
             resultado += f"[ARCHIVO] {nombre}\n"
             resultado += "-" * 80 + "\n"
 
@@ -157,11 +723,12 @@ class GestorArchivos:
         resultado += f"  Conflictos totales:       {self.conflictos_totales}\n"
         resultado += f"  Operaciones exitosas:     {self.operaciones_exitosas}\n"
 
-        archivos_bloqueados = sum(1 for a in self.archivos.values() if a.bloqueado)
-        procesos_esperando_total = sum(len(a.cola_espera) for a in self.archivos.values())
+        archivos_bloqueados, procesos_esperando_total = self._contar_actividad()
 
         resultado += f"  Archivos bloqueados:      {archivos_bloqueados}/{len(self.archivos)}\n"
         resultado += f"  Procesos esperando total: {procesos_esperando_total}\n"
+        if len(self.directorios) > 1:
+            resultado += f"  Directorios bloqueados:   {len(self.directorios_bloqueados)}/{len(self.directorios)}\n"
         resultado += "=" * 80 + "\n"
 
         # Últimas 10 operaciones
@@ -175,22 +742,51 @@ class GestorArchivos:
 
         return resultado
 
+    def _contar_actividad(self) -> tuple:
+        """
+        Cuenta archivos bloqueados y procesos esperando recorriendo solo los archivos activos
+        """
+        archivos_bloqueados = 0
+        procesos_esperando = 0
+        for nombre in self.archivos_activos:
+            archivo = self.archivos[nombre]
+            if archivo.bloqueado:
+                archivos_bloqueados += 1
+            procesos_esperando += len(archivo.cola_espera)
+        for ruta in self.directorios_bloqueados:
+            procesos_esperando += len(self.directorios[ruta].cola_espera)
+        return archivos_bloqueados, procesos_esperando
+
     def obtener_estadisticas(self) -> dict:
         """
         Obtiene estadisticas del sistema de archivos
         """
-        archivos_bloqueados = sum(1 for a in self.archivos.values() if a.bloqueado)
-        procesos_esperando = sum(len(a.cola_espera) for a in self.archivos.values())
+        archivos_bloqueados, procesos_esperando = self._contar_actividad()
 
-        return {
+        estadisticas = {
             'archivos_totales': len(self.archivos),
             'archivos_bloqueados': archivos_bloqueados,
             'archivos_libres': len(self.archivos) - archivos_bloqueados,
             'conflictos_totales': self.conflictos_totales,
             'operaciones_exitosas': self.operaciones_exitosas,
-            'procesos_esperando': procesos_esperando
+            'procesos_esperando': procesos_esperando,
+            'directorios_totales': len(self.directorios),
+            'directorios_bloqueados': len(self.directorios_bloqueados)
         }
 
+        if self.disco is not None:
+            estadisticas['disco'] = self.disco.obtener_estadisticas()
+        if self.cache is not None:
+            estadisticas['cache'] = self.cache.obtener_estadisticas()
+
+        estadisticas['protocolo_prioridad'] = self.protocolo_prioridad or 'NINGUNO'
+        estadisticas['elevaciones_prioridad'] = self.elevaciones_prioridad
+        estadisticas['espera_alta_p50'] = self.esperas_alta.percentil(50)
+        estadisticas['espera_alta_p90'] = self.esperas_alta.percentil(90)
+        estadisticas['espera_alta_p99'] = self.esperas_alta.percentil(99)
+
+        return estadisticas
+
     def obtener_log_completo(self) -> str:
         """
         Obtiene el log completo de operaciones
@@ -216,7 +812,7 @@ class GestorArchivos:
         procesos_desbloqueados = []
 
         for proceso in list(planificador.cola_bloqueados):
-            archivo_necesario = proceso.archivo_actual
+            archivo_necesario = proceso.archivo_actual and self._clave(proceso.archivo_actual)
 
             if archivo_necesario and archivo_necesario in self.archivos:
                 archivo = self.archivos[archivo_necesario]
@@ -225,6 +821,10 @@ class GestorArchivos:
                 if not archivo.bloqueado:
                     if self.solicitar_acceso(proceso, archivo_necesario):
                         proceso.archivo_actual = None
+                        if self.disco is not None:
+                            # Con disco sigue bloqueado hasta que termine la I/O
+                            self.iniciar_io(proceso, archivo_necesario)
+                            continue
                         planificador.desbloquear_proceso(proceso)
                         procesos_desbloqueados.append(proceso)
 
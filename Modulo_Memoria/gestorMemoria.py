@@ -1,4 +1,7 @@
+from array import array
 from typing import Optional
+import math
+import random
 import sys
 import os
 
@@ -6,6 +9,13 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from Modulo_Procesos.proceso import Proceso
 from Modulo_Memoria.memoria import Pagina
+from Modulo_Memoria.referencias import MODELOS_REFERENCIAS, generar_referencias
+
+
+# Numeros aleatorios de 32 bits que se sacan de una vez para los accesos a memoria
+TAM_LOTE_ACCESOS = 1024
+# Accesos (ticks de CPU) con los que se estima el conjunto de trabajo de un proceso
+VENTANA_CONJUNTO = 16
 
 
 class GestorMemoria:
@@ -13,19 +23,40 @@ class GestorMemoria:
     Memory Management Unit (MMU) - Gestiona la memoria virtual y fisica
     """
 
-    def __init__(self, marcos_totales: int = 6, algoritmo_reemplazo: str = 'FIFO'):
+    def __init__(self, marcos_totales: int = 6, algoritmo_reemplazo: str = 'FIFO',
+                 semilla: Optional[int] = None, modelo_referencias='UNIFORME'):
         """
         Inicializa el gestor de memoria
+
+        Args:
+            modelo_referencias: Uno de MODELOS_REFERENCIAS o una funcion generadora
+                                (ver generar_referencias). 'UNIFORME' elige cada
+                                acceso al azar del lote de numeros aleatorios; los
+                                demas precalculan la cadena de cada proceso
         """
+        if not callable(modelo_referencias):
+            modelo_referencias = modelo_referencias.upper()
+            if modelo_referencias not in MODELOS_REFERENCIAS:
+                raise ValueError(f"Modelo de referencias desconocido: {modelo_referencias}")
         self.marcos_totales = marcos_totales
         self.marcos = [None] * marcos_totales  # None = marco libre
         self.tabla_paginas = {}  # {id_proceso: [Pagina, Pagina, ...]}
+        self.paginas_por_id = {}  # {id_pagina: Pagina} indice para resolver marcos
         self.algoritmo_reemplazo = algoritmo_reemplazo.upper()
         self.fallos_pagina = 0
         self.reemplazos = 0
+        self.accesos = 0
         self.tiempo_actual = 0
         self.siguiente_id_pagina = 0
         self.log_operaciones = []
+        self.marcos_liberados = 0
+        self.procesos_liberados = 0
+        # Generador propio: su estado viaja con el gestor en checkpoints y repeticiones
+        self.rng = random.Random(semilla)
+        self.lote_accesos = array('I')
+        self.posicion_lote = 0
+        self.modelo_referencias = modelo_referencias
+        self.referencias = {}  # {id_proceso: array de indices de pagina por tick de CPU}
 
     def asignar_memoria(self, proceso: Proceso) -> bool:
         """
@@ -40,9 +71,11 @@ class GestorMemoria:
             pagina = Pagina(self.siguiente_id_pagina, proceso.id)
             self.siguiente_id_pagina += 1
             paginas.append(pagina)
+            self.paginas_por_id[pagina.id_pagina] = pagina
 
         self.tabla_paginas[proceso.id] = paginas
         proceso.paginas_asignadas = [p.id_pagina for p in paginas]
+        self.referencias_de(proceso)
 
         # Cargar al menos una pagina inicial
         self.cargar_pagina(paginas[0])
@@ -105,17 +138,15 @@ class GestorMemoria:
         tiempo_min = float('inf')
         marco_victima = None
 
+        paginas_por_id = self.paginas_por_id
         for marco_idx, pagina_id in enumerate(self.marcos):
             if pagina_id is not None:
-                # Buscar esta pagina en todas las tablas
-                for paginas in self.tabla_paginas.values():
-                    for pagina in paginas:
-                        if pagina.id_pagina == pagina_id:
-                            if pagina.tiempo_carga < tiempo_min:
-                                tiempo_min = pagina.tiempo_carga
-                                pagina_victima = pagina
-                                marco_victima = marco_idx
-                            break
+                # Resolver la pagina del marco por el indice (sin recorrer las tablas)
+                pagina = paginas_por_id.get(pagina_id)
+                if pagina is not None and pagina.tiempo_carga < tiempo_min:
+                    tiempo_min = pagina.tiempo_carga
+                    pagina_victima = pagina
+                    marco_victima = marco_idx
 
         if pagina_victima:
             # Reemplazar
@@ -151,17 +182,15 @@ class GestorMemoria:
         tiempo_min = float('inf')
         marco_victima = None
 
+        paginas_por_id = self.paginas_por_id
         for marco_idx, pagina_id in enumerate(self.marcos):
             if pagina_id is not None:
-                # Buscar esta pagina en todas las tablas
-                for paginas in self.tabla_paginas.values():
-                    for pagina in paginas:
-                        if pagina.id_pagina == pagina_id:
-                            if pagina.ultimo_acceso < tiempo_min:
-                                tiempo_min = pagina.ultimo_acceso
-                                pagina_victima = pagina
-                                marco_victima = marco_idx
-                            break
+                # Resolver la pagina del marco por el indice (sin recorrer las tablas)
+                pagina = paginas_por_id.get(pagina_id)
+                if pagina is not None and pagina.ultimo_acceso < tiempo_min:
+                    tiempo_min = pagina.ultimo_acceso
+                    pagina_victima = pagina
+                    marco_victima = marco_idx
 
         if pagina_victima:
             # Reemplazar
@@ -195,16 +224,67 @@ class GestorMemoria:
         if proceso.id not in self.tabla_paginas:
             return
 
-        # Acceder a una pagina aleatoria del proceso
         paginas = self.tabla_paginas[proceso.id]
         if paginas:
-            import random
-            pagina = random.choice(paginas)
+            self.accesos += 1
+            referencias = self.referencias.get(proceso.id)
+            if referencias is None:
+                # Pagina al azar: (x * n) >> 32 lleva un entero de 32 bits al rango [0, n)
+                pagina = paginas[(self.siguiente_aleatorio() * len(paginas)) >> 32]
+            else:
+                # Referencia precalculada del tick de CPU en curso
+                tick = proceso.duracion_total - proceso.tiempo_restante - 1
+                pagina = paginas[referencias[tick % len(referencias)]]
             if not pagina.cargada:
                 self.cargar_pagina(pagina)
             else:
                 pagina.ultimo_acceso = self.tiempo_actual
 
+    def referencias_de(self, proceso: Proceso):
+        """
+        Cadena de referencias del proceso, generada la primera vez que se pide
+        (None con el modelo 'UNIFORME', que no precalcula)
+        """
+        if self.modelo_referencias == 'UNIFORME':
+            return None
+        referencias = self.referencias.get(proceso.id)
+        if referencias is None:
+            referencias = generar_referencias(self.modelo_referencias, proceso.memoria_requerida,
+                                              proceso.duracion_total, self.rng)
+            self.referencias[proceso.id] = referencias
+        return referencias
+
+    def estimar_conjunto(self, proceso: Proceso) -> int:
+        """
+        Marcos que el proceso necesita para no fallar seguido: paginas distintas
+        de sus primeros VENTANA_CONJUNTO accesos (con accesos uniformes, su
+        valor esperado)
+        """
+        paginas = max(1, proceso.memoria_requerida)
+        referencias = self.referencias_de(proceso)
+        if referencias is None:
+            esperadas = paginas * (1 - (1 - 1 / paginas) ** min(VENTANA_CONJUNTO, proceso.duracion_total))
+            return max(1, min(paginas, math.ceil(esperadas)))
+        return len(set(referencias[:VENTANA_CONJUNTO]))
+
+    def siguiente_aleatorio(self) -> int:
+        """
+        Siguiente entero aleatorio de 32 bits del lote de accesos
+
+        El lote se rellena con una sola llamada a getrandbits, que entrega las
+        mismas salidas consecutivas del generador que TAM_LOTE_ACCESOS llamadas
+        a getrandbits(32).
+        """
+        if self.posicion_lote >= len(self.lote_accesos):
+            bits = self.rng.getrandbits(32 * TAM_LOTE_ACCESOS)
+            self.lote_accesos = array('I', bits.to_bytes(4 * TAM_LOTE_ACCESOS, 'little'))
+            if sys.byteorder == 'big':
+                self.lote_accesos.byteswap()
+            self.posicion_lote = 0
+        valor = self.lote_accesos[self.posicion_lote]
+        self.posicion_lote += 1
+        return valor
+
     def liberar_memoria(self, proceso: Proceso):
         """
         Libera la memoria ocupada por un proceso
@@ -213,12 +293,20 @@ class GestorMemoria:
             return
 
         paginas = self.tabla_paginas[proceso.id]
+        marcos = 0
         for pagina in paginas:
             if pagina.cargada and pagina.marco_asignado is not None:
                 self.marcos[pagina.marco_asignado] = None
+                pagina.cargada = False
+                pagina.marco_asignado = None
+                marcos += 1
+            self.paginas_por_id.pop(pagina.id_pagina, None)
 
         del self.tabla_paginas[proceso.id]
-        self.log_operaciones.append(f"T{self.tiempo_actual}: Liberada memoria de P{proceso.id}")
+        self.referencias.pop(proceso.id, None)
+        self.marcos_liberados += marcos
+        self.procesos_liberados += 1
+        self.log_operaciones.append(f"T{self.tiempo_actual}: Liberada memoria de P{proceso.id} ({marcos} marcos)")
 
     def visualizar_estado(self) -> str:
         """
@@ -234,14 +322,8 @@ class GestorMemoria:
                 if self.marcos[j] is None:
                     resultado += "[LIBRE] "
                 else:
-                    # Buscar a que proceso pertenece
                     pagina_id = self.marcos[j]
-                    proceso_id = None
-                    for id_proc, paginas in self.tabla_paginas.items():
-                        for pag in paginas:
-                            if pag.id_pagina == pagina_id:
-                                proceso_id = id_proc
-                                break
+                    proceso_id = self.propietario_marco(j)
                     resultado += f"[P{proceso_id}] " if proceso_id is not None else f"[?{pagina_id}] "
             resultado += " " * (75 - len(resultado.split('\n')[-1])) + "|\n"
 
@@ -250,6 +332,16 @@ class GestorMemoria:
 
         return resultado
 
+    def propietario_marco(self, marco: int) -> Optional[int]:
+        """
+        Obtiene el ID del proceso cuya pagina ocupa un marco (None si esta libre)
+        """
+        pagina_id = self.marcos[marco]
+        if pagina_id is None:
+            return None
+        pagina = self.paginas_por_id.get(pagina_id)
+        return pagina.id_proceso if pagina is not None else None
+
     def hay_marco_libre(self) -> bool:
         """
         Verifica si hay marcos libres
@@ -268,5 +360,9 @@ class GestorMemoria:
             'marcos_libres': self.marcos_totales - marcos_ocupados,
             'fallos_pagina': self.fallos_pagina,
             'reemplazos': self.reemplazos,
-            'algoritmo': self.algoritmo_reemplazo
+            'accesos': self.accesos,
+            'tasa_fallos': round(100 * self.fallos_pagina / self.accesos, 2) if self.accesos else 0,
+            'marcos_liberados': self.marcos_liberados,
+            'algoritmo': self.algoritmo_reemplazo,
+            'modelo_referencias': getattr(self.modelo_referencias, '__name__', self.modelo_referencias)
         }
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Modulo de Memoria - Modelos de referencias a memoria
+Cadenas de referencias con localidad (fases de conjunto de trabajo, recorrido
+secuencial, bucle sobre paginas calientes, Zipf) precalculadas por proceso en
+arreglos compactos, para que el ciclo de simulacion solo tenga que indexarlas
+"""
+
+from array import array
+import itertools
+
+
+MODELOS_REFERENCIAS = ('UNIFORME', 'FASES', 'SECUENCIAL', 'BUCLE', 'ZIPF')
+
+# Referencias precalculadas como maximo por proceso (las siguientes repiten la cadena)
+LARGO_MAXIMO = 4096
+# Fraccion de las paginas del proceso que forma el conjunto de trabajo o el bucle
+FRACCION_CONJUNTO = 0.25
+# Duracion media de cada fase del conjunto de trabajo, en ticks de CPU
+LARGO_FASE = 25
+# Probabilidad de que un acceso del bucle vaya a una pagina fuera de el
+PROB_FUERA_BUCLE = 0.1
+# Exponente de Zipf de la popularidad de las paginas
+SESGO_ZIPF = 1.0
+
+
+def generar_referencias(modelo, paginas: int, largo: int, rng) -> array:
+    """
+    Cadena de referencias de un proceso
+
+    Args:
+        modelo: Uno de MODELOS_REFERENCIAS, o una funcion (paginas, largo, rng) ->
+                secuencia de indices (debe ser de nivel de modulo para poder
+                guardar checkpoints)
+        paginas: Paginas del proceso
+        largo: Ticks de CPU del proceso (se recorta a LARGO_MAXIMO)
+        rng: random.Random del gestor de memoria
+
+    Returns:
+        array con un indice de pagina (0..paginas-1) por tick de CPU
+    """
+    largo = max(1, min(largo, LARGO_MAXIMO))
+    tipo = 'H' if paginas <= 0xFFFF else 'I'
+    if callable(modelo):
+        return array(tipo, modelo(paginas, largo, rng))
+
+    conjunto = max(1, round(paginas * FRACCION_CONJUNTO))
+    if modelo == 'UNIFORME':
+        valores = [rng.randrange(paginas) for _ in range(largo)]
+    elif modelo == 'SECUENCIAL':
+        valores = [i % paginas for i in range(largo)]
+    elif modelo == 'BUCLE':
+        # Recorre en orden un tramo contiguo de paginas calientes, con saltos ocasionales
+        inicio = rng.randrange(paginas - conjunto + 1)
+        valores = []
+        paso = 0
+        for _ in range(largo):
+            if rng.random() < PROB_FUERA_BUCLE:
+                valores.append(rng.randrange(paginas))
+            else:
+                valores.append(inicio + paso % conjunto)
+                paso += 1
+    elif modelo == 'FASES':
+        # Cada fase accede al azar dentro de un conjunto de trabajo contiguo distinto
+        valores = []
+        while len(valores) < largo:
+            base = rng.randrange(paginas - conjunto + 1)
+            duracion = 1 + int(rng.expovariate(1 / LARGO_FASE))
+            valores.extend(base + rng.randrange(conjunto) for _ in range(duracion))
+        del valores[largo:]
+    elif modelo == 'ZIPF':
+        # La pagina k-esima mas popular (en un orden al azar) tiene peso 1 / k^s
+        orden = list(range(paginas))
+        rng.shuffle(orden)
+        pesos = list(itertools.accumulate(1 / (k ** SESGO_ZIPF) for k in range(1, paginas + 1)))
+        valores = rng.choices(orden, cum_weights=pesos, k=largo)
+    else:
+        raise ValueError(f"Modelo de referencias desconocido: {modelo}")
+    return array(tipo, valores)
@@ -3,5 +3,7 @@ Módulo de Procesos
 """
 from .proceso import Proceso
 from .planificador import Planificador
+from .cargaTrabajo import GeneradorCarga
+from .lectorTrazas import LectorTraza
 
-__all__ = ['Proceso', 'Planificador']
+__all__ = ['Proceso', 'Planificador', 'GeneradorCarga', 'LectorTraza']
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+Modulo de Procesos - Clase GeneradorCarga
+Cargas de trabajo sinteticas: llegadas Poisson o en rafagas, demandas de CPU
+de cola pesada, tamanos de memoria y afinidad a archivos con sesgo Zipf.
+Los procesos se generan de a uno y en orden de llegada
+"""
+
+import itertools
+import math
+import random
+from typing import List, Optional
+import sys
+import os
+
+# Anadir el directorio padre al path para importar modulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Modulo_Procesos.proceso import Proceso
+from Modulo_Procesos.semillas import derivar_semilla
+
+
+class GeneradorCarga:
+    """
+    Iterador de procesos sinteticos ordenados por tiempo de llegada
+
+    Es un objeto (y no una funcion generadora) para poder serializarse junto
+    con el motor en los checkpoints y continuar la misma secuencia al restaurar.
+    """
+
+    def __init__(self, total: Optional[int] = None, llegadas: str = 'POISSON',
+                 tasa_llegada: float = 0.5, intensidad_rafaga: float = 8.0, largo_rafaga: float = 20,
+                 duracion: str = 'PARETO', duracion_media: float = 8, duracion_maxima: Optional[int] = None,
+                 memoria: str = 'UNIFORME', memoria_min: int = 1, memoria_max: int = 4,
+                 archivos: Optional[List[str]] = None, max_archivos: int = 2, sesgo_zipf: float = 1.2,
+                 prioridad_min: int = 1, prioridad_max: int = 5,
+                 primer_id: int = 1, inicio: int = 0, semilla: Optional[int] = None):
+        """
+        Inicializa el generador
+
+        Args:
+            total: Procesos a generar (None = sin limite)
+            llegadas: 'POISSON', 'RAFAGAS' o 'UNIFORME'
+            tasa_llegada: Llegadas medias por tick
+            intensidad_rafaga: En 'RAFAGAS', la tasa se multiplica (rafaga) o divide
+                               (calma) por este factor
+            largo_rafaga: Llegadas medias antes de cambiar entre rafaga y calma
+            duracion: 'PARETO', 'LOGNORMAL', 'EXPONENCIAL' o 'UNIFORME'
+            duracion_media: Demanda media de CPU en ticks
+            duracion_maxima: Tope opcional de la demanda de CPU
+            memoria: 'UNIFORME' o 'GEOMETRICA' (mas procesos pequenos)
+            memoria_min: Paginas minimas por proceso
+            memoria_max: Paginas maximas por proceso
+            archivos: Archivos posibles, del mas al menos popular
+            max_archivos: Archivos maximos por proceso
+            sesgo_zipf: Exponente de Zipf de la popularidad de archivos (0 = uniforme)
+            prioridad_min: Prioridad mas alta posible
+            prioridad_max: Prioridad mas baja posible
+            primer_id: Id del primer proceso
+            inicio: Tiempo de partida de las llegadas
+            semilla: Semilla de la carga; los archivos de cada proceso salen de
+                     un generador aparte, asi cambiar archivos o max_archivos no
+                     altera llegadas, duraciones ni memoria
+        """
+        self.total = total
+        self.llegadas = llegadas.upper()
+        self.tasa_llegada = tasa_llegada
+        self.intensidad_rafaga = intensidad_rafaga
+        self.largo_rafaga = largo_rafaga
+        self.duracion = duracion.upper()
+        self.duracion_media = duracion_media
+        self.duracion_maxima = duracion_maxima
+        self.memoria = memoria.upper()
+        self.memoria_min = memoria_min
+        self.memoria_max = memoria_max
+        self.archivos = list(archivos) if archivos is not None else ['config.txt', 'data.db', 'log.txt', 'temp.txt']
+        self.max_archivos = max_archivos
+        self.prioridad_min = prioridad_min
+        self.prioridad_max = prioridad_max
+
+        # Pesos acumulados de Zipf: el archivo k tiene peso 1 / k^s
+        self.pesos_archivos = list(itertools.accumulate(
+            1 / (k ** sesgo_zipf) for k in range(1, len(self.archivos) + 1)))
+
+        self.rng = random.Random(derivar_semilla(semilla, 'carga'))
+        self.rng_archivos = random.Random(derivar_semilla(semilla, 'archivos'))
+        self.siguiente_id = primer_id
+        self.generados = 0
+        self.reloj = float(inicio)
+        self.en_rafaga = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Proceso:
+        if self.total is not None and self.generados >= self.total:
+            raise StopIteration
+
+        self.reloj += self._intervalo_llegada()
+        proceso = Proceso(self.siguiente_id,
+                          self.rng.randint(self.prioridad_min, self.prioridad_max),
+                          self._duracion(),
+                          int(self.reloj),
+                          self._memoria(),
+                          self._archivos())
+        self.siguiente_id += 1
+        self.generados += 1
+        return proceso
+
+    def _intervalo_llegada(self) -> float:
+        """
+        Tiempo hasta la siguiente llegada
+        """
+        if self.llegadas == 'POISSON':
+            return self.rng.expovariate(self.tasa_llegada)
+        elif self.llegadas == 'RAFAGAS':
+            # Proceso modulado de dos estados: rafagas intensas separadas por calmas
+            if self.rng.random() < 1 / self.largo_rafaga:
+                self.en_rafaga = not self.en_rafaga
+            factor = self.intensidad_rafaga if self.en_rafaga else 1 / self.intensidad_rafaga
+            return self.rng.expovariate(self.tasa_llegada * factor)
+        elif self.llegadas == 'UNIFORME':
+            return 1 / self.tasa_llegada
+        raise ValueError(f"Distribucion de llegadas desconocida: {self.llegadas}")
+
+    def _duracion(self) -> int:
+        """
+        Demanda de CPU en ticks (al menos 1)
+        """
+        media = self.duracion_media
+        if self.duracion == 'PARETO':
+            # alfa = 1.5: varianza infinita, pocos procesos muy largos
+            alfa = 1.5
+            valor = media * (alfa - 1) / alfa * self.rng.paretovariate(alfa)
+        elif self.duracion == 'LOGNORMAL':
+            sigma = 1.0
+            valor = self.rng.lognormvariate(math.log(media) - sigma * sigma / 2, sigma)
+        elif self.duracion == 'EXPONENCIAL':
+            valor = self.rng.expovariate(1 / media)
+        elif self.duracion == 'UNIFORME':
+            valor = self.rng.randint(1, max(1, int(2 * media) - 1))
+        else:
+            raise ValueError(f"Distribucion de duracion desconocida: {self.duracion}")
+
+        duracion = max(1, math.ceil(valor))
+        if self.duracion_maxima is not None:
+            duracion = min(duracion, self.duracion_maxima)
+        return duracion
+
+    def _memoria(self) -> int:
+        """
+        Paginas requeridas
+        """
+        if self.memoria == 'UNIFORME':
+            return self.rng.randint(self.memoria_min, self.memoria_max)
+        elif self.memoria == 'GEOMETRICA':
+            paginas = self.memoria_min
+            while paginas < self.memoria_max and self.rng.random() < 0.5:
+                paginas += 1
+            return paginas
+        raise ValueError(f"Distribucion de memoria desconocida: {self.memoria}")
+
+    def _archivos(self) -> List[str]:
+        """
+        Archivos del proceso, sin repetir, elegidos con la popularidad de Zipf
+        """
+        rng = self.rng_archivos
+        cantidad = rng.randint(0, min(self.max_archivos, len(self.archivos)))
+        elegidos = []
+        while len(elegidos) < cantidad:
+            archivo = rng.choices(self.archivos, cum_weights=self.pesos_archivos)[0]
+            if archivo not in elegidos:
+                elegidos.append(archivo)
+        return elegidos
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Obtiene estadisticas del generador
+        """
+        return {
+            'generados': self.generados,
+            'total': self.total,
+            'reloj': round(self.reloj, 2),
+            'llegadas': self.llegadas,
+            'duracion': self.duracion
+        }
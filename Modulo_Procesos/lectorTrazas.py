@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+Modulo de Procesos - Clase LectorTraza
+Lee trazas de cargas reales (CSV o JSONL) de forma incremental, una linea
+por proceso, con memoria constante sin importar el tamano del archivo
+"""
+
+import csv
+import json
+import time
+from typing import Optional
+import sys
+import os
+
+# Anadir el directorio padre al path para importar modulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Modulo_Procesos.proceso import Proceso
+
+
+# Nombres aceptados para cada campo (la traza puede venir en castellano o en ingles)
+CAMPOS = {
+    'id': ('id', 'pid'),
+    'tiempo_llegada': ('tiempo_llegada', 'llegada', 'arrival'),
+    'duracion': ('duracion', 'duracion_total', 'burst'),
+    'prioridad': ('prioridad', 'priority'),
+    'memoria': ('memoria', 'memoria_requerida', 'paginas', 'pages', 'memory'),
+    'archivos': ('archivos', 'archivos_necesarios', 'files'),
+}
+
+SEPARADOR_ARCHIVOS = ';'
+PRIORIDAD_MIN, PRIORIDAD_MAX = 1, 5  # 1=alta, 5=baja (como Proceso)
+TAM_BUFFER = 1024 * 1024
+
+
+class LectorTraza:
+    """
+    Iterador de procesos leidos de una traza ordenada por tiempo de llegada
+
+    Formatos:
+        CSV: cabecera con los campos y una fila por proceso; los archivos van
+             en una sola columna separados por ';'
+        JSONL: un objeto por linea; 'archivos' puede ser lista o texto con ';'
+
+    Al serializarse (checkpoints, proceso hijo) guarda la ruta y la posicion en
+    bytes, y al restaurarse reabre el archivo en ese punto.
+    """
+
+    def __init__(self, ruta: str, formato: Optional[str] = None, estricto: bool = False,
+                 prioridad_defecto: int = 3, memoria_defecto: int = 1):
+        """
+        Inicializa el lector
+
+        Args:
+            ruta: Archivo de traza
+            formato: 'CSV' o 'JSONL' (None = segun la extension)
+            estricto: Lanzar ValueError ante una linea invalida en vez de saltarla
+            prioridad_defecto: Prioridad si la traza no la trae
+            memoria_defecto: Paginas si la traza no las trae
+        """
+        if formato is None:
+            formato = 'JSONL' if ruta.lower().endswith(('.jsonl', '.json', '.ndjson')) else 'CSV'
+        self.ruta = ruta
+        self.formato = formato.upper()
+        if self.formato not in ('CSV', 'JSONL'):
+            raise ValueError(f"Formato de traza desconocido: {formato}")
+        self.estricto = estricto
+        self.prioridad_defecto = prioridad_defecto
+        self.memoria_defecto = memoria_defecto
+
+        self.columnas = None  # CSV: indice de cada campo segun la cabecera
+        self.posicion = 0
+        self.lineas = 0
+        self.procesos = 0
+        self.invalidas = 0
+        self.desordenados = 0
+        self.ultima_llegada = 0
+        self.segundos = 0.0
+        self.archivo = None
+        self._abrir()
+
+    def _abrir(self):
+        """
+        Abre la traza en modo binario en la posicion guardada
+        """
+        self.archivo = open(self.ruta, 'rb', buffering=TAM_BUFFER)
+        self.archivo.seek(self.posicion)
+        if self.formato == 'CSV' and self.columnas is None:
+            cabecera = self.archivo.readline()
+            self.posicion = self.archivo.tell()
+            self.columnas = self._leer_cabecera(cabecera)
+
+    def _leer_cabecera(self, cabecera: bytes) -> dict:
+        """
+        Asocia cada campo con su columna del CSV
+        """
+        nombres = [n.strip().lower() for n in next(csv.reader([cabecera.decode('utf-8-sig')]), [])]
+        columnas = {}
+        for campo, alias in CAMPOS.items():
+            for nombre in alias:
+                if nombre in nombres:
+                    columnas[campo] = nombres.index(nombre)
+                    break
+        faltantes = [c for c in ('id', 'tiempo_llegada', 'duracion') if c not in columnas]
+        if faltantes:
+            raise ValueError(f"La traza {self.ruta} no tiene las columnas {', '.join(faltantes)}")
+        return columnas
+
+    def __getstate__(self):
+        estado = self.__dict__.copy()
+        estado['archivo'] = None
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        if self.posicion is not None:
+            self._abrir()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Proceso:
+        if self.archivo is None:
+            raise StopIteration
+        inicio = time.perf_counter()
+        try:
+            while True:
+                linea = self.archivo.readline()
+                if not linea:
+                    self.cerrar()
+                    raise StopIteration
+                self.posicion += len(linea)
+                self.lineas += 1
+                if not linea.strip():
+                    continue
+                try:
+                    proceso = self._interpretar(linea)
+                except (ValueError, TypeError) as e:
+                    if self.estricto:
+                        raise ValueError(f"{self.ruta}, linea {self.lineas}: {e}") from None
+                    self.invalidas += 1
+                    continue
+
+                if proceso.tiempo_llegada < self.ultima_llegada:
+                    if self.estricto:
+                        raise ValueError(f"{self.ruta}, linea {self.lineas}: la traza no esta ordenada por llegada")
+                    self.desordenados += 1
+                else:
+                    self.ultima_llegada = proceso.tiempo_llegada
+                self.procesos += 1
+                return proceso
+        finally:
+            self.segundos += time.perf_counter() - inicio
+
+    def _interpretar(self, linea: bytes) -> Proceso:
+        """
+        Convierte una linea de la traza en un Proceso
+        """
+        if self.formato == 'JSONL':
+            registro = json.loads(linea)
+            valores = {}
+            for campo, alias in CAMPOS.items():
+                for nombre in alias:
+                    if nombre in registro:
+                        valores[campo] = registro[nombre]
+                        break
+            archivos = valores.get('archivos') or []
+            if isinstance(archivos, str):
+                archivos = [a for a in archivos.split(SEPARADOR_ARCHIVOS) if a]
+        else:
+            texto = linea.decode('utf-8').rstrip('\r\n')
+            # Sin comillas basta con split; con comillas se delega en csv
+            campos = texto.split(',') if '"' not in texto else next(csv.reader([texto]))
+            valores = {campo: campos[indice] for campo, indice in self.columnas.items()
+                       if indice < len(campos) and campos[indice] != ''}
+            archivos = [a for a in valores.get('archivos', '').split(SEPARADOR_ARCHIVOS) if a]
+
+        faltantes = [c for c in ('id', 'tiempo_llegada', 'duracion') if c not in valores]
+        if faltantes:
+            raise ValueError(f"faltan los campos {', '.join(faltantes)}")
+        duracion = int(valores['duracion'])
+        if duracion <= 0:
+            raise ValueError(f"duracion invalida: {duracion}")
+        prioridad = int(valores.get('prioridad', self.prioridad_defecto))
+        if not PRIORIDAD_MIN <= prioridad <= PRIORIDAD_MAX:
+            raise ValueError(f"prioridad invalida: {prioridad} (rango {PRIORIDAD_MIN}..{PRIORIDAD_MAX})")
+        memoria = int(valores.get('memoria', self.memoria_defecto))
+        if memoria < 1:
+            raise ValueError(f"memoria invalida: {memoria}")
+        return Proceso(int(valores['id']),
+                       prioridad,
+                       duracion,
+                       int(valores['tiempo_llegada']),
+                       memoria,
+                       archivos)
+
+    def nombres_archivos(self) -> list:
+        """
+        Recorre la traza completa (sin mover la lectura) y junta los archivos que nombra
+
+        Returns:
+            Nombres de archivo sin repetir, en orden de aparicion
+        """
+        nombres = {}
+        if self.formato == 'CSV' and 'archivos' not in self.columnas:
+            return []
+        with open(self.ruta, 'rb', buffering=TAM_BUFFER) as archivo:
+            if self.formato == 'CSV':
+                archivo.readline()
+            for linea in archivo:
+                if not linea.strip():
+                    continue
+                try:
+                    nombres.update(dict.fromkeys(self._interpretar(linea).archivos_necesarios))
+                except (ValueError, TypeError):
+                    continue
+        return list(nombres)
+
+    def cerrar(self):
+        """
+        Cierra el archivo (la traza queda agotada)
+        """
+        if self.archivo is not None:
+            self.archivo.close()
+            self.archivo = None
+        self.posicion = None
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Obtiene estadisticas de lectura, incluido el rendimiento del analisis
+        """
+        leidos = os.path.getsize(self.ruta) if self.posicion is None else self.posicion
+        return {
+            'ruta': self.ruta,
+            'formato': self.formato,
+            'lineas': self.lineas,
+            'procesos': self.procesos,
+            'invalidas': self.invalidas,
+            'desordenados': self.desordenados,
+            'bytes_leidos': leidos,
+            'segundos_analisis': round(self.segundos, 3),
+            'procesos_por_segundo': round(self.procesos / self.segundos) if self.segundos else 0,
+            'mb_por_segundo': round(leidos / 1e6 / self.segundos, 2) if self.segundos else 0
+        }
@@ -1,21 +1,44 @@
 # -*- coding: utf-8 -*-
 
 from collections import deque
+import heapq
 from typing import Optional
 import sys
 import os
 
 # Anadir el directorio padre al path para importar modulos
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from Modulo_Procesos.proceso import Proceso
+from Modulo_Procesos.proceso import Proceso, NUEVO, LISTO, EJECUTANDO, BLOQUEADO, TERMINADO
+
+
+POLITICAS_ADMISION = ('NINGUNA', 'MARCOS', 'CONJUNTO')
+# Ticks del historial de ejecucion (Gantt) que se conservan sin conservar_terminados
+MAX_HISTORIAL = 10000
 
 
 class Planificador:
 
-    def __init__(self, algoritmo: str = 'RR', quantum: int = 3, gestor_archivos=None):
+    def __init__(self, algoritmo: str = 'RR', quantum: int = 3, gestor_archivos=None,
+                 gestor_memoria=None, conservar_terminados: bool = True,
+                 admision: str = 'NINGUNA', grado_multiprogramacion: Optional[int] = None):
         """
         Inicializa el planificador
+
+        Args:
+            conservar_terminados: Mantener los procesos terminados en memoria; en
+                                  cargas largas conviene False (las metricas se
+                                  acumulan igual y el historial de ejecucion se
+                                  limita a los ultimos MAX_HISTORIAL ticks)
+            admision: Planificador de largo plazo que decide cuando un proceso que
+                      llego pasa de NUEVO a LISTO:
+                      'NINGUNA' al llegar; 'MARCOS' si todas sus paginas caben en
+                      los marcos que no estan comprometidos con otros admitidos;
+                      'CONJUNTO' igual pero con su conjunto de trabajo estimado
+            grado_multiprogramacion: Maximo de procesos admitidos a la vez (None = sin limite)
         """
+        self.admision = admision.upper()
+        if self.admision not in POLITICAS_ADMISION:
+            raise ValueError(f"Politica de admision desconocida: {admision}")
         self.cola_listos = deque()
         self.cola_bloqueados = deque()
         self.proceso_actual = None
@@ -31,32 +54,116 @@ class Planificador:
             'cambios_contexto': 0,
             'procesos_completados': 0
         }
-        self.historial_ejecucion = []  # Para diagrama de Gantt
+        self.conservar_terminados = conservar_terminados
+        # Para diagrama de Gantt [(tiempo, id_proceso)]
+        self.historial_ejecucion = self.historial_vacio()
+        # Procesos NUEVO por admitir: heap [(tiempo_llegada, desempate, secuencia, proceso)]
+        self.llegadas_pendientes = []
+        self.secuencia_llegadas = 0
+        self.procesos_activos = 0  # agregados y aun no terminados
+        self.tiempo_espera_acumulado = 0
+        self.tiempo_retorno_acumulado = 0
+        self.terminados_sin_purgar = 0
         self.gestor_archivos = gestor_archivos
+        self.gestor_memoria = gestor_memoria
+
+        # Control de admision: procesos admitidos sin terminar y marcos comprometidos
+        self.grado_multiprogramacion = grado_multiprogramacion
+        self.controla_admision = self.admision != 'NINGUNA' or grado_multiprogramacion is not None
+        self.admitidos = 0
+        self.admitidos_max = 0
+        self.admitidos_totales = 0
+        self.marcos_comprometidos = 0
+        self.demanda_admitidos = {}  # {id_proceso: marcos reservados al admitirlo}
+        self.espera_admision_acumulada = 0
+        self.procesos_demorados = 0
+        self.ids_demorados = set()
+
+    def historial_vacio(self):
+        """
+        Historial de ejecucion vacio: lista completa o, sin conservar_terminados,
+        acotado a los ultimos MAX_HISTORIAL ticks
+        """
+        return [] if self.conservar_terminados else deque(maxlen=MAX_HISTORIAL)
 
     def agregar_proceso(self, proceso: Proceso):
         """
         Anade un proceso al planificador
         """
         self.todos_procesos.append(proceso)
-        if proceso.tiempo_llegada <= self.tiempo_actual:
-            proceso.estado = 'LISTO'
-            self.cola_listos.append(proceso)
+        self.procesos_activos += 1
+        # Con control de admision entra en orden de llegada desde verificar_llegadas
+        if proceso.tiempo_llegada <= self.tiempo_actual and not self.controla_admision:
+            self.admitir(proceso)
+            return
+        # Con admision los empates de llegada se resuelven por id; sin ella, por orden de alta
+        desempate = proceso.id if self.controla_admision else 0
+        heapq.heappush(self.llegadas_pendientes,
+                       (proceso.tiempo_llegada, desempate, self.secuencia_llegadas, proceso))
+        self.secuencia_llegadas += 1
 
     def verificar_llegadas(self):
         """
         Verifica si hay procesos nuevos que deben entrar a la cola de listos
         """
-        for proceso in self.todos_procesos:
-            if proceso.estado == 'NUEVO' and proceso.tiempo_llegada <= self.tiempo_actual:
-                proceso.estado = 'LISTO'
-                self.cola_listos.append(proceso)
+        # Solo se miran los pendientes cuya llegada ya ocurrio (el tope del heap)
+        pendientes = self.llegadas_pendientes
+        while pendientes and pendientes[0][0] <= self.tiempo_actual:
+            proceso = pendientes[0][-1]
+            if proceso.codigo_estado == NUEVO and not self.admitir(proceso):
+                # Los siguientes esperan detras (admision en orden de llegada)
+                break
+            heapq.heappop(pendientes)
+
+    def admitir(self, proceso: Proceso) -> bool:
+        """
+        Pasa un proceso que ya llego de NUEVO a LISTO si la politica de admision lo permite
+
+        Si no hay ningun proceso admitido siempre entra, para no bloquear la
+        carga cuando un proceso pide mas marcos de los que hay.
+
+        Returns:
+            True si fue admitido
+        """
+        if (self.admitidos and self.grado_multiprogramacion is not None
+                and self.admitidos >= self.grado_multiprogramacion):
+            return self._demorar(proceso)
+
+        demanda = 0
+        if self.admision != 'NINGUNA' and self.gestor_memoria is not None:
+            demanda = (proceso.memoria_requerida if self.admision == 'MARCOS'
+                       else self.gestor_memoria.estimar_conjunto(proceso))
+            if self.admitidos and self.marcos_comprometidos + demanda > self.gestor_memoria.marcos_totales:
+                return self._demorar(proceso)
+
+        self.admitidos += 1
+        self.admitidos_totales += 1
+        self.admitidos_max = max(self.admitidos_max, self.admitidos)
+        if demanda:
+            self.marcos_comprometidos += demanda
+            self.demanda_admitidos[proceso.id] = demanda
+        if self.controla_admision:
+            self.espera_admision_acumulada += self.tiempo_actual - proceso.tiempo_llegada
+            self.ids_demorados.discard(proceso.id)
+        proceso.codigo_estado = LISTO
+        self.cola_listos.append(proceso)
+        return True
+
+    def _demorar(self, proceso: Proceso) -> bool:
+        """
+        Deja esperando a un proceso que no pudo ser admitido (se cuenta una vez)
+        """
+        if proceso.id not in self.ids_demorados:
+            self.ids_demorados.add(proceso.id)
+            self.procesos_demorados += 1
+        return False
 
     def seleccionar_siguiente(self) -> Optional[Proceso]:
         """
         Selecciona el siguiente proceso a ejecutar segun el algoritmo activo
         """
-        if not self.cola_listos:
+        # Sin listos, el proceso en CPU (si lo hay) puede seguir ejecutando
+        if not self.cola_listos and self.proceso_actual is None:
             return None
 
         if self.algoritmo == 'RR':
@@ -75,16 +182,18 @@ class Planificador:
         if self.proceso_actual and self.quantum_restante > 0:
             return self.proceso_actual
 
-        # Cambio de contexto
-        if self.proceso_actual:
-            if self.proceso_actual.estado == 'EJECUTANDO':
-                self.proceso_actual.estado = 'LISTO'
-                self.cola_listos.append(self.proceso_actual)
-            self.metricas['cambios_contexto'] += 1
+        # Fin del quantum: el proceso vuelve al final de la cola
+        anterior = self.proceso_actual
+        if anterior and anterior.codigo_estado == EJECUTANDO:
+            anterior.codigo_estado = LISTO
+            self.cola_listos.append(anterior)
 
         if self.cola_listos:
             proceso = self.cola_listos.popleft()
-            proceso.estado = 'EJECUTANDO'
+            # Si era el unico listo sigue el mismo proceso: no hay cambio de contexto
+            if anterior and proceso is not anterior:
+                self.metricas['cambios_contexto'] += 1
+            proceso.codigo_estado = EJECUTANDO
             if proceso.tiempo_inicio is None:
                 proceso.tiempo_inicio = self.tiempo_actual
             self.proceso_actual = proceso
@@ -95,7 +204,7 @@ class Planificador:
 
     def _sjf(self) -> Optional[Proceso]:
 
-        if self.proceso_actual and self.proceso_actual.estado == 'EJECUTANDO':
+        if self.proceso_actual and self.proceso_actual.codigo_estado == EJECUTANDO:
             return self.proceso_actual
 
         if not self.cola_listos:
@@ -111,21 +220,21 @@ class Planificador:
                 self.metricas['cambios_contexto'] += 1
             self.proceso_actual = proceso_min
 
-        proceso_min.estado = 'EJECUTANDO'
+        proceso_min.codigo_estado = EJECUTANDO
         if proceso_min.tiempo_inicio is None:
             proceso_min.tiempo_inicio = self.tiempo_actual
 
         return proceso_min
 
     def _prioridad(self) -> Optional[Proceso]:
-        if self.proceso_actual and self.proceso_actual.estado == 'EJECUTANDO':
+        if self.proceso_actual and self.proceso_actual.codigo_estado == EJECUTANDO:
             return self.proceso_actual
 
         if not self.cola_listos:
             return None
 
         lista_procesos = list(self.cola_listos)
-        proceso_max = min(lista_procesos, key=lambda p: p.prioridad)
+        proceso_max = min(lista_procesos, key=lambda p: p.prioridad_efectiva())
 
         self.cola_listos.remove(proceso_max)
 
@@ -134,7 +243,7 @@ class Planificador:
                 self.metricas['cambios_contexto'] += 1
             self.proceso_actual = proceso_max
 
-        proceso_max.estado = 'EJECUTANDO'
+        proceso_max.codigo_estado = EJECUTANDO
         if proceso_max.tiempo_inicio is None:
             proceso_max.tiempo_inicio = self.tiempo_actual
 
@@ -150,6 +259,8 @@ class Planificador:
         # Sincronizar tiempo con el gestor de archivos si existe
         if self.gestor_archivos is not None:
             self.gestor_archivos.tiempo_actual = self.tiempo_actual
+        if self.gestor_memoria is not None:
+            self.gestor_memoria.tiempo_actual = self.tiempo_actual
 
         self.verificar_llegadas()
 
@@ -178,21 +289,20 @@ class Planificador:
             # Ejecutar el proceso
             proceso.ejecutar(1)
             self.quantum_restante -= 1
+            if proceso.archivo_retenido is not None and self.gestor_archivos is not None:
+                self.gestor_archivos.avanzar_seccion_critica(proceso, self)
 
             # Actualizar tiempos de espera de otros procesos
             for p in self.cola_listos:
                 p.tiempo_espera += 1
 
             # Verificar si el proceso termino
-            if proceso.estado == 'TERMINADO':
-                # liberar cualquier archivo que pudiera tener
-                if self.gestor_archivos is not None and getattr(proceso, 'archivo_actual', None) is None:
-                    # si el proceso era propietario de algún archivo, liberarlo
-                    # (requiere que el proceso tenga info del archivo actual o list)
-                    pass
+            if proceso.codigo_estado == TERMINADO:
+                # Liberar de inmediato sus marcos y archivos
+                self.liberar_recursos(proceso)
                 proceso.tiempo_finalizacion = self.tiempo_actual
                 proceso.tiempo_retorno = proceso.tiempo_finalizacion - proceso.tiempo_llegada
-                self.procesos_terminados.append(proceso)
+                self.registrar_terminado(proceso)
                 self.proceso_actual = None
                 self.quantum_restante = 0
                 self.metricas['procesos_completados'] += 1
@@ -211,6 +321,34 @@ class Planificador:
 
         return False
 
+    def registrar_terminado(self, proceso: Proceso):
+        """
+        Acumula las metricas de un proceso terminado y, si no se conservan,
+        purga los terminados de todos_procesos cuando son la mitad de la lista
+        """
+        self.procesos_activos -= 1
+        self.tiempo_espera_acumulado += proceso.tiempo_espera
+        self.tiempo_retorno_acumulado += proceso.tiempo_retorno
+        self.admitidos -= 1
+        self.marcos_comprometidos -= self.demanda_admitidos.pop(proceso.id, 0)
+        if self.conservar_terminados:
+            self.procesos_terminados.append(proceso)
+            return
+
+        self.terminados_sin_purgar += 1
+        if self.terminados_sin_purgar * 2 >= len(self.todos_procesos):
+            self.todos_procesos = [p for p in self.todos_procesos if p.codigo_estado != TERMINADO]
+            self.terminados_sin_purgar = 0
+
+    def liberar_recursos(self, proceso: Proceso):
+        """
+        Libera la memoria y los archivos de un proceso que acaba de terminar
+        """
+        if self.gestor_memoria is not None:
+            self.gestor_memoria.liberar_memoria(proceso)
+        if self.gestor_archivos is not None:
+            self.gestor_archivos.liberar_archivos_proceso(proceso, self)
+
     def bloquear_proceso(self, proceso: Proceso):
         """
         Bloquea un proceso (por I/O)
@@ -218,7 +356,7 @@ class Planificador:
         Args:
             proceso: Proceso a bloquear
         """
-        proceso.estado = 'BLOQUEADO'
+        proceso.codigo_estado = BLOQUEADO
         self.cola_bloqueados.append(proceso)
         if self.proceso_actual == proceso:
             self.proceso_actual = None
@@ -233,7 +371,7 @@ class Planificador:
         """
         if proceso in self.cola_bloqueados:
             self.cola_bloqueados.remove(proceso)
-        proceso.estado = 'LISTO'
+        proceso.codigo_estado = LISTO
         self.cola_listos.append(proceso)
 
     def hay_procesos_activos(self) -> bool:
@@ -243,29 +381,37 @@ class Planificador:
         Returns:
             True si hay procesos pendientes
         """
-        procesos_activos = len([p for p in self.todos_procesos if p.estado != 'TERMINADO'])
-        return procesos_activos > 0
+        return self.procesos_activos > 0
 
     def calcular_metricas(self) -> dict:
         """:
             Diccionario con metricas calculadas
         """
-        if not self.procesos_terminados:
+        completados = self.metricas['procesos_completados']
+        if not completados:
             return self.metricas
 
-        tiempo_espera_promedio = sum(p.tiempo_espera for p in self.procesos_terminados) / len(self.procesos_terminados)
-        tiempo_retorno_promedio = sum(p.tiempo_retorno for p in self.procesos_terminados) / len(self.procesos_terminados)
+        tiempo_espera_promedio = self.tiempo_espera_acumulado / completados
+        tiempo_retorno_promedio = self.tiempo_retorno_acumulado / completados
 
         self.metricas['tiempo_espera_promedio'] = round(tiempo_espera_promedio, 2)
         self.metricas['tiempo_retorno_promedio'] = round(tiempo_retorno_promedio, 2)
 
+        if self.controla_admision:
+            self.metricas['admision'] = self.admision
+            self.metricas['grado_multiprogramacion_max'] = self.admitidos_max
+            self.metricas['procesos_demorados'] = self.procesos_demorados
+            self.metricas['espera_admision_promedio'] = round(
+                self.espera_admision_acumulada / self.admitidos_totales, 2)
+
         return self.metricas
 
     def generar_diagrama_gantt(self) -> str:
         """
         Genera un diagrama de Gantt en formato texto
         """
-        if not self.historial_ejecucion:
+        historial = list(self.historial_ejecucion)
+        if not historial:
             return "No hay historial de ejecucion"
 
         gantt = "\n" + "="*80 + "\n"
@@ -274,18 +420,18 @@ class Planificador:
 
         # Agrupar ejecuciones consecutivas del mismo proceso
         agrupado = []
-        tiempo_inicio = self.historial_ejecucion[0][0]
-        proceso_actual = self.historial_ejecucion[0][1]
+        tiempo_inicio = historial[0][0]
+        proceso_actual = historial[0][1]
 
-        for i in range(1, len(self.historial_ejecucion)):
-            tiempo, proceso = self.historial_ejecucion[i]
+        for i in range(1, len(historial)):
+            tiempo, proceso = historial[i]
             if proceso != proceso_actual:
                 agrupado.append((tiempo_inicio, tiempo - 1, proceso_actual))
                 tiempo_inicio = tiempo
                 proceso_actual = proceso
 
         # Anadir el ultimo
-        agrupado.append((tiempo_inicio, self.historial_ejecucion[-1][0], proceso_actual))
+        agrupado.append((tiempo_inicio, historial[-1][0], proceso_actual))
 
         # Generar visualizacion
         for inicio, fin, proceso_id in agrupado:
@@ -6,11 +6,26 @@ Representa un proceso en el sistema (Process Control Block)
 
 from typing import List, Optional
 
+# Estados codificados como enteros (el atributo estado sigue siendo el nombre)
+NUEVO, LISTO, EJECUTANDO, BLOQUEADO, TERMINADO = range(5)
+NOMBRES_ESTADO = ('NUEVO', 'LISTO', 'EJECUTANDO', 'BLOQUEADO', 'TERMINADO')
+CODIGOS_ESTADO = {nombre: codigo for codigo, nombre in enumerate(NOMBRES_ESTADO)}
+
+
 class Proceso:
     """
     Process Control Block (PCB) - Representa un proceso en el sistema
+
+    Usa __slots__ para ocupar poco en simulaciones grandes; el estado se guarda
+    como codigo entero (codigo_estado) y estado lo expone con su nombre.
     """
 
+    __slots__ = ('id', 'codigo_estado', 'prioridad', 'prioridad_heredada', 'duracion_total',
+                 'tiempo_restante', 'tiempo_llegada', 'tiempo_inicio', 'tiempo_finalizacion',
+                 'tiempo_espera', 'tiempo_retorno', 'memoria_requerida', 'archivos_necesarios',
+                 'archivos_usados', 'paginas_asignadas', 'archivo_actual', 'tiempo_io_restante',
+                 'archivo_retenido', 'ticks_seccion_critica')
+
     def __init__(self, id: int, prioridad: int, duracion_total: int,
                  tiempo_llegada: int, memoria_requerida: int,
                  archivos_necesarios: List[str]):
@@ -26,8 +41,9 @@ class Proceso:
             archivos_necesarios: Lista de archivos que usara el proceso
         """
         self.id = id
-        self.estado = 'NUEVO'  # NUEVO, LISTO, EJECUTANDO, BLOQUEADO, TERMINADO
+        self.codigo_estado = NUEVO  # NUEVO, LISTO, EJECUTANDO, BLOQUEADO, TERMINADO
         self.prioridad = prioridad
+        self.prioridad_heredada = None  # Elevacion temporal por archivos (herencia/techo)
         self.duracion_total = duracion_total
         self.tiempo_restante = duracion_total
         self.tiempo_llegada = tiempo_llegada
@@ -36,11 +52,24 @@ class Proceso:
         self.tiempo_espera = 0
         self.tiempo_retorno = 0
         self.memoria_requerida = memoria_requerida
-        self.archivos_necesarios = archivos_necesarios.copy()
+        self.archivos_necesarios = list(archivos_necesarios)
         self.archivos_usados = []
         self.paginas_asignadas = []
         self.archivo_actual = None
         self.tiempo_io_restante = 0
+        self.archivo_retenido = None  # Archivo que sigue bloqueando tras su I/O (seccion critica)
+        self.ticks_seccion_critica = 0
+
+    @property
+    def estado(self) -> str:
+        """
+        Nombre del estado ('NUEVO', 'LISTO', 'EJECUTANDO', 'BLOQUEADO' o 'TERMINADO')
+        """
+        return NOMBRES_ESTADO[self.codigo_estado]
+
+    @estado.setter
+    def estado(self, estado):
+        self.codigo_estado = CODIGOS_ESTADO[estado] if isinstance(estado, str) else estado
 
     def ejecutar(self, quantum: int) -> int:
         """
@@ -56,10 +85,18 @@ class Proceso:
         self.tiempo_restante -= tiempo_ejecutado
 
         if self.tiempo_restante == 0:
-            self.estado = 'TERMINADO'
+            self.codigo_estado = TERMINADO
 
         return tiempo_ejecutado
 
+    def prioridad_efectiva(self) -> int:
+        """
+        Obtiene la prioridad con la que se planifica (incluye la heredada)
+        """
+        if self.prioridad_heredada is not None and self.prioridad_heredada < self.prioridad:
+            return self.prioridad_heredada
+        return self.prioridad
+
     def necesita_io(self) -> bool:
         """
         Determina si el proceso necesita realizar operaciones de I/O
@@ -67,8 +104,8 @@ class Proceso:
         Returns:
             True si necesita acceder a un archivo
         """
-        # Cada 30% del tiempo de ejecucion, necesita I/O
-        if self.tiempo_restante > 0 and len(self.archivos_necesarios) > 0:
+        # Cada 30% del tiempo de ejecucion, necesita I/O (nunca mientras retiene otro archivo)
+        if self.tiempo_restante > 0 and len(self.archivos_necesarios) > 0 and self.archivo_retenido is None:
             progreso = (self.duracion_total - self.tiempo_restante) / self.duracion_total
             if progreso > 0.3 and len(self.archivos_usados) < len(self.archivos_necesarios):
                 return True
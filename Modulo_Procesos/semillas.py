@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+Modulo de Procesos - Semillas por subsistema
+Cada subsistema (carga, archivos de la carga, memoria) usa su propio generador
+con una semilla derivada de la semilla de la corrida, de modo que cambiar la
+configuracion de uno no altera la secuencia aleatoria de los demas
+"""
+
+import hashlib
+from typing import Optional
+
+
+SUBSISTEMAS = ('carga', 'archivos', 'memoria')
+
+
+def derivar_semilla(semilla: Optional[int], subsistema: str) -> Optional[int]:
+    """
+    Semilla independiente de un subsistema
+
+    Args:
+        semilla: Semilla de la corrida (None = sin semilla, cada corrida distinta)
+        subsistema: Uno de SUBSISTEMAS
+
+    Returns:
+        Entero de 64 bits estable entre ejecuciones y plataformas, o None
+    """
+    if subsistema not in SUBSISTEMAS:
+        raise ValueError(f"Subsistema desconocido: {subsistema}")
+    if semilla is None:
+        return None
+    resumen = hashlib.blake2b(f"{semilla}/{subsistema}".encode(), digest_size=8).digest()
+    return int.from_bytes(resumen, 'little')
@@ -0,0 +1,8 @@
+"""
+Módulo de Simulación
+"""
+from .instantanea import Instantanea, BuzonInstantaneas
+from .motor import MotorSimulacion
+from .estado import guardar_estado, cargar_estado
+
+__all__ = ['Instantanea', 'BuzonInstantaneas', 'MotorSimulacion', 'guardar_estado', 'cargar_estado']
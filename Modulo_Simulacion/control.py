@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+Modulo de Simulacion - Clase ControlVelocidad
+Regula el ritmo del hilo de simulacion: tiempo real, sin limite, pausa,
+paso a paso y ejecucion hasta un tiempo dado
+"""
+
+import math
+import threading
+import time
+
+
+class ControlVelocidad:
+    """
+    Control de ejecucion compartido entre la interfaz y el hilo de simulacion
+    """
+
+    def __init__(self, ticks_por_segundo: float = 10, cuadros_por_segundo: float = 10):
+        """
+        Inicializa el control
+
+        Args:
+            ticks_por_segundo: Ritmo de la simulacion (0 = sin limite)
+            cuadros_por_segundo: Frecuencia maxima con la que se publican instantaneas
+        """
+        self._condicion = threading.Condition()
+        self.ticks_por_segundo = self._ritmo_valido(ticks_por_segundo)
+        self.intervalo_cuadro = 1 / cuadros_por_segundo
+        self.pausado = False
+        self.pasos_pendientes = 0
+        self.tiempo_objetivo = None
+        self.detenido = False
+        self._ultima_publicacion = 0.0
+
+    @staticmethod
+    def _ritmo_valido(ticks_por_segundo: float) -> float:
+        """
+        Ritmo acotado: negativos, infinito y NaN cuentan como sin limite (0)
+        """
+        return ticks_por_segundo if math.isfinite(ticks_por_segundo) and ticks_por_segundo > 0 else 0
+
+    def fijar_velocidad(self, ticks_por_segundo: float):
+        """
+        Cambia el ritmo en caliente (0 = sin limite)
+        """
+        with self._condicion:
+            self.ticks_por_segundo = self._ritmo_valido(ticks_por_segundo)
+            self._condicion.notify_all()
+
+    def pausar(self):
+        """
+        Detiene el avance hasta reanudar o pedir un paso
+        """
+        with self._condicion:
+            self.pausado = True
+            self.tiempo_objetivo = None
+
+    def reanudar(self):
+        """
+        Continua la ejecucion al ritmo configurado
+        """
+        with self._condicion:
+            self.pausado = False
+            self.tiempo_objetivo = None
+            self._condicion.notify_all()
+
+    def paso(self, pasos: int = 1):
+        """
+        Ejecuta pasos ticks y vuelve a quedar en pausa (pasos < 1 solo pausa)
+        """
+        with self._condicion:
+            self.pausado = True
+            self.pasos_pendientes += max(0, pasos)
+            self._condicion.notify_all()
+
+    def ejecutar_hasta(self, tiempo: int):
+        """
+        Ejecuta sin limite de velocidad hasta alcanzar el tiempo indicado y pausa
+        """
+        with self._condicion:
+            self.tiempo_objetivo = max(0, tiempo)
+            self.pausado = False
+            self._condicion.notify_all()
+
+    def detener(self):
+        """
+        Termina la simulacion y despierta al hilo si estaba esperando
+        """
+        with self._condicion:
+            self.detenido = True
+            self._condicion.notify_all()
+
+    def esperar_turno(self, tiempo_actual: int) -> bool:
+        """
+        Bloquea el hilo de simulacion mientras este en pausa
+
+        Returns:
+            False si la simulacion fue detenida
+        """
+        with self._condicion:
+            if self.tiempo_objetivo is not None and tiempo_actual >= self.tiempo_objetivo:
+                self.tiempo_objetivo = None
+                self.pausado = True
+
+            while self.pausado and not self.pasos_pendientes and not self.detenido:
+                self._condicion.wait()
+
+            if self.pausado and self.pasos_pendientes:
+                self.pasos_pendientes -= 1
+            return not self.detenido
+
+    def esperar_fin_tick(self, inicio_tick: float):
+        """
+        Duerme lo que falte para respetar el ritmo configurado
+        """
+        with self._condicion:
+            while not self.detenido and not self.pausado and self.tiempo_objetivo is None:
+                if self.ticks_por_segundo <= 0:
+                    return
+                restante = inicio_tick + 1 / self.ticks_por_segundo - time.monotonic()
+                if restante <= 0:
+                    return
+                # Un cambio de velocidad despierta la espera y recalcula el plazo
+                self._condicion.wait(restante)
+
+    def debe_publicar(self, tiempo_actual: int) -> bool:
+        """
+        Indica si toca publicar una instantanea (a lo sumo una por cuadro,
+        salvo en pausa o al alcanzar el tiempo objetivo)
+        """
+        ahora = time.monotonic()
+        llego_objetivo = self.tiempo_objetivo is not None and tiempo_actual >= self.tiempo_objetivo
+        if self.pausado or llego_objetivo or ahora - self._ultima_publicacion >= self.intervalo_cuadro:
+            self._ultima_publicacion = ahora
+            return True
+        return False
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+Modulo de Simulacion - Guardado y restauracion del estado completo
+Serializa el motor (colas, tablas de paginas, marcos, bloqueos de archivos,
+colas de espera, disco, cache y estado del generador aleatorio) en un
+formato binario versionado y comprimido.
+
+La cabecera lleva, ademas de la version del formato, una huella derivada de
+los atributos de cada clase del simulador: un archivo escrito con otra
+disposicion de clases se rechaza en vez de restaurarse a medias. Al cargar
+solo se reconstruyen las clases del simulador y unos pocos tipos de la
+biblioteca estandar, de modo que un archivo manipulado no ejecuta codigo.
+"""
+
+import dis
+import hashlib
+import inspect
+import io
+import pickle
+import struct
+import zlib
+import sys
+import os
+
+# Anadir el directorio padre al path para importar modulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Modulo_Procesos.proceso import Proceso
+from Modulo_Procesos.planificador import Planificador
+from Modulo_Procesos.cargaTrabajo import GeneradorCarga
+from Modulo_Procesos.lectorTrazas import LectorTraza
+from Modulo_Memoria.gestorMemoria import GestorMemoria
+from Modulo_Memoria.memoria import Pagina
+from Modulo_Archivos.gestorArchivos import GestorArchivos
+from Modulo_Archivos.archivo import RecursoArchivo
+from Modulo_Archivos.directorio import Directorio
+from Modulo_Archivos.disco import Disco, SolicitudIO, Histograma
+from Modulo_Archivos.cache import CacheBloques
+from Modulo_Simulacion.motor import MotorSimulacion
+
+
+# Clases del simulador que puede contener un estado guardado
+CLASES_ESTADO = (MotorSimulacion, Planificador, Proceso, GeneradorCarga, LectorTraza,
+                 GestorMemoria, Pagina, GestorArchivos, RecursoArchivo, Directorio,
+                 Disco, SolicitudIO, Histograma, CacheBloques)
+
+# Tipos de la biblioteca estandar que aparecen dentro del motor
+GLOBALES_ESTANDAR = {('collections', 'deque'), ('collections', 'OrderedDict'),
+                     ('array', 'array'), ('array', '_array_reconstructor'),
+                     ('random', 'Random'), ('builtins', 'iter')}
+
+
+def atributos_clase(clase) -> list:
+    """
+    Atributos de instancia de una clase: sus __slots__ o los que sus metodos
+    asignan sobre self (incluidas las clases base)
+    """
+    nombres = set()
+    for actual in clase.__mro__[:-1]:
+        if '__slots__' in vars(actual):
+            nombres.update(actual.__slots__)
+            continue
+        codigos = []
+        for valor in vars(actual).values():
+            if isinstance(valor, (staticmethod, classmethod)):
+                valor = valor.__func__
+            elif isinstance(valor, property):
+                valor = valor.fset
+            if inspect.isfunction(valor):
+                codigos.append(valor.__code__)
+        while codigos:
+            codigo = codigos.pop()
+            codigos.extend(c for c in codigo.co_consts if inspect.iscode(c))
+            anterior = None
+            for instruccion in dis.get_instructions(codigo):
+                # self.x = ... carga self justo antes de STORE_ATTR
+                if (instruccion.opname == 'STORE_ATTR' and anterior is not None
+                        and anterior.opname.startswith('LOAD_FAST')
+                        and 'self' in (anterior.argval if isinstance(anterior.argval, tuple)
+                                       else (anterior.argval,))):
+                    nombres.add(instruccion.argval)
+                anterior = instruccion
+    return sorted(nombres)
+
+
+def huella_clases(clases=CLASES_ESTADO) -> bytes:
+    """
+    Huella de 8 bytes de la disposicion (nombre y atributos) de las clases dadas
+    """
+    descripcion = ';'.join(f"{c.__module__}.{c.__qualname__}:{','.join(atributos_clase(c))}"
+                           for c in clases)
+    return hashlib.blake2b(descripcion.encode('utf-8'), digest_size=8).digest()
+
+
+FIRMA = b'SOES'
+VERSION_ESTADO = 6
+HUELLA_ESTADO = huella_clases()
+PREFIJO = struct.Struct('<4sH')  # firma, version (comun a todas las versiones)
+CABECERA = struct.Struct('<4sH8sIII')  # firma, version, huella, ciclo, crc32, longitud comprimida
+
+GLOBALES_PERMITIDOS = GLOBALES_ESTANDAR | {(c.__module__, c.__qualname__) for c in CLASES_ESTADO}
+
+# Ultimas operaciones de cada log que se conservan al recortar (las que muestran las vistas)
+LOG_CONSERVADO = 10
+
+
+def serializar_motor(motor, recortar: bool = False, nivel: int = 6) -> bytes:
+    """
+    Serializa y comprime un MotorSimulacion
+
+    Pickle conserva las referencias compartidas: un mismo Proceso que esta a la vez
+    en una cola, como propietario de un archivo y en una peticion de disco se
+    restaura como un unico objeto.
+
+    Args:
+        motor: Motor a serializar (entre ticks)
+        recortar: Omitir lo que solo crece y no afecta a la simulacion (logs de
+                  texto salvo su cola e historial de ejecucion)
+        nivel: Nivel de compresion zlib
+    """
+    if not recortar:
+        return zlib.compress(pickle.dumps(motor, protocol=pickle.HIGHEST_PROTOCOL), nivel)
+
+    planificador = motor.planificador
+    componentes = [motor.gestor_memoria, motor.gestor_archivos]
+    if motor.gestor_archivos.disco is not None:
+        componentes.append(motor.gestor_archivos.disco)
+    logs = [c.log_operaciones for c in componentes]
+    historial = planificador.historial_ejecucion
+    try:
+        for componente in componentes:
+            componente.log_operaciones = componente.log_operaciones[-LOG_CONSERVADO:]
+        planificador.historial_ejecucion = planificador.historial_vacio()
+        return zlib.compress(pickle.dumps(motor, protocol=pickle.HIGHEST_PROTOCOL), nivel)
+    finally:
+        for componente, log in zip(componentes, logs):
+            componente.log_operaciones = log
+        planificador.historial_ejecucion = historial
+
+
+class _CargadorEstado(pickle.Unpickler):
+    """
+    Unpickler que solo reconstruye los tipos de GLOBALES_PERMITIDOS
+    """
+
+    def find_class(self, modulo, nombre):
+        if (modulo, nombre) not in GLOBALES_PERMITIDOS:
+            raise ValueError(f"El estado contiene un objeto no permitido: {modulo}.{nombre}")
+        return super().find_class(modulo, nombre)
+
+
+def deserializar_motor(datos: bytes):
+    """
+    Reconstruye un motor serializado con serializar_motor
+
+    Raises:
+        ValueError: Si los datos referencian algo fuera de las clases del simulador
+    """
+    return _CargadorEstado(io.BytesIO(zlib.decompress(datos))).load()
+
+
+def estado_a_bytes(motor) -> bytes:
+    """
+    Estado completo del motor con cabecera versionada y suma de verificacion
+    """
+    datos = serializar_motor(motor)
+    return CABECERA.pack(FIRMA, VERSION_ESTADO, HUELLA_ESTADO, motor.ciclo,
+                         zlib.crc32(datos), len(datos)) + datos
+
+
+def estado_desde_bytes(datos: bytes):
+    """
+    Restaura un motor guardado con estado_a_bytes
+
+    Raises:
+        ValueError: Si el formato, la version, la disposicion de las clases o la
+                    suma de verificacion no coinciden
+    """
+    if len(datos) < PREFIJO.size:
+        raise ValueError("Estado guardado incompleto")
+    firma, version = PREFIJO.unpack_from(datos, 0)
+    if firma != FIRMA:
+        raise ValueError("El archivo no contiene un estado del simulador")
+    if version != VERSION_ESTADO:
+        raise ValueError(f"Version de estado no soportada: {version} (se esperaba {VERSION_ESTADO})")
+    if len(datos) < CABECERA.size:
+        raise ValueError("Estado guardado incompleto")
+    _, _, huella, ciclo, crc, longitud = CABECERA.unpack_from(datos, 0)
+    if huella != HUELLA_ESTADO:
+        raise ValueError("Estado guardado con otra disposicion de clases del simulador")
+
+    carga = datos[CABECERA.size:CABECERA.size + longitud]
+    if len(carga) != longitud or zlib.crc32(carga) != crc:
+        raise ValueError("Estado guardado corrupto (suma de verificacion distinta)")
+
+    motor = deserializar_motor(carga)
+    if motor.ciclo != ciclo:
+        raise ValueError("Estado guardado inconsistente con su cabecera")
+    return motor
+
+
+def guardar_estado(motor, ruta: str):
+    """
+    Escribe el estado completo del motor en un archivo
+    """
+    with open(ruta, 'wb') as archivo:
+        archivo.write(estado_a_bytes(motor))
+
+
+def cargar_estado(ruta: str):
+    """
+    Lee un estado escrito con guardar_estado y devuelve el motor listo para continuar
+    """
+    with open(ruta, 'rb') as archivo:
+        return estado_desde_bytes(archivo.read())
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Modulo de Simulacion - Clase SegmentosGantt
+Historial de ejecucion codificado por tramos (run-length) por proceso, con
+consultas por ventana y nivel de detalle para dibujar corridas muy largas
+"""
+
+import bisect
+from array import array
+import sys
+import os
+
+# Anadir el directorio padre al path para importar modulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Modulo_Simulacion.grabacion import REGISTRO_TICK
+
+
+class SegmentosGantt:
+    """
+    Tramos [inicio, fin] (ticks inclusive) en que corrio cada proceso
+    """
+
+    def __init__(self):
+        self.inicios = {}  # pid -> array('I') ordenado
+        self.fines = {}  # pid -> array('I') ordenado (los tramos no se solapan)
+        self.tiempo_final = 0
+        self.total_tramos = 0
+
+    @classmethod
+    def desde_historial(cls, historial: list) -> 'SegmentosGantt':
+        """
+        Construye los tramos a partir de historial_ejecucion [(tiempo, pid)]
+        """
+        segmentos = cls()
+        for tiempo, pid in historial:
+            segmentos._agregar_tick(tiempo, pid)
+        return segmentos
+
+    @classmethod
+    def desde_grabacion(cls, grabacion) -> 'SegmentosGantt':
+        """
+        Construye los tramos leyendo la columna de proceso de los registros por tick
+        """
+        segmentos = cls()
+        for tiempo, registro in enumerate(REGISTRO_TICK.iter_unpack(grabacion.registros), start=1):
+            if registro[0] >= 0:
+                segmentos._agregar_tick(tiempo, registro[0])
+        segmentos.tiempo_final = max(segmentos.tiempo_final, grabacion.total_ticks)
+        return segmentos
+
+    def _agregar_tick(self, tiempo: int, pid: int):
+        """
+        Extiende el ultimo tramo del proceso o abre uno nuevo
+        """
+        fines = self.fines.get(pid)
+        if fines is None:
+            self.inicios[pid] = array('I', [tiempo])
+            self.fines[pid] = array('I', [tiempo])
+            self.total_tramos += 1
+        elif fines[-1] == tiempo - 1:
+            fines[-1] = tiempo
+        else:
+            self.inicios[pid].append(tiempo)
+            fines.append(tiempo)
+            self.total_tramos += 1
+        if tiempo > self.tiempo_final:
+            self.tiempo_final = tiempo
+
+    @property
+    def procesos(self) -> list:
+        """PIDs con al menos un tramo, ordenados"""
+        return sorted(self.inicios)
+
+    def tramos_visibles(self, pid: int, desde: float, hasta: float, columnas: int) -> list:
+        """
+        Tramos de un proceso en la ventana [desde, hasta) listos para dibujar
+
+        Si en la ventana hay mas tramos que columnas de pixeles, se muestrea por
+        columna (una busqueda binaria por columna) y se unen las columnas
+        ocupadas contiguas: el costo depende del ancho en pixeles y no del largo
+        de la corrida.
+
+        Args:
+            pid: Proceso
+            desde: Primer tick visible
+            hasta: Tick siguiente al ultimo visible
+            columnas: Ancho de la ventana en pixeles
+
+        Returns:
+            Lista de (inicio, fin_exclusivo) en ticks
+        """
+        inicios = self.inicios.get(pid)
+        if inicios is None or hasta <= desde or columnas <= 0:
+            return []
+        fines = self.fines[pid]
+
+        # El tick t ocupa [t, t + 1): el tramo interseca la ventana si fin + 1 > desde e inicio < hasta
+        primero = bisect.bisect_right(fines, desde - 1)
+        ultimo = bisect.bisect_left(inicios, hasta)
+        if ultimo - primero <= columnas:
+            return [(inicios[i], fines[i] + 1) for i in range(primero, ultimo)]
+
+        # Nivel de detalle reducido: una muestra por columna de pixeles
+        ticks_por_columna = (hasta - desde) / columnas
+        tramos = []
+        abierto = None
+        for columna in range(columnas):
+            a = desde + columna * ticks_por_columna
+            b = a + ticks_por_columna
+            i = bisect.bisect_right(fines, a - 1, primero, ultimo)
+            ocupada = i < ultimo and inicios[i] < b
+            if ocupada and abierto is None:
+                abierto = a
+            elif not ocupada and abierto is not None:
+                tramos.append((abierto, a))
+                abierto = None
+        if abierto is not None:
+            tramos.append((abierto, hasta))
+        return tramos
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Obtiene estadisticas de los tramos
+        """
+        return {
+            'procesos': len(self.inicios),
+            'tramos': self.total_tramos,
+            'tiempo_final': self.tiempo_final
+        }
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+Modulo de Simulacion - Clase Grabacion
+Registro binario compacto de cada tick con checkpoints periodicos del estado
+completo para saltar a cualquier instante (checkpoint mas cercano + repeticion)
+"""
+
+import bisect
+import struct
+import sys
+import os
+
+# Anadir el directorio padre al path para importar modulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Modulo_Simulacion.estado import serializar_motor, deserializar_motor, HUELLA_ESTADO
+
+
+# Un registro por tick: proceso ejecutado (-1 = IDLE), listos, bloqueados, fallos de pagina acumulados
+REGISTRO_TICK = struct.Struct('<iIII')
+
+CABECERA = struct.Struct('<4sH8sIII')  # firma, version, huella del estado, intervalo, ticks, checkpoints
+FIRMA = b'SOGR'
+VERSION = 6
+
+
+class Grabacion:
+    """
+    Grabacion de una corrida del motor de simulacion
+    """
+
+    def __init__(self, intervalo_checkpoint: int = 100, max_bytes_checkpoints: int = 64 * 1024 * 1024):
+        """
+        Inicializa la grabacion
+
+        Args:
+            intervalo_checkpoint: Cada cuantos ticks se guarda el estado completo;
+                                  acota los ticks a repetir en cada salto
+            max_bytes_checkpoints: Al superarlo se descarta uno de cada dos checkpoints y
+                                   se duplica el intervalo (memoria acotada en corridas largas)
+        """
+        self.intervalo_checkpoint = intervalo_checkpoint
+        self.max_bytes_checkpoints = max_bytes_checkpoints
+        self.registros = bytearray()
+        self.tiempos_checkpoint = []  # ordenados, para busqueda binaria
+        self.checkpoints = []  # estado del motor serializado y comprimido
+        self.bytes_checkpoints = 0
+
+    @property
+    def total_ticks(self) -> int:
+        """Numero de ticks grabados"""
+        return len(self.registros) // REGISTRO_TICK.size
+
+    def guardar_checkpoint(self, motor):
+        """
+        Guarda el estado completo del motor en el tick actual
+        """
+        if self.tiempos_checkpoint and self.tiempos_checkpoint[-1] == motor.ciclo:
+            return
+
+        # Los logs se recortan y el historial de ejecucion se rehace con los registros
+        datos = serializar_motor(motor, recortar=True, nivel=1)
+
+        self.tiempos_checkpoint.append(motor.ciclo)
+        self.checkpoints.append(datos)
+        self.bytes_checkpoints += len(datos)
+
+        while self.bytes_checkpoints > self.max_bytes_checkpoints and len(self.checkpoints) > 2:
+            self._ralear_checkpoints()
+
+    def _ralear_checkpoints(self):
+        """
+        Conserva solo los checkpoints multiplos del doble del intervalo actual
+        """
+        self.intervalo_checkpoint *= 2
+        conservados = [(t, c) for t, c in zip(self.tiempos_checkpoint, self.checkpoints)
+                       if t % self.intervalo_checkpoint == 0]
+        self.tiempos_checkpoint = [t for t, _ in conservados]
+        self.checkpoints = [c for _, c in conservados]
+        self.bytes_checkpoints = sum(len(c) for c in self.checkpoints)
+
+    def iniciar(self, motor):
+        """
+        Checkpoint inicial de la corrida
+        """
+        self.guardar_checkpoint(motor)
+
+    def finalizar(self, motor):
+        """
+        Checkpoint final: saltar al ultimo tick no requiere repetir
+        """
+        self.guardar_checkpoint(motor)
+
+    def registrar(self, motor):
+        """
+        Anade el registro del tick recien ejecutado (y un checkpoint si corresponde)
+        """
+        planificador = motor.planificador
+        historial = planificador.historial_ejecucion
+        ejecutado = historial[-1][1] if historial and historial[-1][0] == planificador.tiempo_actual else -1
+        self.registros += REGISTRO_TICK.pack(
+            ejecutado,
+            len(planificador.cola_listos),
+            len(planificador.cola_bloqueados),
+            motor.gestor_memoria.fallos_pagina
+        )
+        if motor.ciclo % self.intervalo_checkpoint == 0:
+            self.guardar_checkpoint(motor)
+
+    def registro(self, tick: int) -> tuple:
+        """
+        Devuelve (pid ejecutado, listos, bloqueados, fallos) del tick indicado (1..total_ticks)
+        """
+        return REGISTRO_TICK.unpack_from(self.registros, (tick - 1) * REGISTRO_TICK.size)
+
+    def restaurar(self, tick: int, con_historial: bool = True):
+        """
+        Reconstruye el motor en el tick indicado
+
+        Args:
+            tick: Tiempo al que se quiere saltar
+            con_historial: Rehacer el historial de ejecucion (Gantt); la linea de
+                           tiempo no lo necesita y en corridas largas es lo mas costoso
+
+        Returns:
+            MotorSimulacion independiente con el estado de ese tick
+        """
+        if not self.checkpoints:
+            raise ValueError("La grabacion no tiene checkpoints")
+        tick = max(0, min(tick, self.total_ticks))
+
+        indice = max(0, bisect.bisect_right(self.tiempos_checkpoint, tick) - 1)
+        motor = deserializar_motor(self.checkpoints[indice])
+        if con_historial:
+            historial = motor.planificador.historial_vacio()
+            historial.extend(self.historial_hasta(motor.ciclo))
+            motor.planificador.historial_ejecucion = historial
+
+        # Repetir hacia adelante como mucho intervalo_checkpoint ticks
+        while motor.ciclo < tick:
+            motor.ejecutar_tick()
+        return motor
+
+    def historial_hasta(self, tick: int) -> list:
+        """
+        Reconstruye el historial de ejecucion [(tiempo, pid)] hasta el tick indicado
+        """
+        vista = memoryview(self.registros)[:tick * REGISTRO_TICK.size]
+        return [(tiempo, registro[0])
+                for tiempo, registro in enumerate(REGISTRO_TICK.iter_unpack(vista), start=1)
+                if registro[0] >= 0]
+
+    def a_bytes(self) -> bytes:
+        """
+        Serializa la grabacion en un formato binario versionado
+        """
+        partes = [CABECERA.pack(FIRMA, VERSION, HUELLA_ESTADO, self.intervalo_checkpoint,
+                                self.total_ticks, len(self.checkpoints)),
+                  bytes(self.registros)]
+        for tiempo, datos in zip(self.tiempos_checkpoint, self.checkpoints):
+            partes.append(struct.pack('<II', tiempo, len(datos)))
+            partes.append(datos)
+        return b''.join(partes)
+
+    @classmethod
+    def desde_bytes(cls, datos: bytes) -> 'Grabacion':
+        """
+        Reconstruye una grabacion serializada con a_bytes
+        """
+        if len(datos) < CABECERA.size:
+            raise ValueError("Grabacion incompleta")
+        firma, version, huella, intervalo, ticks, num_checkpoints = CABECERA.unpack_from(datos, 0)
+        if firma != FIRMA or version != VERSION:
+            raise ValueError(f"Formato de grabacion no soportado: {firma!r} v{version}")
+        if huella != HUELLA_ESTADO:
+            raise ValueError("Grabacion con otra disposicion de clases del simulador")
+
+        grabacion = cls(intervalo)
+        posicion = CABECERA.size
+        fin_registros = posicion + ticks * REGISTRO_TICK.size
+        grabacion.registros = bytearray(datos[posicion:fin_registros])
+        posicion = fin_registros
+
+        for _ in range(num_checkpoints):
+            tiempo, longitud = struct.unpack_from('<II', datos, posicion)
+            posicion += 8
+            grabacion.tiempos_checkpoint.append(tiempo)
+            grabacion.checkpoints.append(datos[posicion:posicion + longitud])
+            grabacion.bytes_checkpoints += longitud
+            posicion += longitud
+        grabacion.max_bytes_checkpoints = max(grabacion.max_bytes_checkpoints, grabacion.bytes_checkpoints)
+        return grabacion
+
+    def guardar(self, ruta: str):
+        """Escribe la grabacion en un archivo"""
+        with open(ruta, 'wb') as archivo:
+            archivo.write(self.a_bytes())
+
+    @classmethod
+    def cargar(cls, ruta: str) -> 'Grabacion':
+        """Lee una grabacion escrita con guardar"""
+        with open(ruta, 'rb') as archivo:
+            return cls.desde_bytes(archivo.read())
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Obtiene estadisticas de la grabacion
+        """
+        return {
+            'ticks': self.total_ticks,
+            'checkpoints': len(self.checkpoints),
+            'intervalo_checkpoint': self.intervalo_checkpoint,
+            'bytes_registros': len(self.registros),
+            'bytes_checkpoints': self.bytes_checkpoints
+        }
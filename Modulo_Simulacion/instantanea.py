@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Modulo de Simulacion - Instantaneas inmutables del estado
+Permiten que la interfaz dibuje sin tocar los objetos vivos del motor
+"""
+
+import copyreg
+import threading
+from types import MappingProxyType
+from typing import NamedTuple, Mapping, Optional
+
+
+class Instantanea(NamedTuple):
+    """
+    Estado compacto e inmutable del sistema en un tick
+    """
+    tiempo: int
+    cpu: Optional[str]
+    listos: tuple
+    bloqueados: tuple
+    marcos: tuple  # id de proceso por marco (None = libre)
+    algoritmo_memoria: str
+    estadisticas_memoria: Mapping
+    estadisticas_archivos: Mapping
+    vista_archivos: str
+
+
+def solo_lectura(diccionario: dict) -> Mapping:
+    """
+    Envuelve un diccionario recien creado en una vista de solo lectura
+    """
+    return MappingProxyType(dict(diccionario))
+
+
+# Las vistas de solo lectura no se pueden serializar por defecto; se envian como
+# diccionario y se vuelven a envolver al recibirlas (motor en otro proceso)
+copyreg.pickle(MappingProxyType, lambda vista: (solo_lectura, (dict(vista),)))
+
+
+class BuzonInstantaneas:
+    """
+    Buzon de una sola posicion: la ultima instantanea publicada reemplaza a las anteriores
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._instantanea = None
+        self.publicadas = 0
+        self.descartadas = 0
+
+    def publicar(self, instantanea: Instantanea):
+        """
+        Publica una instantanea (la anterior, si nadie la leyo, se descarta)
+        """
+        with self._lock:
+            if self._instantanea is not None:
+                self.descartadas += 1
+            self._instantanea = instantanea
+            self.publicadas += 1
+
+    def tomar(self) -> Optional[Instantanea]:
+        """
+        Devuelve la ultima instantanea pendiente y vacia el buzon
+        """
+        with self._lock:
+            instantanea = self._instantanea
+            self._instantanea = None
+            return instantanea
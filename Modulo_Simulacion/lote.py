@@ -0,0 +1,451 @@
+# -*- coding: utf-8 -*-
+"""
+Modulo de Simulacion - Clase MotorLote
+Corre miles de simulaciones Round Robin independientes (una por semilla) a la
+vez: el estado vive en arreglos NumPy (una fila por simulacion) y cada tick
+avanza todas las filas con operaciones vectorizadas
+"""
+
+import random
+import sys
+import os
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: solo lo necesita el motor por lotes
+    np = None
+
+# Anadir el directorio padre al path para importar modulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Modulo_Procesos.proceso import Proceso
+from Modulo_Procesos.semillas import derivar_semilla
+
+
+# Estados de proceso codificados como enteros
+NUEVO, LISTO, EJECUTANDO, TERMINADO = 0, 1, 2, 3
+
+# Mersenne Twister (MT19937), el generador de random.Random
+MT_N = 624
+MT_M = 397
+
+
+def _torsion(mt):
+    """
+    Regenera los 624 enteros de estado de cada fila (mt: arreglo (filas, 624) uint32)
+    """
+    mt = mt.copy()
+    superior = np.uint32(0x80000000)
+    inferior = np.uint32(0x7fffffff)
+    matriz = np.uint32(0x9908b0df)
+    uno = np.uint32(1)
+    # Por tramos: cada uno solo lee valores ya regenerados o todavia originales
+    for desde, hasta in ((0, MT_N - MT_M), (MT_N - MT_M, 2 * (MT_N - MT_M)), (2 * (MT_N - MT_M), MT_N - 1)):
+        y = (mt[:, desde:hasta] & superior) | (mt[:, desde + 1:hasta + 1] & inferior)
+        origen = np.arange(desde, hasta) + MT_M - MT_N * (desde >= MT_N - MT_M)
+        mt[:, desde:hasta] = mt[:, origen] ^ (y >> uno) ^ ((y & uno) * matriz)
+    y = (mt[:, MT_N - 1] & superior) | (mt[:, 0] & inferior)
+    mt[:, MT_N - 1] = mt[:, MT_M - 1] ^ (y >> uno) ^ ((y & uno) * matriz)
+    return mt
+
+
+def _templar(y):
+    """
+    Salida de 32 bits del Mersenne Twister a partir de un entero de estado
+    """
+    y = y ^ (y >> np.uint32(11))
+    y = y ^ ((y << np.uint32(7)) & np.uint32(0x9d2c5680))
+    y = y ^ ((y << np.uint32(15)) & np.uint32(0xefc60000))
+    return y ^ (y >> np.uint32(18))
+
+
+class MotorLote:
+    """
+    Simulaciones RR + memoria FIFO/LRU por lotes, una por semilla
+
+    Cada fila reproduce exactamente lo que haria MotorSimulacion(algoritmo='RR',
+    semilla=s) con la misma carga: mismo orden de cola, mismos cambios de
+    contexto, mismas paginas elegidas por GestorMemoria (el generador de cada
+    fila replica el de la memoria, sembrado con la semilla derivada de s) y
+    mismos marcos reemplazados. Los procesos no pueden usar archivos: el lote
+    no simula I/O ni bloqueos.
+    """
+
+    def __init__(self, procesos, semillas, quantum: int = 3, algoritmo_memoria: str = 'FIFO',
+                 marcos_totales: int = 6, registrar_historial: bool = False):
+        """
+        Inicializa el lote
+
+        Args:
+            procesos: Lista de procesos comun a todas las simulaciones, una lista
+                      por semilla, o funcion semilla -> lista de procesos
+            semillas: Semillas enteras, una por simulacion (memoria y, si procesos
+                      es una funcion, tambien la carga)
+            quantum: Quantum de Round Robin
+            algoritmo_memoria: 'FIFO' o 'LRU'
+            marcos_totales: Marcos de memoria fisica de cada simulacion
+            registrar_historial: Guardar el proceso en CPU de cada tick (Gantt)
+        """
+        if np is None:
+            raise ImportError("El motor por lotes requiere NumPy (pip install numpy)")
+        self.algoritmo_memoria = algoritmo_memoria.upper()
+        if self.algoritmo_memoria not in ('FIFO', 'LRU'):
+            raise ValueError(f"Algoritmo de reemplazo desconocido: {algoritmo_memoria}")
+
+        self.semillas = [int(s) for s in semillas]
+        if callable(procesos):
+            cargas = [procesos(s) for s in self.semillas]
+        elif procesos and not isinstance(procesos[0], Proceso):
+            cargas = [list(c) for c in procesos]
+        else:
+            cargas = [procesos] * len(self.semillas)
+        if len(cargas) != len(self.semillas):
+            raise ValueError("Se necesita una carga por semilla")
+        if len({len(c) for c in cargas}) > 1:
+            raise ValueError("Todas las simulaciones deben tener la misma cantidad de procesos")
+        for carga in cargas:
+            for p in carga:
+                if p.archivos_necesarios:
+                    raise ValueError(f"P{p.id} usa archivos: el motor por lotes no simula I/O")
+                if p.memoria_requerida < 1:
+                    raise ValueError(f"P{p.id} debe requerir al menos una pagina")
+
+        S = len(self.semillas)
+        P = len(cargas[0]) if cargas else 0
+        self.simulaciones = S
+        self.cantidad_procesos = P
+        self.quantum = quantum
+        self.marcos_totales = marcos_totales
+        filas = np.arange(S)
+        self.filas = filas
+
+        # Procesos: una columna por proceso, en el orden de la lista
+        def columna(atributo):
+            return np.array([[getattr(p, atributo) for p in c] for c in cargas], dtype=np.int64).reshape(S, P)
+        self.ids = columna('id')
+        self.llegada = columna('tiempo_llegada')
+        self.restante = columna('duracion_total')
+        self.memoria = columna('memoria_requerida')
+        self.estado = np.full((S, P), NUEVO, dtype=np.int8)
+        self.espera = np.zeros((S, P), dtype=np.int64)
+        self.inicio = np.full((S, P), -1, dtype=np.int64)
+        self.fin = np.full((S, P), -1, dtype=np.int64)
+        self.asignada = np.zeros((S, P), dtype=bool)
+        # Primera pagina de cada proceso (las paginas de un proceso son contiguas)
+        self.primera_pagina = np.cumsum(self.memoria, axis=1) - self.memoria
+
+        # Cola de listos: anillo de P posiciones por simulacion
+        self.cola = np.zeros((S, P), dtype=np.int64)
+        self.cabeza = np.zeros(S, dtype=np.int64)
+        self.largo = np.zeros(S, dtype=np.int64)
+        self.actual = np.full(S, -1, dtype=np.int64)
+        self.quantum_restante = np.zeros(S, dtype=np.int64)
+        self.pendientes = np.full(S, P, dtype=np.int64)
+
+        # Memoria: pagina, proceso dueno y tiempos de cada marco; marco de cada pagina
+        paginas = int(self.memoria.sum(axis=1).max()) if S and P else 0
+        self.marco_pagina = np.full((S, marcos_totales), -1, dtype=np.int64)
+        self.marco_dueno = np.full((S, marcos_totales), -1, dtype=np.int64)
+        self.marco_carga = np.zeros((S, marcos_totales), dtype=np.int64)
+        self.marco_acceso = np.zeros((S, marcos_totales), dtype=np.int64)
+        self.pagina_marco = np.full((S, paginas), -1, dtype=np.int64)
+
+        # Contadores por simulacion
+        self.tiempo = np.zeros(S, dtype=np.int64)
+        self.ciclo = 0
+        self.cambios_contexto = np.zeros(S, dtype=np.int64)
+        self.completados = np.zeros(S, dtype=np.int64)
+        self.espera_acumulada = np.zeros(S, dtype=np.int64)
+        self.retorno_acumulado = np.zeros(S, dtype=np.int64)
+        self.fallos_pagina = np.zeros(S, dtype=np.int64)
+        self.accesos = np.zeros(S, dtype=np.int64)
+        self.reemplazos = np.zeros(S, dtype=np.int64)
+        self.marcos_liberados = np.zeros(S, dtype=np.int64)
+        self.procesos_liberados = np.zeros(S, dtype=np.int64)
+
+        # Estado del Mersenne Twister de cada fila, igual al del GestorMemoria del motor
+        estados = [random.Random(derivar_semilla(s, 'memoria')).getstate()[1] for s in self.semillas]
+        self.mt = np.array([e[:MT_N] for e in estados], dtype=np.uint32).reshape(S, MT_N)
+        self.mt_indice = np.array([e[MT_N] for e in estados], dtype=np.int64).reshape(S)
+
+        self.historial = [] if registrar_historial else None
+
+        # Los procesos que llegan en t=0 entran a la cola al agregarse
+        self._verificar_llegadas(filas)
+
+    # ------------------------------------------------------------------ cola
+    def _encolar(self, filas, procesos):
+        """
+        Agrega procesos al final de la cola (a lo sumo uno por fila)
+        """
+        P = self.cantidad_procesos
+        self.cola[filas, (self.cabeza[filas] + self.largo[filas]) % P] = procesos
+        self.largo[filas] += 1
+        self.estado[filas, procesos] = LISTO
+
+    def _verificar_llegadas(self, filas):
+        """
+        Pasa a LISTO los procesos NUEVO cuya llegada ya ocurrio, en orden de lista
+        """
+        if not self.cantidad_procesos or not filas.size:
+            return
+        llegan = (self.estado[filas] == NUEVO) & (self.llegada[filas] <= self.tiempo[filas, None])
+        fila_idx, procesos = np.nonzero(llegan)
+        if not fila_idx.size:
+            return
+        filas_llegada = filas[fila_idx]
+        orden = np.cumsum(llegan, axis=1)[fila_idx, procesos] - 1
+        posiciones = (self.cabeza[filas_llegada] + self.largo[filas_llegada] + orden) % self.cantidad_procesos
+        self.cola[filas_llegada, posiciones] = procesos
+        self.estado[filas_llegada, procesos] = LISTO
+        self.largo[filas] += llegan.sum(axis=1)
+
+    # --------------------------------------------------------------- memoria
+    def _cargar(self, filas, paginas, duenos):
+        """
+        Carga una pagina por fila en un marco libre o reemplazando (FIFO/LRU)
+        """
+        libres = self.marco_pagina[filas] < 0
+        hay_libre = libres.any(axis=1)
+        clave = self.marco_carga if self.algoritmo_memoria == 'FIFO' else self.marco_acceso
+        # argmin devuelve el primer minimo, como el recorrido de marcos de GestorMemoria
+        marcos = np.where(hay_libre, libres.argmax(axis=1), clave[filas].argmin(axis=1))
+
+        reemplazo = ~hay_libre
+        if reemplazo.any():
+            f, m = filas[reemplazo], marcos[reemplazo]
+            self.pagina_marco[f, self.marco_pagina[f, m]] = -1
+            self.reemplazos[f] += 1
+
+        t = self.tiempo[filas]
+        self.marco_pagina[filas, marcos] = paginas
+        self.marco_dueno[filas, marcos] = duenos
+        self.marco_carga[filas, marcos] = t
+        self.marco_acceso[filas, marcos] = t
+        self.pagina_marco[filas, paginas] = marcos
+        self.fallos_pagina[filas] += 1
+
+    def _asignar_memoria(self, filas):
+        """
+        Crea las paginas de los listos sin memoria y carga la primera, en orden de cola
+        """
+        sin_memoria = (self.estado[filas] == LISTO) & ~self.asignada[filas]
+        filas = filas[sin_memoria.any(axis=1)]
+        if not filas.size:
+            return
+
+        P = self.cantidad_procesos
+        desplazamiento = np.arange(P)
+        en_cola = self.cola[filas[:, None], (self.cabeza[filas, None] + desplazamiento) % P]
+        candidatos = (desplazamiento < self.largo[filas, None]) & ~self.asignada[filas[:, None], en_cola]
+        orden = np.cumsum(candidatos, axis=1) - 1
+        # Una carga por fila y vuelta: la k-esima vuelta asigna el k-esimo de cada cola
+        for k in range(int(candidatos.sum(axis=1).max())):
+            fila_idx, posicion = np.nonzero(candidatos & (orden == k))
+            f = filas[fila_idx]
+            procesos = en_cola[fila_idx, posicion]
+            self.asignada[f, procesos] = True
+            self._cargar(f, self.primera_pagina[f, procesos], procesos)
+
+    def _liberar_memoria(self, filas, procesos):
+        """
+        Libera los marcos de los procesos que terminaron (uno por fila)
+        """
+        propios = self.marco_dueno[filas] == procesos[:, None]
+        marco_pagina = self.marco_pagina[filas]
+        marco_dueno = self.marco_dueno[filas]
+        marco_pagina[propios] = -1
+        marco_dueno[propios] = -1
+        self.marco_pagina[filas] = marco_pagina
+        self.marco_dueno[filas] = marco_dueno
+        self.marcos_liberados[filas] += propios.sum(axis=1)
+        self.procesos_liberados[filas] += self.asignada[filas, procesos]
+
+    def _palabras(self, filas):
+        """
+        Siguiente salida de 32 bits del generador de cada fila (filas sin repetir)
+        """
+        agotadas = filas[self.mt_indice[filas] >= MT_N]
+        if agotadas.size:
+            self.mt[agotadas] = _torsion(self.mt[agotadas])
+            self.mt_indice[agotadas] = 0
+        palabras = _templar(self.mt[filas, self.mt_indice[filas]])
+        self.mt_indice[filas] += 1
+        return palabras
+
+    def _elegir(self, filas, cantidades):
+        """
+        Indice en [0, cantidad) por fila, igual que GestorMemoria.acceder_memoria
+        (una salida de 32 bits por acceso, llevada al rango con (x * n) >> 32)
+        """
+        return (self._palabras(filas).astype(np.int64) * cantidades) >> 32
+
+    def _acceder_memoria(self, filas, procesos):
+        """
+        Acceso a una pagina aleatoria de cada proceso en CPU (con fallo si no esta cargada)
+        """
+        con_paginas = self.asignada[filas, procesos]
+        filas, procesos = filas[con_paginas], procesos[con_paginas]
+        if not filas.size:
+            return
+        self.accesos[filas] += 1
+        paginas = self.primera_pagina[filas, procesos] + self._elegir(filas, self.memoria[filas, procesos])
+        marcos = self.pagina_marco[filas, paginas]
+        cargada = marcos >= 0
+        self.marco_acceso[filas[cargada], marcos[cargada]] = self.tiempo[filas[cargada]]
+        if not cargada.all():
+            self._cargar(filas[~cargada], paginas[~cargada], procesos[~cargada])
+
+    # ---------------------------------------------------------------- ciclo
+    def activas(self):
+        """
+        Mascara de las simulaciones con procesos sin terminar
+        """
+        return self.pendientes > 0
+
+    def ejecutar_tick(self) -> bool:
+        """
+        Ejecuta un tick en todas las simulaciones activas
+
+        Returns:
+            False si ya no quedaba ninguna activa
+        """
+        filas = np.flatnonzero(self.activas())
+        if not filas.size:
+            return False
+        self.ciclo += 1
+
+        self._asignar_memoria(filas)
+
+        # Ciclo del planificador: avanza el reloj y entran las llegadas
+        self.tiempo[filas] += 1
+        self._verificar_llegadas(filas)
+
+        # Round Robin
+        actual = self.actual[filas]
+        ninguno = (self.largo[filas] == 0) & (actual < 0)
+        cambio = ~ninguno & ~((actual >= 0) & (self.quantum_restante[filas] > 0))
+        expulsados = filas[cambio & (actual >= 0)]
+        previos = self.actual[expulsados]
+        if expulsados.size:
+            self._encolar(expulsados, previos)
+        entran = filas[cambio]
+        if entran.size:
+            procesos = self.cola[entran, self.cabeza[entran]]
+            self.cabeza[entran] = (self.cabeza[entran] + 1) % self.cantidad_procesos
+            self.largo[entran] -= 1
+            self.estado[entran, procesos] = EJECUTANDO
+            sin_inicio = self.inicio[entran, procesos] < 0
+            self.inicio[entran[sin_inicio], procesos[sin_inicio]] = self.tiempo[entran[sin_inicio]]
+            self.actual[entran] = procesos
+            self.quantum_restante[entran] = self.quantum
+        # Solo hay cambio de contexto si entra un proceso distinto al expulsado
+        self.cambios_contexto[expulsados] += self.actual[expulsados] != previos
+
+        ejecutan = filas[~ninguno]
+        procesos = self.actual[ejecutan]
+        if self.historial is not None:
+            en_cpu = np.full(self.simulaciones, -1, dtype=np.int64)
+            en_cpu[ejecutan] = self.ids[ejecutan, procesos]
+            self.historial.append(en_cpu)
+
+        self.restante[ejecutan, procesos] -= 1
+        self.quantum_restante[ejecutan] -= 1
+        self.espera[ejecutan] += self.estado[ejecutan] == LISTO
+
+        termina = self.restante[ejecutan, procesos] == 0
+        if termina.any():
+            f, p = ejecutan[termina], procesos[termina]
+            self.estado[f, p] = TERMINADO
+            self._liberar_memoria(f, p)
+            self.fin[f, p] = self.tiempo[f]
+            self.espera_acumulada[f] += self.espera[f, p]
+            self.retorno_acumulado[f] += self.tiempo[f] - self.llegada[f, p]
+            self.completados[f] += 1
+            self.pendientes[f] -= 1
+            self.actual[f] = -1
+            self.quantum_restante[f] = 0
+
+        # Acceso a memoria del proceso que sigue en CPU
+        self._acceder_memoria(ejecutan[~termina], procesos[~termina])
+        return True
+
+    def correr(self, max_ciclos: int = 1000) -> int:
+        """
+        Avanza hasta que terminen todas las simulaciones o se alcance max_ciclos
+
+        Returns:
+            Ticks ejecutados
+        """
+        while self.ciclo < max_ciclos and self.ejecutar_tick():
+            pass
+        return self.ciclo
+
+    # ------------------------------------------------------------ resultados
+    def resultados(self, indice: int) -> dict:
+        """
+        Metricas de una simulacion, con las mismas claves que
+        Planificador.calcular_metricas y GestorMemoria.obtener_estadisticas
+        """
+        completados = int(self.completados[indice])
+        metricas = {
+            'tiempo_espera_total': 0,
+            'tiempo_retorno_total': 0,
+            'cambios_contexto': int(self.cambios_contexto[indice]),
+            'procesos_completados': completados
+        }
+        if completados:
+            metricas['tiempo_espera_promedio'] = round(int(self.espera_acumulada[indice]) / completados, 2)
+            metricas['tiempo_retorno_promedio'] = round(int(self.retorno_acumulado[indice]) / completados, 2)
+
+        ocupados = int((self.marco_pagina[indice] >= 0).sum())
+        fallos = int(self.fallos_pagina[indice])
+        accesos = int(self.accesos[indice])
+        memoria = {
+            'marcos_totales': self.marcos_totales,
+            'marcos_ocupados': ocupados,
+            'marcos_libres': self.marcos_totales - ocupados,
+            'fallos_pagina': fallos,
+            'reemplazos': int(self.reemplazos[indice]),
+            'accesos': accesos,
+            'tasa_fallos': round(100 * fallos / accesos, 2) if accesos else 0,
+            'marcos_liberados': int(self.marcos_liberados[indice]),
+            'algoritmo': self.algoritmo_memoria,
+            'modelo_referencias': 'UNIFORME'
+        }
+        return {'semilla': self.semillas[indice], 'tiempo': int(self.tiempo[indice]),
+                'metricas': metricas, 'memoria': memoria}
+
+    def historial_ejecucion(self, indice: int) -> list:
+        """
+        [(tiempo, id_proceso)] de una simulacion, como Planificador.historial_ejecucion
+        """
+        if self.historial is None:
+            raise ValueError("El lote se creo sin registrar_historial")
+        return [(tick + 1, int(en_cpu[indice])) for tick, en_cpu in enumerate(self.historial)
+                if en_cpu[indice] >= 0]
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Resumen del lote: media y desviacion de cada metrica entre las simulaciones
+        """
+        completados = np.maximum(self.completados, 1)
+        series = {
+            'tiempo_espera_promedio': self.espera_acumulada / completados,
+            'tiempo_retorno_promedio': self.retorno_acumulado / completados,
+            'cambios_contexto': self.cambios_contexto,
+            'fallos_pagina': self.fallos_pagina,
+            'reemplazos': self.reemplazos,
+            'tiempo': self.tiempo
+        }
+        estadisticas = {
+            'simulaciones': self.simulaciones,
+            'terminadas': int((~self.activas()).sum()),
+            'ciclos': self.ciclo,
+            'algoritmo_memoria': self.algoritmo_memoria
+        }
+        for nombre, valores in series.items():
+            estadisticas[nombre] = {
+                'media': round(float(valores.mean()), 3) if self.simulaciones else 0,
+                'desviacion': round(float(valores.std()), 3) if self.simulaciones else 0
+            }
+        return estadisticas
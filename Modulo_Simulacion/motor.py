@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+"""
+Modulo de Simulacion - Clase MotorSimulacion
+Ejecuta el ciclo de simulacion sin depender de la interfaz grafica
+"""
+
+from typing import Callable, Optional
+import sys
+import os
+import time
+
+# Anadir el directorio padre al path para importar modulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Modulo_Procesos.planificador import Planificador
+from Modulo_Procesos.semillas import derivar_semilla
+from Modulo_Memoria.gestorMemoria import GestorMemoria
+from Modulo_Archivos.gestorArchivos import GestorArchivos, TICKS_SECCION_CRITICA
+from Modulo_Archivos.disco import Disco
+from Modulo_Archivos.cache import CacheBloques
+from Modulo_Simulacion.instantanea import Instantanea, solo_lectura
+
+
+ARCHIVOS_EJEMPLO = ['config.txt', 'data.db', 'log.txt', 'temp.txt']
+ARCHIVOS_ESCRITURA_EJEMPLO = ['log.txt', 'temp.txt']
+
+# Limite de ticks por corrida cuando no se indica otro
+MAX_CICLOS = 1000
+
+
+class MotorSimulacion:
+    """
+    Motor de simulacion: agrupa planificador, memoria y archivos y avanza tick a tick
+    """
+
+    def __init__(self, algoritmo: str = 'RR', quantum: int = 3, algoritmo_memoria: str = 'FIFO',
+                 marcos_totales: int = 6, algoritmo_disco: str = 'FCFS',
+                 protocolo_prioridad: Optional[str] = None, archivos: Optional[list] = None,
+                 archivos_escritura: Optional[list] = None, capacidad_cache: int = 16,
+                 politica_cache: str = 'LRU', max_archivos_vista: int = 50,
+                 semilla: Optional[int] = None, conservar_terminados: bool = True,
+                 modelo_referencias='UNIFORME', admision: str = 'NINGUNA',
+                 grado_multiprogramacion: Optional[int] = None,
+                 ticks_seccion_critica: int = TICKS_SECCION_CRITICA):
+        """
+        Inicializa los componentes del sistema
+
+        Args:
+            semilla: Semilla de la corrida; la memoria usa su propia semilla derivada
+            modelo_referencias: Modelo de accesos a memoria (ver MODELOS_REFERENCIAS)
+            admision: Politica de admision de Planificador ('NINGUNA', 'MARCOS', 'CONJUNTO')
+            grado_multiprogramacion: Maximo de procesos admitidos a la vez (None = sin limite)
+            ticks_seccion_critica: Ticks de CPU que un proceso conserva su archivo tras la I/O
+        """
+        archivos = ARCHIVOS_EJEMPLO if archivos is None else archivos
+        archivos_escritura = ARCHIVOS_ESCRITURA_EJEMPLO if archivos_escritura is None else archivos_escritura
+
+        self.gestor_memoria = GestorMemoria(marcos_totales=marcos_totales,
+                                            algoritmo_reemplazo=algoritmo_memoria,
+                                            semilla=derivar_semilla(semilla, 'memoria'),
+                                            modelo_referencias=modelo_referencias)
+        self.gestor_archivos = GestorArchivos(archivos,
+                                              disco=Disco(algoritmo=algoritmo_disco),
+                                              cache=CacheBloques(capacidad=capacidad_cache, politica=politica_cache),
+                                              archivos_escritura=archivos_escritura,
+                                              protocolo_prioridad=protocolo_prioridad,
+                                              ticks_seccion_critica=ticks_seccion_critica)
+
+        # El planificador libera marcos y archivos en cuanto un proceso termina
+        self.planificador = Planificador(algoritmo=algoritmo, quantum=quantum,
+                                         gestor_archivos=self.gestor_archivos,
+                                         gestor_memoria=self.gestor_memoria,
+                                         conservar_terminados=conservar_terminados,
+                                         admision=admision,
+                                         grado_multiprogramacion=grado_multiprogramacion)
+
+        # Fuente opcional de procesos que se incorporan a medida que llegan
+        self.fuente = None
+        self.proximo_proceso = None
+
+        self.semilla = semilla
+        self.ciclo = 0
+        self.max_archivos_vista = max_archivos_vista
+
+    def agregar_procesos(self, procesos: list) -> list:
+        """
+        Registra procesos en el sistema; los archivos que no existen en el gestor
+        se quitan del proceso (si no, quedaria bloqueado esperandolos para siempre)
+
+        Returns:
+            Eventos de log [(mensaje, tipo)]
+        """
+        eventos = []
+        existe_archivo = self.gestor_archivos.existe_archivo
+        for proceso in procesos:
+            desconocidos = [a for a in proceso.archivos_necesarios if not existe_archivo(a)]
+            if desconocidos:
+                proceso.archivos_necesarios = [a for a in proceso.archivos_necesarios
+                                               if a not in desconocidos]
+                eventos.append((f"P{proceso.id}: se ignoran archivos inexistentes: {', '.join(desconocidos)}",
+                                "WARNING"))
+        self.gestor_archivos.calcular_techos(procesos)
+        for proceso in procesos:
+            self.planificador.agregar_proceso(proceso)
+            eventos.append((f"Proceso P{proceso.id} agregado - Duracion: {proceso.duracion_total}", "INFO"))
+        return eventos
+
+    def agregar_carga(self, carga) -> list:
+        """
+        Registra una lista de procesos de una vez o, si es otro iterable, como fuente perezosa
+
+        Returns:
+            Eventos de log [(mensaje, tipo)]
+        """
+        if isinstance(carga, list):
+            return self.agregar_procesos(carga)
+        self.agregar_fuente(carga)
+        return []
+
+    def agregar_fuente(self, fuente):
+        """
+        Registra una fuente de procesos (iterable ordenado por tiempo de llegada,
+        p. ej. GeneradorCarga) que se consume de a uno a medida que avanza el tiempo
+
+        Para poder guardar checkpoints la fuente debe ser serializable con pickle.
+        Si la fuente sabe que archivos usa (nombres_archivos(), como LectorTraza)
+        se dan de alta antes de empezar.
+        """
+        if hasattr(fuente, 'nombres_archivos'):
+            self.gestor_archivos.registrar_archivos(fuente.nombres_archivos())
+        self.fuente = iter(fuente)
+        self.proximo_proceso = next(self.fuente, None)
+
+    def alimentar_llegadas(self) -> list:
+        """
+        Incorpora los procesos de la fuente que llegan hasta el proximo tick
+
+        Returns:
+            Eventos de log [(mensaje, tipo)]
+        """
+        eventos = []
+        limite = self.planificador.tiempo_actual + 1
+        while self.proximo_proceso is not None and self.proximo_proceso.tiempo_llegada <= limite:
+            eventos.extend(self.agregar_procesos([self.proximo_proceso]))
+            self.proximo_proceso = next(self.fuente, None)
+        return eventos
+
+    def hay_procesos_activos(self) -> bool:
+        """
+        Verifica si aun quedan procesos por terminar (o por llegar desde la fuente)
+        """
+        return self.proximo_proceso is not None or self.planificador.hay_procesos_activos()
+
+    def ejecutar_tick(self) -> list:
+        """
+        Ejecuta un tick completo de la simulacion
+
+        Returns:
+            Eventos de log [(mensaje, tipo)] producidos en el tick
+        """
+        self.ciclo += 1
+        eventos = self.alimentar_llegadas() if self.fuente is not None else []
+        planificador = self.planificador
+        gestor_memoria = self.gestor_memoria
+        gestor_archivos = self.gestor_archivos
+
+        # Sincronizar tiempos
+        gestor_memoria.tiempo_actual = planificador.tiempo_actual
+        gestor_archivos.tiempo_actual = planificador.tiempo_actual
+
+        # Verificar llegadas
+        planificador.verificar_llegadas()
+
+        # Asignar memoria
+        for proceso in list(planificador.cola_listos):
+            if proceso.id not in gestor_memoria.tabla_paginas:
+                gestor_memoria.asignar_memoria(proceso)
+
+        # Ejecutar ciclo
+        if planificador.ejecutar_ciclo():
+            proceso_actual = planificador.proceso_actual
+
+            if proceso_actual:
+                gestor_memoria.acceder_memoria(proceso_actual)
+
+                # I/O
+                if proceso_actual.necesita_io():
+                    archivo_necesario = proceso_actual.obtener_archivo_actual()
+
+                    if archivo_necesario:
+                        if gestor_archivos.solicitar_acceso(proceso_actual, archivo_necesario):
+                            # Queda bloqueado hasta que el disco complete la peticion
+                            gestor_archivos.iniciar_io(proceso_actual, archivo_necesario)
+                            planificador.bloquear_proceso(proceso_actual)
+                            eventos.append((f"P{proceso_actual.id} solicita I/O en {archivo_necesario}", "INFO"))
+                        else:
+                            proceso_actual.archivo_actual = archivo_necesario
+                            planificador.bloquear_proceso(proceso_actual)
+                            eventos.append((f"P{proceso_actual.id} bloqueado esperando {archivo_necesario}", "WARNING"))
+
+        # Avanzar el disco y devolver a listos los procesos con I/O completa
+        for proceso in gestor_archivos.avanzar_io(planificador):
+            eventos.append((f"P{proceso.id} completo I/O", "SUCCESS"))
+
+        # Verificar desbloqueos
+        gestor_archivos.verificar_desbloqueos_pendientes(planificador)
+
+        return eventos
+
+    def correr(self, control, max_ciclos: int, registrar: Callable, publicar: Callable,
+               continuar: Optional[Callable] = None, observadores: tuple = ()):
+        """
+        Bucle principal de la simulacion regulado por un ControlVelocidad
+
+        Args:
+            control: ControlVelocidad con el ritmo, la pausa y los pasos
+            max_ciclos: Limite de ticks de la corrida
+            registrar: Recibe la lista de eventos de cada tick
+            publicar: Recibe cada instantanea (a lo sumo una por cuadro, y la final)
+            continuar: Funcion opcional consultada antes de cada tick
+            observadores: Objetos con iniciar(motor), registrar(motor) y finalizar(motor)
+                          (Grabacion, SeriesTiempo) llamados al inicio, tras cada tick y al final
+        """
+        for observador in observadores:
+            observador.iniciar(self)
+
+        while self.hay_procesos_activos() and self.ciclo < max_ciclos and (continuar is None or continuar()):
+            # En pausa espera un paso, una reanudacion o la detencion
+            if not control.esperar_turno(self.planificador.tiempo_actual):
+                break
+            inicio_tick = time.monotonic()
+
+            registrar(self.ejecutar_tick())
+            for observador in observadores:
+                observador.registrar(self)
+
+            if control.debe_publicar(self.planificador.tiempo_actual):
+                publicar(self.tomar_instantanea())
+
+            control.esperar_fin_tick(inicio_tick)
+
+        for observador in observadores:
+            observador.finalizar(self)
+        publicar(self.tomar_instantanea())
+
+    def tomar_instantanea(self) -> Instantanea:
+        """
+        Copia compacta e inmutable del estado actual para la interfaz
+        """
+        planificador = self.planificador
+        gestor_memoria = self.gestor_memoria
+        gestor_archivos = self.gestor_archivos
+
+        proceso_actual = planificador.proceso_actual
+        muchos = len(gestor_archivos.archivos) > self.max_archivos_vista
+
+        return Instantanea(
+            tiempo=planificador.tiempo_actual,
+            cpu=str(proceso_actual) if proceso_actual else None,
+            listos=tuple(str(p) for p in planificador.cola_listos),
+            bloqueados=tuple(str(p) for p in planificador.cola_bloqueados),
+            marcos=tuple(gestor_memoria.propietario_marco(i) for i in range(gestor_memoria.marcos_totales)),
+            algoritmo_memoria=gestor_memoria.algoritmo_reemplazo,
+            estadisticas_memoria=solo_lectura(gestor_memoria.obtener_estadisticas()),
+            estadisticas_archivos=solo_lectura(gestor_archivos.obtener_estadisticas()),
+            vista_archivos=gestor_archivos.visualizar_estado(
+                solo_activos=muchos, tam_pagina=self.max_archivos_vista if muchos else None)
+        )
+
+    def resumen_final(self) -> dict:
+        """
+        Resultados finales de la corrida (datos independientes del motor)
+        """
+        return {
+            'metricas': dict(self.planificador.calcular_metricas()),
+            'memoria': self.gestor_memoria.obtener_estadisticas(),
+            'archivos': self.gestor_archivos.obtener_estadisticas(),
+            'gantt': self.planificador.generar_diagrama_gantt(),
+            'fuente': self.fuente.obtener_estadisticas() if hasattr(self.fuente, 'obtener_estadisticas') else {}
+        }
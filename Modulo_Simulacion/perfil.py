@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+Modulo de Simulacion - Clase Perfilador
+Instrumentacion opcional de las fases del ciclo (llegadas, seleccion, archivos,
+memoria, I/O y desbloqueos) con contadores de tiempo y llamadas, y con
+cProfile / tracemalloc a pedido
+"""
+
+import cProfile
+import functools
+import io
+import pstats
+import time
+import tracemalloc
+import sys
+import os
+
+# Anadir el directorio padre al path para importar modulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Modulo_Procesos.planificador import Planificador
+from Modulo_Memoria.gestorMemoria import GestorMemoria
+from Modulo_Archivos.gestorArchivos import GestorArchivos
+from Modulo_Simulacion.motor import MotorSimulacion
+
+
+# (fase, clase, metodo). Las fases se anidan: 'tick' contiene a las demas y
+# 'ciclo' (Planificador.ejecutar_ciclo) contiene 'llegadas' y 'seleccion'
+FASES = (
+    ('tick', MotorSimulacion, 'ejecutar_tick'),
+    ('ciclo', Planificador, 'ejecutar_ciclo'),
+    ('llegadas', Planificador, 'verificar_llegadas'),
+    ('seleccion', Planificador, 'seleccionar_siguiente'),
+    ('asignacion_memoria', GestorMemoria, 'asignar_memoria'),
+    ('acceso_memoria', GestorMemoria, 'acceder_memoria'),
+    ('liberacion_memoria', GestorMemoria, 'liberar_memoria'),
+    ('acceso_archivos', GestorArchivos, 'solicitar_acceso'),
+    ('liberacion_archivos', GestorArchivos, 'liberar_archivo'),
+    ('io', GestorArchivos, 'avanzar_io'),
+    ('desbloqueos', GestorArchivos, 'verificar_desbloqueos_pendientes'),
+)
+
+MODOS_PERFIL = ('NINGUNO', 'FASES', 'CPROFILE', 'TRACEMALLOC')
+
+
+def _medir(funcion, contador: list):
+    """
+    Envuelve un metodo acumulando [llamadas, segundos] en contador
+    """
+    reloj = time.perf_counter
+
+    @functools.wraps(funcion)
+    def medida(*args, **kwargs):
+        inicio = reloj()
+        try:
+            return funcion(*args, **kwargs)
+        finally:
+            contador[0] += 1
+            contador[1] += reloj() - inicio
+
+    return medida
+
+
+class Perfilador:
+    """
+    Perfilador de fases. Sin activar no hay ningun envoltorio: los metodos
+    originales se reemplazan en las clases solo entre activar() y desactivar()
+    """
+
+    _activo = None  # solo un perfilador a la vez (los envoltorios son por clase)
+
+    def __init__(self, usar_cprofile: bool = False, usar_tracemalloc: bool = False):
+        """
+        Inicializa el perfilador
+
+        Args:
+            usar_cprofile: Ademas de las fases, perfilar cada funcion con cProfile
+            usar_tracemalloc: Registrar las asignaciones de memoria con tracemalloc
+        """
+        self.usar_cprofile = usar_cprofile
+        self.usar_tracemalloc = usar_tracemalloc
+        self.contadores = {fase: [0, 0.0] for fase, _, _ in FASES}
+        self.tiempo_total = 0.0
+        self._originales = []
+        self._inicio = None
+        self._perfil = None
+        self._instantanea_memoria = None
+        self._pico_memoria = 0
+
+    def activar(self):
+        """
+        Instala los envoltorios y arranca cProfile / tracemalloc si se pidieron
+        """
+        if Perfilador._activo is not None:
+            raise RuntimeError("Ya hay un perfilador activo")
+        Perfilador._activo = self
+
+        for fase, clase, metodo in FASES:
+            original = clase.__dict__[metodo]
+            self._originales.append((clase, metodo, original))
+            setattr(clase, metodo, _medir(original, self.contadores[fase]))
+
+        if self.usar_tracemalloc:
+            tracemalloc.start()
+        if self.usar_cprofile:
+            self._perfil = cProfile.Profile()
+            self._perfil.enable()
+        self._inicio = time.perf_counter()
+
+    def desactivar(self):
+        """
+        Restaura los metodos originales y detiene los perfiladores
+        """
+        if Perfilador._activo is not self:
+            return
+        self.tiempo_total += time.perf_counter() - self._inicio
+
+        if self._perfil is not None:
+            self._perfil.disable()
+        if self.usar_tracemalloc:
+            self._instantanea_memoria = tracemalloc.take_snapshot()
+            self._pico_memoria = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        for clase, metodo, original in reversed(self._originales):
+            setattr(clase, metodo, original)
+        self._originales = []
+        Perfilador._activo = None
+
+    def __enter__(self):
+        self.activar()
+        return self
+
+    def __exit__(self, *_):
+        self.desactivar()
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Llamadas y tiempo acumulado (segundos) por fase
+        """
+        return {fase: {'llamadas': llamadas, 'tiempo': tiempo}
+                for fase, (llamadas, tiempo) in self.contadores.items()}
+
+    def reporte(self, limite: int = 15) -> str:
+        """
+        Genera un resumen legible de las fases y, si se usaron, de cProfile y tracemalloc
+        """
+        resultado = "\n" + "=" * 80 + "\n"
+        resultado += "PERFIL DE FASES DEL CICLO\n"
+        resultado += "=" * 80 + "\n"
+        resultado += f"  Tiempo total perfilado: {self.tiempo_total * 1000:.1f} ms\n\n"
+        resultado += f"  {'Fase':<22}{'Llamadas':>10}{'Total ms':>12}{'Media us':>12}{'% total':>10}\n"
+        resultado += "  " + "-" * 66 + "\n"
+
+        for fase, (llamadas, tiempo) in self.contadores.items():
+            media = tiempo / llamadas * 1e6 if llamadas else 0
+            porcentaje = tiempo / self.tiempo_total * 100 if self.tiempo_total else 0
+            resultado += f"  {fase:<22}{llamadas:>10}{tiempo * 1000:>12.2f}{media:>12.2f}{porcentaje:>9.1f}%\n"
+        resultado += "  (las fases se anidan: 'tick' incluye a las demas)\n"
+
+        if self._perfil is not None:
+            salida = io.StringIO()
+            pstats.Stats(self._perfil, stream=salida).sort_stats('cumulative').print_stats(limite)
+            resultado += "\n[cProfile]\n" + salida.getvalue()
+
+        if self._instantanea_memoria is not None:
+            resultado += f"\n[tracemalloc] Pico: {self._pico_memoria / 1024:.1f} KiB\n"
+            for estadistica in self._instantanea_memoria.statistics('lineno')[:limite]:
+                resultado += f"  {estadistica}\n"
+
+        resultado += "=" * 80 + "\n"
+        return resultado
+
+
+def crear_perfilador(modo: str):
+    """
+    Crea el perfilador para un modo de MODOS_PERFIL (None si es 'NINGUNO')
+    """
+    modo = (modo or 'NINGUNO').upper()
+    if modo not in MODOS_PERFIL:
+        raise ValueError(f"Modo de perfilado desconocido: {modo}")
+    if modo == 'NINGUNO':
+        return None
+    return Perfilador(usar_cprofile=modo == 'CPROFILE', usar_tracemalloc=modo == 'TRACEMALLOC')
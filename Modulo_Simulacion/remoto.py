@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Modulo de Simulacion - Clase MotorRemoto
+Ejecuta el motor en un proceso hijo (fuera del GIL de la interfaz) y se
+comunica con el por un Pipe: instantaneas y eventos hacia la interfaz,
+comandos de control hacia el motor
+"""
+
+import multiprocessing
+import threading
+import sys
+import os
+
+# Anadir el directorio padre al path para importar modulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Modulo_Simulacion.motor import MotorSimulacion, MAX_CICLOS
+from Modulo_Simulacion.control import ControlVelocidad
+from Modulo_Simulacion.grabacion import Grabacion
+from Modulo_Simulacion.series import SeriesTiempo
+from Modulo_Simulacion.perfil import crear_perfilador
+
+
+def _escuchar_comandos(conexion, control: ControlVelocidad):
+    """
+    Aplica en el proceso hijo los comandos enviados por la interfaz
+    """
+    while True:
+        try:
+            comando, argumento = conexion.recv()
+        except (EOFError, OSError):
+            # La interfaz se cerro: no tiene sentido seguir simulando
+            control.detener()
+            return
+
+        if comando == 'velocidad':
+            control.fijar_velocidad(argumento)
+        elif comando == 'pausar':
+            control.pausar()
+        elif comando == 'reanudar':
+            control.reanudar()
+        elif comando == 'paso':
+            control.paso(argumento)
+        elif comando == 'hasta':
+            control.ejecutar_hasta(argumento)
+        elif comando == 'detener':
+            control.detener()
+            return
+
+
+def ejecutar_motor_remoto(conexion, configuracion: dict, procesos: list,
+                          ticks_por_segundo: float, max_ciclos: int, perfilado: str = 'NINGUNO'):
+    """
+    Punto de entrada del proceso hijo
+    """
+    control = ControlVelocidad(ticks_por_segundo=ticks_por_segundo)
+    threading.Thread(target=_escuchar_comandos, args=(conexion, control), daemon=True).start()
+
+    # Los eventos se acumulan y viajan junto con la siguiente instantanea
+    eventos = []
+
+    def publicar(instantanea):
+        conexion.send(('estado', (eventos[:], instantanea, control.pausado)))
+        eventos.clear()
+
+    try:
+        motor = MotorSimulacion(**configuracion)
+        eventos.extend(motor.agregar_carga(procesos))
+        grabacion = Grabacion()
+        series = SeriesTiempo()
+        perfilador = crear_perfilador(perfilado)
+        if perfilador is not None:
+            perfilador.activar()
+        try:
+            motor.correr(control, max_ciclos, registrar=eventos.extend, publicar=publicar,
+                         observadores=(grabacion, series))
+        finally:
+            if perfilador is not None:
+                perfilador.desactivar()
+        conexion.send(('grabacion', grabacion))
+        conexion.send(('series', series))
+        conexion.send(('finalizar', motor.resumen_final()))
+        if perfilador is not None:
+            conexion.send(('perfil', perfilador.reporte()))
+    except Exception as e:
+        eventos.append((f"Error en simulacion: {str(e)}", "ERROR"))
+        conexion.send(('estado', (eventos[:], None, False)))
+    finally:
+        conexion.send(('detener', None))
+        conexion.close()
+
+
+class MotorRemoto:
+    """
+    Lado de la interfaz: arranca el proceso hijo y expone la misma API que ControlVelocidad
+    """
+
+    def __init__(self, configuracion: dict, procesos: list, ticks_por_segundo: float = 10,
+                 max_ciclos: int = MAX_CICLOS, perfilado: str = 'NINGUNO'):
+        # 'spawn' evita heredar el estado de Tk con fork
+        contexto = multiprocessing.get_context('spawn')
+        self.conexion, conexion_hijo = contexto.Pipe()
+        self.proceso = contexto.Process(target=ejecutar_motor_remoto,
+                                        args=(conexion_hijo, configuracion, procesos,
+                                              ticks_por_segundo, max_ciclos, perfilado),
+                                        daemon=True)
+        self.proceso.start()
+        conexion_hijo.close()
+
+        self.pausado = False
+        self.terminado = False
+
+    def _enviar(self, comando: str, argumento=None):
+        """
+        Envia un comando al motor si sigue vivo
+        """
+        if self.terminado:
+            return
+        try:
+            self.conexion.send((comando, argumento))
+        except (BrokenPipeError, OSError):
+            self.terminado = True
+
+    def fijar_velocidad(self, ticks_por_segundo: float):
+        self._enviar('velocidad', ticks_por_segundo)
+
+    def pausar(self):
+        self.pausado = True
+        self._enviar('pausar')
+
+    def reanudar(self):
+        self.pausado = False
+        self._enviar('reanudar')
+
+    def paso(self, pasos: int = 1):
+        self.pausado = True
+        self._enviar('paso', pasos)
+
+    def ejecutar_hasta(self, tiempo: int):
+        self.pausado = False
+        self._enviar('hasta', tiempo)
+
+    def detener(self):
+        self._enviar('detener')
+
+    def recibir(self) -> list:
+        """
+        Lee sin bloquear todos los mensajes pendientes del motor
+
+        Returns:
+            Lista de (tipo, contenido): 'estado', 'grabacion', 'series', 'finalizar', 'perfil' o 'detener'
+        """
+        mensajes = []
+        try:
+            while not self.terminado and self.conexion.poll():
+                tipo, contenido = self.conexion.recv()
+                if tipo == 'estado':
+                    self.pausado = contenido[2]
+                elif tipo == 'detener':
+                    self.terminado = True
+                    self.proceso.join(timeout=1)
+                mensajes.append((tipo, contenido))
+        except (EOFError, OSError):
+            # El proceso hijo murio sin avisar
+            self.terminado = True
+            mensajes.append(('detener', None))
+        return mensajes
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Modulo de Simulacion - Clase SeriesTiempo
+Metricas por tick en arreglos tipados (array) con agregacion opcional y
+exportacion a CSV y a un formato binario columnar
+"""
+
+import csv
+import struct
+import sys
+from array import array
+
+
+# (nombre, typecode) de cada columna
+COLUMNAS = (
+    ('tiempo', 'I'),
+    ('utilizacion_cpu', 'f'),  # fraccion de ticks con un proceso ejecutando
+    ('listos', 'I'),
+    ('bloqueados', 'I'),
+    ('fallos_pagina', 'I'),  # fallos ocurridos en el intervalo
+    ('marcos_usados', 'I'),
+    ('conflictos', 'I'),  # conflictos de archivos ocurridos en el intervalo
+)
+
+FIRMA = b'SOST'
+VERSION = 1
+CABECERA = struct.Struct('<4sHIIH')  # firma, version, factor, filas, columnas
+COLUMNA = struct.Struct('<B1sI')  # largo del nombre, typecode, bytes de datos
+
+
+class SeriesTiempo:
+    """
+    Serie temporal de metricas del motor, una fila cada 'factor' ticks
+    """
+
+    def __init__(self, factor: int = 1):
+        """
+        Inicializa la serie
+
+        Args:
+            factor: Ticks agregados por fila (1 = una fila por tick). Las
+                    colas y marcos se toman al final del intervalo; la CPU,
+                    los fallos y los conflictos se acumulan dentro de el
+        """
+        self.factor = max(1, factor)
+        self.columnas = {nombre: array(tipo) for nombre, tipo in COLUMNAS}
+
+        # Acumuladores del intervalo en curso
+        self._ticks = 0
+        self._ocupados = 0
+        self._fallos_previos = 0
+        self._conflictos_previos = 0
+
+    def __len__(self) -> int:
+        """Numero de filas"""
+        return len(self.columnas['tiempo'])
+
+    def iniciar(self, motor):
+        """
+        Toma los contadores de partida del motor
+        """
+        self._fallos_previos = motor.gestor_memoria.fallos_pagina
+        self._conflictos_previos = motor.gestor_archivos.conflictos_totales
+
+    def registrar(self, motor):
+        """
+        Acumula el tick recien ejecutado y cierra una fila cada 'factor' ticks
+        """
+        planificador = motor.planificador
+        historial = planificador.historial_ejecucion
+        self._ticks += 1
+        if historial and historial[-1][0] == planificador.tiempo_actual:
+            self._ocupados += 1
+        if self._ticks >= self.factor:
+            self._cerrar_fila(motor)
+
+    def finalizar(self, motor):
+        """
+        Cierra la ultima fila si quedo un intervalo incompleto
+        """
+        if self._ticks:
+            self._cerrar_fila(motor)
+
+    def _cerrar_fila(self, motor):
+        """
+        Agrega una fila leyendo contadores del motor (sin diccionarios intermedios)
+        """
+        planificador = motor.planificador
+        gestor_memoria = motor.gestor_memoria
+        fallos = gestor_memoria.fallos_pagina
+        conflictos = motor.gestor_archivos.conflictos_totales
+
+        columnas = self.columnas
+        columnas['tiempo'].append(planificador.tiempo_actual)
+        columnas['utilizacion_cpu'].append(self._ocupados / self._ticks)
+        columnas['listos'].append(len(planificador.cola_listos))
+        columnas['bloqueados'].append(len(planificador.cola_bloqueados))
+        columnas['fallos_pagina'].append(fallos - self._fallos_previos)
+        columnas['marcos_usados'].append(gestor_memoria.marcos_totales - gestor_memoria.marcos.count(None))
+        columnas['conflictos'].append(conflictos - self._conflictos_previos)
+
+        self._ticks = 0
+        self._ocupados = 0
+        self._fallos_previos = fallos
+        self._conflictos_previos = conflictos
+
+    def exportar_csv(self, ruta: str):
+        """
+        Escribe la serie en CSV (una columna por metrica)
+        """
+        nombres = [nombre for nombre, _ in COLUMNAS]
+        with open(ruta, 'w', newline='', encoding='utf-8') as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(nombres)
+            escritor.writerows(zip(*(self.columnas[n] for n in nombres)))
+
+    def exportar_binario(self, ruta: str):
+        """
+        Escribe la serie en formato columnar: cabecera y luego cada columna contigua
+        (little-endian, typecode de array)
+        """
+        with open(ruta, 'wb') as archivo:
+            archivo.write(CABECERA.pack(FIRMA, VERSION, self.factor, len(self), len(COLUMNAS)))
+            for nombre, tipo in COLUMNAS:
+                datos = self.columnas[nombre]
+                if sys.byteorder == 'big':
+                    datos = array(tipo, datos)
+                    datos.byteswap()
+                nombre_bytes = nombre.encode('ascii')
+                archivo.write(COLUMNA.pack(len(nombre_bytes), tipo.encode('ascii'), len(datos) * datos.itemsize))
+                archivo.write(nombre_bytes)
+                archivo.write(datos.tobytes())
+
+    @classmethod
+    def cargar_binario(cls, ruta: str) -> 'SeriesTiempo':
+        """
+        Lee una serie escrita con exportar_binario
+        """
+        with open(ruta, 'rb') as archivo:
+            datos = archivo.read()
+
+        firma, version, factor, filas, num_columnas = CABECERA.unpack_from(datos, 0)
+        if firma != FIRMA or version != VERSION:
+            raise ValueError(f"Formato de series no soportado: {firma!r} v{version}")
+
+        series = cls(factor)
+        posicion = CABECERA.size
+        for _ in range(num_columnas):
+            largo_nombre, tipo, largo_datos = COLUMNA.unpack_from(datos, posicion)
+            posicion += COLUMNA.size
+            nombre = datos[posicion:posicion + largo_nombre].decode('ascii')
+            posicion += largo_nombre
+            columna = array(tipo.decode('ascii'))
+            columna.frombytes(datos[posicion:posicion + largo_datos])
+            if sys.byteorder == 'big':
+                columna.byteswap()
+            posicion += largo_datos
+            series.columnas[nombre] = columna
+        return series
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Resumen de la serie (medias de cada columna)
+        """
+        filas = len(self)
+        resumen = {'filas': filas, 'factor': self.factor}
+        for nombre, _ in COLUMNAS[1:]:
+            columna = self.columnas[nombre]
+            resumen[f'{nombre}_promedio'] = round(sum(columna) / filas, 3) if filas else 0
+        return resumen
@@ -0,0 +1,484 @@
+# -*- coding: utf-8 -*-
+"""
+Modulo de Simulacion - Clase ServidorEstado
+Servidor local (asyncio, solo biblioteca estandar) que corre el motor en un
+hilo y transmite las instantaneas a cualquier cantidad de visores por HTTP
+server-sent events. Cada visor tiene su propio buzon de una posicion: si no
+alcanza a leer, se saltea cuadros y la simulacion nunca lo espera
+
+Rutas:
+    GET  /          Visor HTML minimo
+    GET  /eventos   Flujo SSE ('estado' por cuadro, 'control', 'fin', 'error')
+    GET  /estado    Estado del servidor y de cada visor (JSON)
+    POST /control   {"accion": "iniciar" | "detener" | "pausar" | "reanudar" |
+                     "paso" | "hasta" | "velocidad", ...} (JSON)
+"""
+
+import asyncio
+import collections
+import json
+import math
+import threading
+from typing import Callable, Optional
+from urllib.parse import urlsplit
+import sys
+import os
+
+# Anadir el directorio padre al path para importar modulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Modulo_Procesos.cargaTrabajo import GeneradorCarga
+from Modulo_Simulacion.motor import MotorSimulacion, MAX_CICLOS
+from Modulo_Simulacion.control import ControlVelocidad
+
+
+# Opciones que un visor puede elegir al iniciar una corrida
+OPCIONES_MOTOR = ('algoritmo', 'quantum', 'algoritmo_memoria', 'marcos_totales', 'modelo_referencias',
+                  'admision', 'grado_multiprogramacion', 'algoritmo_disco', 'protocolo_prioridad',
+                  'archivos', 'archivos_escritura', 'semilla')
+OPCIONES_CARGA = ('carga', 'procesos', 'tasa_llegada')
+
+# Eventos del motor que viajan con cada cuadro (los mas viejos se cuentan como omitidos)
+MAX_EVENTOS_CUADRO = 50
+# Avisos pendientes por visor (control, fin); un visor que no los lee pierde los mas viejos
+MAX_AVISOS = 64
+# Segundos sin datos tras los que se envia un comentario para detectar visores caidos
+INTERVALO_LATIDO = 15
+TIEMPO_LECTURA = 10
+MAX_CABECERA = 16 * 1024
+MAX_CUERPO = 64 * 1024
+
+RAZONES = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           409: 'Conflict', 413: 'Payload Too Large', 415: 'Unsupported Media Type'}
+
+
+def carga_sintetica(configuracion: dict):
+    """
+    Procesos por defecto de una corrida: carga sintetica de GeneradorCarga
+    """
+    return GeneradorCarga(total=configuracion.get('procesos', 100),
+                          llegadas=configuracion.get('carga', 'POISSON'),
+                          tasa_llegada=configuracion.get('tasa_llegada', 0.1),
+                          archivos=configuracion.get('archivos'),
+                          semilla=configuracion.get('semilla'))
+
+
+def mensaje_sse(evento: str, datos) -> bytes:
+    """
+    Codifica un evento SSE (json.dumps no genera saltos de linea)
+    """
+    return f"event: {evento}\ndata: {json.dumps(datos, ensure_ascii=False)}\n\n".encode('utf-8')
+
+
+class VisorSSE:
+    """
+    Visor conectado al flujo de eventos
+
+    El ultimo cuadro sin enviar reemplaza al anterior (como BuzonInstantaneas),
+    asi la memoria por visor es constante y uno lento solo ve menos cuadros.
+    Los avisos se encolan en orden detras del cuadro que estaba pendiente.
+    """
+
+    def __init__(self, escritor: asyncio.StreamWriter):
+        self.escritor = escritor
+        self.cuadro = None
+        self.avisos = collections.deque(maxlen=MAX_AVISOS)
+        self.hay_datos = asyncio.Event()
+        self.enviados = 0
+        self.descartados = 0
+
+    def ofrecer_cuadro(self, mensaje: bytes):
+        """
+        Deja un cuadro para enviar (el pendiente, si lo hay, se descarta)
+        """
+        if self.cuadro is not None:
+            self.descartados += 1
+        self.cuadro = mensaje
+        self.hay_datos.set()
+
+    def ofrecer_aviso(self, mensaje: bytes):
+        """
+        Encola un aviso que no se saltea, despues del cuadro pendiente
+        """
+        if self.cuadro is not None:
+            self.avisos.append(self.cuadro)
+            self.cuadro = None
+        self.avisos.append(mensaje)
+        self.hay_datos.set()
+
+    def _tomar_pendientes(self) -> bytes:
+        mensajes = list(self.avisos)
+        self.avisos.clear()
+        if self.cuadro is not None:
+            mensajes.append(self.cuadro)
+            self.cuadro = None
+        self.enviados += len(mensajes)
+        return b''.join(mensajes)
+
+    async def transmitir(self, cierre: asyncio.Future):
+        """
+        Envia lo pendiente hasta que el visor se desconecta (cierre termina)
+        """
+        while not cierre.done():
+            espera = asyncio.ensure_future(self.hay_datos.wait())
+            await asyncio.wait((espera, cierre), timeout=INTERVALO_LATIDO,
+                               return_when=asyncio.FIRST_COMPLETED)
+            espera.cancel()
+            if cierre.done():
+                return
+            self.hay_datos.clear()
+            self.escritor.write(self._tomar_pendientes() or b': latido\n\n')
+            # Solo esta corrutina espera al visor; el motor sigue publicando en su buzon
+            await self.escritor.drain()
+
+    def obtener_estadisticas(self) -> dict:
+        return {'enviados': self.enviados, 'descartados': self.descartados}
+
+
+class ServidorEstado:
+    """
+    Corre una simulacion a la vez y la difunde a todos los visores conectados
+    """
+
+    def __init__(self, configuracion: Optional[dict] = None, crear_procesos: Optional[Callable] = None,
+                 host: str = '127.0.0.1', puerto: int = 8765, ticks_por_segundo: float = 10,
+                 cuadros_por_segundo: float = 10, max_ciclos: int = MAX_CICLOS):
+        """
+        Inicializa el servidor
+
+        Args:
+            configuracion: Opciones por defecto de cada corrida (motor y carga)
+            crear_procesos: Funcion configuracion -> procesos de la corrida
+                            (por defecto carga_sintetica)
+            host: Interfaz de escucha (solo local por defecto)
+            puerto: Puerto TCP (0 = elegido por el sistema)
+            ticks_por_segundo: Ritmo inicial de cada corrida (0 = sin limite)
+            cuadros_por_segundo: Cuadros maximos por segundo enviados a los visores
+            max_ciclos: Limite de ticks por corrida
+        """
+        self.configuracion = dict(configuracion or {})
+        self.crear_procesos = crear_procesos or carga_sintetica
+        self.host = host
+        self.puerto = puerto
+        self.ticks_por_segundo = ticks_por_segundo
+        self.cuadros_por_segundo = cuadros_por_segundo
+        self.max_ciclos = max_ciclos
+
+        self.loop = None
+        self.servidor = None
+        self.visores = set()
+        self.control = None
+        self.hilo = None
+        self.corridas = 0
+        self.ultimo_cuadro = None  # para los visores que se conectan a mitad de corrida
+        self.ultimo_tiempo = 0
+
+    # ------------------------------------------------------------------
+    # Corrida (hilo de simulacion)
+    # ------------------------------------------------------------------
+
+    def _en_loop(self, funcion, *argumentos):
+        """
+        Agenda una funcion en el loop desde el hilo de simulacion
+        """
+        try:
+            self.loop.call_soon_threadsafe(funcion, *argumentos)
+        except RuntimeError:
+            # El loop ya se cerro: nadie queda para recibir el mensaje
+            pass
+
+    def _simular(self, motor: MotorSimulacion, control: ControlVelocidad, corrida: int,
+                 eventos: list, max_ciclos: int):
+        """
+        Cuerpo del hilo: corre el motor y publica cada cuadro ya serializado
+        """
+        def publicar(instantanea):
+            datos = instantanea._asdict()
+            datos['estadisticas_memoria'] = dict(instantanea.estadisticas_memoria)
+            datos['estadisticas_archivos'] = dict(instantanea.estadisticas_archivos)
+            datos['corrida'] = corrida
+            datos['pausado'] = control.pausado
+            datos['eventos'] = eventos[-MAX_EVENTOS_CUADRO:]
+            datos['eventos_omitidos'] = max(0, len(eventos) - MAX_EVENTOS_CUADRO)
+            eventos.clear()
+            # Se serializa una sola vez, en este hilo, sin importar cuantos visores haya
+            self._en_loop(self._difundir_cuadro, instantanea.tiempo, mensaje_sse('estado', datos))
+
+        try:
+            motor.correr(control, max_ciclos, registrar=eventos.extend, publicar=publicar)
+            resumen = motor.resumen_final()
+            if motor.ciclo > 200:
+                del resumen['gantt']
+            resumen.update(corrida=corrida, ciclos=motor.ciclo, completa=not motor.hay_procesos_activos())
+            self._en_loop(self._difundir_aviso, mensaje_sse('fin', resumen))
+        except Exception as e:
+            self._en_loop(self._difundir_aviso, mensaje_sse('error', {'corrida': corrida, 'mensaje': str(e)}))
+
+    def _difundir_cuadro(self, tiempo: int, mensaje: bytes):
+        self.ultimo_tiempo = tiempo
+        self.ultimo_cuadro = mensaje
+        for visor in self.visores:
+            visor.ofrecer_cuadro(mensaje)
+
+    def _difundir_aviso(self, mensaje: bytes):
+        for visor in self.visores:
+            visor.ofrecer_aviso(mensaje)
+
+    def corriendo(self) -> bool:
+        return self.hilo is not None and self.hilo.is_alive()
+
+    # ------------------------------------------------------------------
+    # Comandos
+    # ------------------------------------------------------------------
+
+    def iniciar(self, opciones: Optional[dict] = None, max_ciclos: Optional[int] = None,
+                ticks_por_segundo: Optional[float] = None) -> int:
+        """
+        Arranca una corrida nueva con la configuracion por defecto mas las opciones
+
+        Returns:
+            Numero de la corrida
+        """
+        if self.corriendo():
+            raise RuntimeError("Ya hay una corrida en curso; detenerla primero")
+        opciones = opciones or {}
+        if ticks_por_segundo is not None:
+            ticks_por_segundo = float(ticks_por_segundo)
+            if not math.isfinite(ticks_por_segundo) or ticks_por_segundo < 0:
+                raise ValueError(f"ticks_por_segundo invalido: {ticks_por_segundo}")
+        if max_ciclos is not None and int(max_ciclos) < 1:
+            raise ValueError(f"max_ciclos debe ser al menos 1: {max_ciclos}")
+        desconocidas = [c for c in opciones if c not in OPCIONES_MOTOR + OPCIONES_CARGA]
+        if desconocidas:
+            raise ValueError(f"Opciones desconocidas: {', '.join(desconocidas)}")
+
+        configuracion = {**self.configuracion, **opciones}
+        parametros = {c: v for c, v in configuracion.items() if c in OPCIONES_MOTOR}
+        # Con cargas grandes los procesos terminados no se conservan (como en main.py)
+        conservar = configuracion.get('carga') == 'EJEMPLO' and not configuracion.get('traza')
+        motor = MotorSimulacion(conservar_terminados=conservar, **parametros)
+        eventos = list(motor.agregar_carga(self.crear_procesos(configuracion)))
+
+        self.control = ControlVelocidad(
+            ticks_por_segundo=self.ticks_por_segundo if ticks_por_segundo is None else ticks_por_segundo,
+            cuadros_por_segundo=self.cuadros_por_segundo)
+        self.corridas += 1
+        self.ultimo_cuadro = None
+        self.hilo = threading.Thread(target=self._simular, daemon=True,
+                                     args=(motor, self.control, self.corridas, eventos,
+                                           self.max_ciclos if max_ciclos is None else max_ciclos))
+        self.hilo.start()
+        return self.corridas
+
+    def aplicar(self, comando: dict) -> dict:
+        """
+        Aplica un comando de control y lo anuncia a todos los visores
+
+        Returns:
+            Respuesta para quien envio el comando
+        """
+        accion = str(comando.get('accion', '')).lower()
+        if accion == 'iniciar':
+            corrida = self.iniciar(comando.get('configuracion'), comando.get('max_ciclos'),
+                                   comando.get('ticks_por_segundo'))
+            aviso = {'accion': accion, 'corrida': corrida}
+        else:
+            if self.control is None:
+                raise RuntimeError("No hay ninguna corrida")
+            if accion == 'detener':
+                self.control.detener()
+                aviso = {'accion': accion}
+            elif accion == 'pausar':
+                self.control.pausar()
+                aviso = {'accion': accion}
+            elif accion == 'reanudar':
+                self.control.reanudar()
+                aviso = {'accion': accion}
+            elif accion == 'paso':
+                pasos = int(comando.get('pasos', 1))
+                if pasos < 1:
+                    raise ValueError(f"pasos debe ser al menos 1: {pasos}")
+                self.control.paso(pasos)
+                aviso = {'accion': accion, 'pasos': pasos}
+            elif accion == 'hasta':
+                tiempo = int(comando['tiempo'])
+                if tiempo < 0:
+                    raise ValueError(f"tiempo negativo: {tiempo}")
+                self.control.ejecutar_hasta(tiempo)
+                aviso = {'accion': accion, 'tiempo': tiempo}
+            elif accion == 'velocidad':
+                ticks = float(comando['ticks_por_segundo'])
+                if not math.isfinite(ticks) or ticks < 0:
+                    raise ValueError(f"ticks_por_segundo invalido: {ticks}")
+                self.control.fijar_velocidad(ticks)
+                aviso = {'accion': accion, 'ticks_por_segundo': ticks}
+            else:
+                raise ValueError(f"Accion desconocida: {accion}")
+        self._difundir_aviso(mensaje_sse('control', aviso))
+        return {'ok': True, **aviso}
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Estado del servidor, de la corrida actual y de cada visor
+        """
+        control = self.control
+        return {
+            'corrida': self.corridas,
+            'corriendo': self.corriendo(),
+            'tiempo': self.ultimo_tiempo,
+            'pausado': control.pausado if control else False,
+            'ticks_por_segundo': control.ticks_por_segundo if control else self.ticks_por_segundo,
+            'visores': [visor.obtener_estadisticas() for visor in self.visores]
+        }
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    async def _responder(self, escritor: asyncio.StreamWriter, codigo: int, cuerpo,
+                         tipo: str = 'application/json; charset=utf-8'):
+        if not isinstance(cuerpo, bytes):
+            cuerpo = json.dumps(cuerpo, ensure_ascii=False).encode('utf-8')
+        escritor.write(f"HTTP/1.1 {codigo} {RAZONES[codigo]}\r\nContent-Type: {tipo}\r\n"
+                       f"Content-Length: {len(cuerpo)}\r\nCache-Control: no-store\r\n"
+                       f"Connection: close\r\n\r\n".encode('latin-1') + cuerpo)
+        await escritor.drain()
+
+    async def _atender(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        """
+        Atiende una conexion: una peticion por conexion, o el flujo SSE
+        """
+        try:
+            try:
+                cabecera = await asyncio.wait_for(lector.readuntil(b'\r\n\r\n'), TIEMPO_LECTURA)
+                lineas = cabecera.decode('latin-1').split('\r\n')
+                metodo, ruta, _ = lineas[0].split(' ', 2)
+                cabeceras = {}
+                for linea in lineas[1:]:
+                    nombre, _, valor = linea.partition(':')
+                    cabeceras[nombre.strip().lower()] = valor.strip()
+                largo = int(cabeceras.get('content-length') or 0)
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError):
+                return
+            except ValueError:
+                await self._responder(escritor, 400, {'ok': False, 'error': "Peticion invalida"})
+                return
+            if largo > MAX_CUERPO:
+                await self._responder(escritor, 413, {'ok': False, 'error': "Cuerpo demasiado grande"})
+                return
+            cuerpo = await asyncio.wait_for(lector.readexactly(largo), TIEMPO_LECTURA) if largo else b''
+            ruta = urlsplit(ruta).path
+
+            if ruta == '/eventos' and metodo == 'GET':
+                await self._transmitir(lector, escritor)
+            elif ruta == '/estado' and metodo == 'GET':
+                await self._responder(escritor, 200, self.obtener_estadisticas())
+            elif ruta == '/' and metodo == 'GET':
+                await self._responder(escritor, 200, PAGINA_VISOR.encode('utf-8'), 'text/html; charset=utf-8')
+            elif ruta == '/control' and metodo == 'POST':
+                # Exigir JSON obliga a los navegadores a una verificacion CORS que este servidor no concede
+                if not cabeceras.get('content-type', '').startswith('application/json'):
+                    await self._responder(escritor, 415, {'ok': False, 'error': "Se espera application/json"})
+                    return
+                try:
+                    comando = json.loads(cuerpo or b'{}')
+                    if not isinstance(comando, dict):
+                        raise ValueError("El comando debe ser un objeto JSON")
+                    await self._responder(escritor, 200, self.aplicar(comando))
+                except RuntimeError as e:
+                    await self._responder(escritor, 409, {'ok': False, 'error': str(e)})
+                except (ValueError, TypeError, KeyError) as e:
+                    await self._responder(escritor, 400, {'ok': False, 'error': f"Comando invalido: {e}"})
+            elif ruta in ('/', '/eventos', '/estado', '/control'):
+                await self._responder(escritor, 405, {'ok': False, 'error': f"Metodo no permitido: {metodo}"})
+            else:
+                await self._responder(escritor, 404, {'ok': False, 'error': f"Ruta desconocida: {ruta}"})
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+            pass
+        finally:
+            escritor.close()
+
+    async def _transmitir(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        """
+        Flujo SSE de un visor, hasta que se desconecta
+        """
+        escritor.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+                       b"Cache-Control: no-store\r\nConnection: keep-alive\r\n\r\nretry: 1000\n\n")
+        visor = VisorSSE(escritor)
+        if self.ultimo_cuadro is not None:
+            visor.ofrecer_cuadro(self.ultimo_cuadro)
+        self.visores.add(visor)
+        # El visor no envia nada mas: cualquier lectura que termine indica que cerro
+        cierre = asyncio.ensure_future(lector.read(1))
+        try:
+            await visor.transmitir(cierre)
+        finally:
+            cierre.cancel()
+            self.visores.discard(visor)
+
+    async def servir(self):
+        """
+        Atiende visores hasta que se cancela la tarea (Ctrl+C con asyncio.run)
+        """
+        self.loop = asyncio.get_running_loop()
+        self.servidor = await asyncio.start_server(self._atender, self.host, self.puerto, limit=MAX_CABECERA)
+        self.puerto = self.servidor.sockets[0].getsockname()[1]
+        try:
+            async with self.servidor:
+                await self.servidor.serve_forever()
+        finally:
+            if self.control is not None:
+                self.control.detener()
+            for visor in list(self.visores):
+                visor.escritor.close()
+
+
+PAGINA_VISOR = """<!DOCTYPE html>
+<html lang="es"><head><meta charset="utf-8"><title>Simulador de SO</title>
+<style>body{font-family:monospace;margin:1em}button{margin-right:.3em}pre{background:#f4f4f4;padding:.5em}</style>
+</head><body>
+<h3>Simulador de Sistema Operativo</h3>
+<p>
+<button onclick="enviar({accion:'iniciar'})">Iniciar</button>
+<button onclick="enviar({accion:'pausar'})">Pausar</button>
+<button onclick="enviar({accion:'reanudar'})">Reanudar</button>
+<button onclick="enviar({accion:'paso', pasos:1})">Paso</button>
+<button onclick="enviar({accion:'detener'})">Detener</button>
+Ticks/s (0 = sin limite):
+<input id="velocidad" type="number" min="0" value="10" size="5"
+       onchange="enviar({accion:'velocidad', ticks_por_segundo:Number(this.value)})">
+</p>
+<pre id="estado">Esperando una corrida...</pre>
+<pre id="eventos"></pre>
+<script>
+function enviar(comando) {
+  fetch('/control', {method: 'POST', headers: {'Content-Type': 'application/json'},
+                     body: JSON.stringify(comando)})
+    .then(r => r.json()).then(r => { if (!r.ok) alert(r.error); });
+}
+const fuente = new EventSource('/eventos');
+const eventos = document.getElementById('eventos');
+fuente.addEventListener('estado', e => {
+  const s = JSON.parse(e.data), m = s.estadisticas_memoria;
+  document.getElementById('estado').textContent =
+    `Corrida ${s.corrida}  T${s.tiempo}${s.pausado ? '  [PAUSA]' : ''}\\n` +
+    `CPU: ${s.cpu || 'IDLE'}\\nListos: ${s.listos.join(', ') || 'Vacia'}\\n` +
+    `Bloqueados: ${s.bloqueados.join(', ') || 'Ninguno'}\\n` +
+    `Marcos (${s.algoritmo_memoria}): ${s.marcos.map(p => p === null ? '-' : 'P' + p).join(' ')}\\n` +
+    `Fallos de pagina: ${m.fallos_pagina}\\n\\n${s.vista_archivos}`;
+  const lineas = s.eventos.map(([mensaje, tipo]) => `[${tipo}] ${mensaje}`);
+  eventos.textContent = lineas.concat(eventos.textContent.split('\\n')).slice(0, 30).join('\\n');
+});
+fuente.addEventListener('control', e => {
+  eventos.textContent = `[CONTROL] ${e.data}\\n` + eventos.textContent;
+});
+fuente.addEventListener('fin', e => {
+  const r = JSON.parse(e.data);
+  eventos.textContent = `[FIN] corrida ${r.corrida}: ${r.ciclos} ciclos, ` +
+    `${r.metricas.procesos_completados} procesos completados\\n` + eventos.textContent;
+});
+fuente.addEventListener('error', e => {
+  if (e.data) eventos.textContent = `[ERROR] ${JSON.parse(e.data).mensaje}\\n` + eventos.textContent;
+});
+</script>
+</body></html>
+"""
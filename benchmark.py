@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks de escalabilidad del simulador
+Mide Planificador (RR, SJF, PRIORIDAD), GestorMemoria (FIFO / LRU con
+distintos marcos) y GestorArchivos (niveles de contencion) a 10, 10^3, 10^5
+y 10^6 procesos o accesos. Reporta operaciones por segundo y memoria pico, y
+guarda los resultados en JSON para comparar versiones
+
+Uso:
+    python benchmark.py --etiqueta antes --salida antes.json
+    python benchmark.py --etiqueta despues --comparar antes.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import random
+import sys
+import os
+import time
+import tracemalloc
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows: la memoria pico se mide con tracemalloc
+    resource = None
+
+# Anadir el directorio actual al path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from Modulo_Procesos.proceso import Proceso
+from Modulo_Procesos.planificador import Planificador
+from Modulo_Procesos.cargaTrabajo import GeneradorCarga
+from Modulo_Memoria.gestorMemoria import GestorMemoria
+from Modulo_Archivos.gestorArchivos import GestorArchivos
+
+
+VERSION_RESULTADOS = 1
+TAMANOS = (10, 1000, 100000, 1000000)
+ALGORITMOS_PLANIFICACION = ('RR', 'SJF', 'PRIORIDAD')
+ALGORITMOS_MEMORIA = ('FIFO', 'LRU')
+MARCOS = (8, 64, 512)
+CONTENCION = {'BAJA': 1024, 'MEDIA': 16, 'ALTA': 1}  # archivos compartidos por el grupo de procesos
+
+# Cada cuantas operaciones se consulta el reloj para respetar el limite de tiempo
+LOTE_RELOJ = 256
+
+
+def bench_planificador(algoritmo: str, n: int, limite: float, semilla: int) -> dict:
+    """
+    Planifica n procesos que llegan de a uno (como en el motor) hasta terminarlos
+
+    Returns:
+        Operaciones = ticks ejecutados
+    """
+    planificador = Planificador(algoritmo=algoritmo, quantum=3, conservar_terminados=False)
+    # Carga del 80% (0.2 llegadas/tick * 4 ticks): la cola de listos se mantiene acotada
+    fuente = GeneradorCarga(total=n, tasa_llegada=0.2, duracion='EXPONENCIAL', duracion_media=4,
+                            max_archivos=0, semilla=semilla)
+    proximo = next(fuente, None)
+
+    inicio = time.perf_counter()
+    ticks = 0
+    while proximo is not None or planificador.hay_procesos_activos():
+        while proximo is not None and proximo.tiempo_llegada <= planificador.tiempo_actual + 1:
+            planificador.agregar_proceso(proximo)
+            proximo = next(fuente, None)
+        planificador.ejecutar_ciclo()
+        ticks += 1
+        if ticks % LOTE_RELOJ == 0 and time.perf_counter() - inicio > limite:
+            break
+
+    return {'operaciones': ticks, 'segundos': time.perf_counter() - inicio,
+            'completo': proximo is None and not planificador.hay_procesos_activos(),
+            'procesos_completados': planificador.metricas['procesos_completados']}
+
+
+def bench_memoria(algoritmo: str, marcos: int, n: int, limite: float, semilla: int) -> dict:
+    """
+    n accesos de 64 procesos de 16 paginas (1024 paginas) sobre 'marcos' marcos
+
+    Returns:
+        Operaciones = accesos a memoria
+    """
+    gestor = GestorMemoria(marcos_totales=marcos, algoritmo_reemplazo=algoritmo, semilla=semilla)
+    procesos = [Proceso(i, 3, 10, 0, 16, []) for i in range(1, 65)]
+    for proceso in procesos:
+        gestor.asignar_memoria(proceso)
+
+    inicio = time.perf_counter()
+    accesos = 0
+    while accesos < n:
+        gestor.tiempo_actual = accesos
+        gestor.acceder_memoria(procesos[accesos % len(procesos)])
+        accesos += 1
+        if accesos % LOTE_RELOJ == 0 and time.perf_counter() - inicio > limite:
+            break
+
+    return {'operaciones': accesos, 'segundos': time.perf_counter() - inicio,
+            'completo': accesos >= n, 'fallos_pagina': gestor.fallos_pagina}
+
+
+def bench_archivos(contencion: str, n: int, limite: float, semilla: int) -> dict:
+    """
+    n operaciones de 256 procesos: quien tiene un archivo lo libera (y pasa al
+    siguiente en cola); quien no, pide uno al azar
+
+    Returns:
+        Operaciones = solicitudes + liberaciones
+    """
+    nombres = [f"archivo{i}.dat" for i in range(CONTENCION[contencion])]
+    gestor = GestorArchivos(nombres)
+    procesos = [Proceso(i, 1 + i % 5, 10, 0, 1, []) for i in range(1, 257)]
+    rng = random.Random(semilla)
+
+    inicio = time.perf_counter()
+    operaciones = 0
+    while operaciones < n:
+        proceso = procesos[operaciones % len(procesos)]
+        gestor.tiempo_actual = operaciones
+        propios = gestor.archivos_por_proceso.get(proceso.id)
+        if propios:
+            gestor.liberar_archivo(next(iter(propios)), proceso)
+        else:
+            gestor.solicitar_acceso(proceso, rng.choice(nombres))
+        operaciones += 1
+        if operaciones % LOTE_RELOJ == 0 and time.perf_counter() - inicio > limite:
+            break
+
+    return {'operaciones': operaciones, 'segundos': time.perf_counter() - inicio,
+            'completo': operaciones >= n, 'conflictos': gestor.conflictos_totales}
+
+
+def memoria_actual_kb() -> int:
+    """
+    Memoria residente maxima del proceso en KiB (ru_maxrss esta en bytes en macOS)
+    """
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico // 1024 if sys.platform == 'darwin' else pico
+
+
+def ejecutar_caso(caso: dict) -> dict:
+    """
+    Corre un caso en el proceso actual (se usa en un proceso hijo por caso para
+    que la memoria pico de uno no contamine al siguiente)
+    """
+    funcion = {'planificador': bench_planificador,
+               'memoria': bench_memoria,
+               'archivos': bench_archivos}[caso['componente']]
+
+    if resource is not None:
+        base = memoria_actual_kb()
+        resultado = funcion(*caso['argumentos'])
+        resultado['memoria_base_kb'] = base
+        resultado['memoria_pico_kb'] = memoria_actual_kb()
+        resultado['medicion_memoria'] = 'rss'
+    else:
+        tracemalloc.start()
+        resultado = funcion(*caso['argumentos'])
+        resultado['memoria_base_kb'] = 0
+        resultado['memoria_pico_kb'] = tracemalloc.get_traced_memory()[1] // 1024
+        resultado['medicion_memoria'] = 'tracemalloc'
+        tracemalloc.stop()
+
+    resultado['ops_por_segundo'] = round(resultado['operaciones'] / resultado['segundos']) if resultado['segundos'] else 0
+    resultado['segundos'] = round(resultado['segundos'], 4)
+    return {**{k: v for k, v in caso.items() if k != 'argumentos'}, **resultado}
+
+
+def generar_casos(componentes: list, tamanos: list, limite: float, semilla: int) -> list:
+    """
+    Lista de casos {nombre, componente, variante, n, argumentos}
+    """
+    casos = []
+    for n in tamanos:
+        if 'planificador' in componentes:
+            for algoritmo in ALGORITMOS_PLANIFICACION:
+                casos.append({'nombre': f"planificador/{algoritmo}/{n}", 'componente': 'planificador',
+                              'variante': algoritmo, 'n': n,
+                              'argumentos': (algoritmo, n, limite, semilla)})
+        if 'memoria' in componentes:
+            for algoritmo in ALGORITMOS_MEMORIA:
+                for marcos in MARCOS:
+                    casos.append({'nombre': f"memoria/{algoritmo}-{marcos}/{n}", 'componente': 'memoria',
+                                  'variante': f"{algoritmo}-{marcos}", 'n': n,
+                                  'argumentos': (algoritmo, marcos, n, limite, semilla)})
+        if 'archivos' in componentes:
+            for contencion in CONTENCION:
+                casos.append({'nombre': f"archivos/{contencion}/{n}", 'componente': 'archivos',
+                              'variante': contencion, 'n': n,
+                              'argumentos': (contencion, n, limite, semilla)})
+    return casos
+
+
+def ejecutar_benchmarks(componentes: list, tamanos: list, limite: float, semilla: int,
+                        aislar: bool = True) -> list:
+    """
+    Corre todos los casos e imprime una linea por caso
+
+    Args:
+        aislar: Un proceso hijo nuevo por caso (memoria pico independiente)
+    """
+    resultados = []
+    contexto = multiprocessing.get_context('spawn')
+    for caso in generar_casos(componentes, tamanos, limite, semilla):
+        if aislar:
+            with contexto.Pool(1) as pool:
+                resultado = pool.apply(ejecutar_caso, (caso,))
+        else:
+            resultado = ejecutar_caso(caso)
+        resultados.append(resultado)
+
+        marca = '' if resultado['completo'] else f"  (parcial: limite de {limite:g} s)"
+        incremento = resultado['memoria_pico_kb'] - resultado['memoria_base_kb']
+        print(f"  {resultado['nombre']:<32}{resultado['ops_por_segundo']:>12,} ops/s"
+              f"{resultado['memoria_pico_kb'] / 1024:>10.1f} MiB (+{incremento / 1024:.1f}){marca}", flush=True)
+    return resultados
+
+
+def comparar(actuales: list, ruta_base: str, umbral: float) -> int:
+    """
+    Compara con un archivo de resultados anterior e informa regresiones
+
+    Returns:
+        Cantidad de casos mas lentos que la base por encima del umbral
+    """
+    with open(ruta_base, 'r', encoding='utf-8') as archivo:
+        base = {r['nombre']: r for r in json.load(archivo)['resultados']}
+
+    print(f"\nComparacion con {ruta_base} (regresion si es {umbral:.0%} mas lento):")
+    regresiones = 0
+    for resultado in actuales:
+        anterior = base.get(resultado['nombre'])
+        if anterior is None or not anterior['ops_por_segundo']:
+            continue
+        razon = resultado['ops_por_segundo'] / anterior['ops_por_segundo']
+        memoria = resultado['memoria_pico_kb'] - anterior['memoria_pico_kb']
+        marca = ''
+        if razon < 1 - umbral:
+            marca = '  << REGRESION'
+            regresiones += 1
+        print(f"  {resultado['nombre']:<32}{razon:>8.2f}x velocidad{memoria / 1024:>+10.1f} MiB{marca}")
+    return regresiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de escalabilidad del simulador")
+    parser.add_argument('--componentes', default='planificador,memoria,archivos',
+                        help="Componentes separados por coma (planificador, memoria, archivos)")
+    parser.add_argument('--tamanos', default=','.join(str(t) for t in TAMANOS),
+                        help="Procesos o accesos por caso, separados por coma")
+    parser.add_argument('--limite-segundos', type=float, default=20.0,
+                        help="Tiempo maximo por caso; si se alcanza el caso queda parcial")
+    parser.add_argument('--semilla', type=int, default=1)
+    parser.add_argument('--etiqueta', default='', help="Nombre de la version medida")
+    parser.add_argument('--salida', default='resultados_benchmark.json', help="Archivo JSON de resultados")
+    parser.add_argument('--comparar', default=None, help="JSON anterior contra el que comparar")
+    parser.add_argument('--umbral', type=float, default=0.10, help="Perdida de velocidad que cuenta como regresion")
+    parser.add_argument('--sin-aislar', action='store_true', help="Correr todo en este proceso")
+    args = parser.parse_args()
+
+    componentes = [c.strip() for c in args.componentes.split(',') if c.strip()]
+    tamanos = [int(t) for t in args.tamanos.split(',') if t.strip()]
+
+    print(f"Benchmarks: {', '.join(componentes)} | tamanos {tamanos} | limite {args.limite_segundos:g} s por caso")
+    resultados = ejecutar_benchmarks(componentes, tamanos, args.limite_segundos, args.semilla,
+                                     aislar=not args.sin_aislar)
+
+    documento = {
+        'version': VERSION_RESULTADOS,
+        'etiqueta': args.etiqueta,
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'limite_segundos': args.limite_segundos,
+        'semilla': args.semilla,
+        'resultados': resultados
+    }
+    with open(args.salida, 'w', encoding='utf-8') as archivo:
+        json.dump(documento, archivo, indent=2, ensure_ascii=False)
+    print(f"\nResultados guardados en {args.salida}")
+
+    if args.comparar:
+        sys.exit(1 if comparar(resultados, args.comparar, args.umbral) else 0)
+
+
+if __name__ == "__main__":
+    main()
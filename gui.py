@@ -6,10 +6,11 @@ Utiliza Tkinter para crear una interfaz profesional y moderna
 
 import random
 import time
+import colorsys
 import sys
 import os
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
+from tkinter import ttk, scrolledtext, messagebox, filedialog
 import threading
 import queue
 
@@ -17,9 +18,178 @@ import queue
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from Modulo_Procesos.proceso import Proceso
-from Modulo_Procesos.planificador import Planificador
-from Modulo_Memoria.gestorMemoria import GestorMemoria
-from Modulo_Archivos.gestorArchivos import GestorArchivos
+from Modulo_Procesos.cargaTrabajo import GeneradorCarga
+from Modulo_Procesos.lectorTrazas import LectorTraza
+from Modulo_Procesos.semillas import derivar_semilla
+from Modulo_Procesos.planificador import POLITICAS_ADMISION
+from Modulo_Memoria.referencias import MODELOS_REFERENCIAS
+from Modulo_Simulacion.motor import MotorSimulacion, MAX_CICLOS
+from Modulo_Simulacion.instantanea import BuzonInstantaneas
+from Modulo_Simulacion.control import ControlVelocidad
+from Modulo_Simulacion.remoto import MotorRemoto
+from Modulo_Simulacion.grabacion import Grabacion
+from Modulo_Simulacion.series import SeriesTiempo
+from Modulo_Simulacion.gantt import SegmentosGantt
+from Modulo_Simulacion.perfil import MODOS_PERFIL, crear_perfilador
+
+
+class DiagramaGantt:
+    """
+    Canvas de Gantt con zoom y desplazamiento que dibuja solo la ventana visible
+    """
+
+    MARGEN_IZQUIERDO = 60
+    MARGEN_SUPERIOR = 24
+    ALTO_FILA = 22
+
+    def __init__(self, padre, color_proceso, fondo='#1c2833', color_texto='#ecf0f1'):
+        """
+        Args:
+            padre: Contenedor Tk
+            color_proceso: Funcion pid -> color
+        """
+        self.color_proceso = color_proceso
+        self.color_texto = color_texto
+        self.canvas = tk.Canvas(padre, bg=fondo, highlightthickness=0)
+        self.info = tk.Label(padre, text="Rueda: zoom | Arrastrar: desplazar | Shift+Rueda: filas | Doble clic: todo",
+                             bg=padre['bg'], fg='#95a5a6', font=('Arial', 8), anchor='w')
+
+        self.segmentos = None
+        self.desde = 0.0
+        self.hasta = 1.0
+        self.fila_inicial = 0
+        self.arrastre = None
+        self.redibujo_pendiente = False
+
+        self.canvas.bind('<Configure>', lambda _e: self.programar_redibujo())
+        self.canvas.bind('<ButtonPress-1>', self.iniciar_arrastre)
+        self.canvas.bind('<B1-Motion>', self.arrastrar)
+        self.canvas.bind('<Double-Button-1>', lambda _e: self.ver_todo())
+        self.canvas.bind('<MouseWheel>', self.rueda)
+        self.canvas.bind('<Shift-MouseWheel>', self.rueda_filas)
+        self.canvas.bind('<Button-4>', lambda e: self.zoom(e.x, 0.8))
+        self.canvas.bind('<Button-5>', lambda e: self.zoom(e.x, 1.25))
+        self.canvas.bind('<Shift-Button-4>', lambda _e: self.desplazar_filas(-1))
+        self.canvas.bind('<Shift-Button-5>', lambda _e: self.desplazar_filas(1))
+
+    def pack(self, **kwargs):
+        self.canvas.pack(**kwargs)
+        self.info.pack(fill='x', padx=5, pady=(0, 5))
+
+    def cargar(self, segmentos):
+        """Muestra unos SegmentosGantt (None para limpiar)"""
+        self.segmentos = segmentos
+        self.ver_todo()
+
+    def ver_todo(self):
+        """Ajusta la ventana a la corrida completa"""
+        self.desde = 1.0
+        self.hasta = (self.segmentos.tiempo_final + 1.0) if self.segmentos else 2.0
+        self.fila_inicial = 0
+        self.programar_redibujo()
+
+    def ancho_util(self) -> int:
+        return max(1, self.canvas.winfo_width() - self.MARGEN_IZQUIERDO)
+
+    def x_a_tick(self, x: float) -> float:
+        return self.desde + (x - self.MARGEN_IZQUIERDO) * (self.hasta - self.desde) / self.ancho_util()
+
+    def zoom(self, x: float, factor: float):
+        """Escala la ventana manteniendo fijo el tick bajo el cursor"""
+        if self.segmentos is None:
+            return
+        centro = self.x_a_tick(max(x, self.MARGEN_IZQUIERDO))
+        ancho = min(max((self.hasta - self.desde) * factor, 2.0), self.segmentos.tiempo_final + 1.0)
+        proporcion = (centro - self.desde) / (self.hasta - self.desde)
+        self.desde = centro - ancho * proporcion
+        self.hasta = self.desde + ancho
+        self.ajustar_limites()
+
+    def rueda(self, evento):
+        self.zoom(evento.x, 0.8 if evento.delta > 0 else 1.25)
+
+    def rueda_filas(self, evento):
+        self.desplazar_filas(-1 if evento.delta > 0 else 1)
+
+    def desplazar_filas(self, filas: int):
+        if self.segmentos is None:
+            return
+        self.fila_inicial = max(0, min(self.fila_inicial + filas, len(self.segmentos.inicios) - 1))
+        self.programar_redibujo()
+
+    def iniciar_arrastre(self, evento):
+        self.arrastre = (evento.x, self.desde, self.hasta)
+
+    def arrastrar(self, evento):
+        if self.arrastre is None or self.segmentos is None:
+            return
+        x0, desde, hasta = self.arrastre
+        corrimiento = (x0 - evento.x) * (hasta - desde) / self.ancho_util()
+        self.desde = desde + corrimiento
+        self.hasta = hasta + corrimiento
+        self.ajustar_limites()
+
+    def ajustar_limites(self):
+        """Mantiene la ventana dentro de la corrida"""
+        ancho = self.hasta - self.desde
+        limite = self.segmentos.tiempo_final + 1.0
+        if self.desde < 1.0:
+            self.desde, self.hasta = 1.0, 1.0 + ancho
+        if self.hasta > limite:
+            self.desde, self.hasta = max(1.0, limite - ancho), limite
+        self.programar_redibujo()
+
+    def programar_redibujo(self):
+        """Agrupa los eventos de zoom, arrastre y tamano en un solo redibujo"""
+        if not self.redibujo_pendiente:
+            self.redibujo_pendiente = True
+            self.canvas.after_idle(self.redibujar)
+
+    def redibujar(self):
+        """Dibuja las filas visibles con los tramos de la ventana actual"""
+        self.redibujo_pendiente = False
+        canvas = self.canvas
+        canvas.delete('all')
+        if self.segmentos is None or not self.segmentos.inicios:
+            canvas.create_text(10, 10, text="No hay historial de ejecucion", anchor='nw',
+                               fill=self.color_texto, font=('Arial', 10))
+            return
+
+        ancho = self.ancho_util()
+        escala = ancho / (self.hasta - self.desde)
+        x0 = self.MARGEN_IZQUIERDO
+
+        # Eje de tiempo con ~8 marcas redondeadas
+        paso = max(1, int(10 ** len(str(int((self.hasta - self.desde) / 8))) / 10))
+        while (self.hasta - self.desde) / paso > 10:
+            paso *= 2
+        marca = int(self.desde // paso + 1) * paso
+        while marca < self.hasta:
+            x = x0 + (marca - self.desde) * escala
+            canvas.create_line(x, self.MARGEN_SUPERIOR - 4, x, canvas.winfo_height(), fill='#2c3e50')
+            canvas.create_text(x, 4, text=f"T{marca}", anchor='n', fill='#95a5a6', font=('Arial', 8))
+            marca += paso
+
+        # Solo las filas que caben en la altura del canvas
+        procesos = self.segmentos.procesos
+        filas = max(1, (canvas.winfo_height() - self.MARGEN_SUPERIOR) // self.ALTO_FILA)
+        dibujados = 0
+        for fila, pid in enumerate(procesos[self.fila_inicial:self.fila_inicial + filas]):
+            y = self.MARGEN_SUPERIOR + fila * self.ALTO_FILA
+            canvas.create_text(x0 - 6, y + self.ALTO_FILA / 2, text=f"P{pid}", anchor='e',
+                               fill=self.color_texto, font=('Courier', 9, 'bold'))
+            color = self.color_proceso(pid)
+            for inicio, fin in self.segmentos.tramos_visibles(pid, self.desde, self.hasta, ancho):
+                xi = x0 + (max(inicio, self.desde) - self.desde) * escala
+                xf = x0 + (min(fin, self.hasta) - self.desde) * escala
+                canvas.create_rectangle(xi, y + 3, max(xf, xi + 1), y + self.ALTO_FILA - 3,
+                                        fill=color, outline='')
+                dibujados += 1
+
+        self.info.config(text=f"T{self.desde:.0f}-T{self.hasta:.0f} | "
+                              f"Procesos {self.fila_inicial + 1}-{min(self.fila_inicial + filas, len(procesos))} de {len(procesos)} | "
+                              f"{dibujados} rectangulos ({self.segmentos.total_tramos} tramos) | "
+                              "Rueda: zoom, Arrastrar: desplazar, Shift+Rueda: filas, Doble clic: todo")
 
 
 class SimuladorGUI:
@@ -37,13 +207,51 @@ class SimuladorGUI:
         self.algoritmo_var = tk.StringVar(value="RR")
         self.quantum_var = tk.IntVar(value=3)
         self.memoria_var = tk.StringVar(value="FIFO")
+        self.referencias_var = tk.StringVar(value="UNIFORME")
+        self.admision_var = tk.StringVar(value="NINGUNA")
+        self.grado_var = tk.IntVar(value=0)
+        self.disco_var = tk.StringVar(value="FCFS")
+        self.protocolo_var = tk.StringVar(value="NINGUNO")
+        self.carga_var = tk.StringVar(value="EJEMPLO")
+        self.velocidad_var = tk.IntVar(value=10)
+        self.turbo_var = tk.BooleanVar(value=False)
+        self.tiempo_objetivo_var = tk.StringVar(value="")
+        self.max_ciclos_var = tk.IntVar(value=MAX_CICLOS)
+        self.max_ciclos = MAX_CICLOS  # Limite de la corrida en curso
+        self.multiproceso_var = tk.BooleanVar(value=False)
+        self.perfil_var = tk.StringVar(value="NINGUNO")
         self.simulacion_activa = False
         self.cola_mensajes = queue.Queue()
-
-        # Componentes del sistema
-        self.planificador = None
-        self.gestor_memoria = None
-        self.gestor_archivos = None
+        self.max_archivos_vista = 50
+
+        # Log de eventos: tags por tipo y limite de lineas visibles
+        self.colores_log = {
+            'INFO': ('info', '#00ff00'),
+            'SUCCESS': ('success', '#27ae60'),
+            'ERROR': ('error', '#e74c3c'),
+            'WARNING': ('warning', '#f39c12'),
+            None: ('default', '#ecf0f1')
+        }
+        self.max_lineas_log = 1000
+        self.lineas_log_descartadas = 0
+
+        # Estado del canvas de memoria (los elementos se crean una vez por disposicion)
+        self.colores_procesos = {1: '#3498db', 2: '#e74c3c', 3: '#2ecc71', 4: '#f39c12'}
+        self.items_marcos = []
+        self.contenido_marcos = []
+        self.item_stats_memoria = None
+        self.texto_stats_memoria = None
+        self.disposicion_memoria = None
+
+        # El hilo de simulacion publica instantaneas inmutables; la interfaz solo lee la ultima
+        self.buzon = BuzonInstantaneas()
+        self.control = None
+        self.motor_remoto = None
+
+        # Grabacion de la ultima corrida para la linea de tiempo
+        self.grabacion = None
+        self.salto_pendiente = None
+        self.series = None
 
         # Configurar estilo
         self.configurar_estilos()
@@ -192,6 +400,122 @@ class SimuladorGUI:
                               activeforeground=self.color_texto, font=('Arial', 9))
             rb.pack(anchor='w', padx=20)
 
+        # Modelo de accesos a memoria (localidad de referencia)
+        referencias_frame = tk.Frame(config_frame, bg=self.color_panel)
+        referencias_frame.pack(fill='x', pady=(5, 0))
+
+        tk.Label(referencias_frame, text="Referencias:",
+                bg=self.color_panel, fg=self.color_texto,
+                font=('Arial', 9)).pack(side='left')
+
+        ttk.Combobox(referencias_frame, textvariable=self.referencias_var,
+                     values=list(MODELOS_REFERENCIAS),
+                     state='readonly', width=12).pack(side='left', padx=10)
+
+        # Control de admision (planificador de largo plazo) y grado de multiprogramacion
+        admision_frame = tk.Frame(config_frame, bg=self.color_panel)
+        admision_frame.pack(fill='x', pady=(5, 0))
+
+        tk.Label(admision_frame, text="Admision:",
+                bg=self.color_panel, fg=self.color_texto,
+                font=('Arial', 9)).pack(side='left')
+
+        ttk.Combobox(admision_frame, textvariable=self.admision_var,
+                     values=list(POLITICAS_ADMISION),
+                     state='readonly', width=10).pack(side='left', padx=10)
+
+        tk.Label(admision_frame, text="Grado (0 = libre):",
+                bg=self.color_panel, fg=self.color_texto,
+                font=('Arial', 9)).pack(side='left')
+
+        ttk.Spinbox(admision_frame, from_=0, to=50, textvariable=self.grado_var,
+                    width=4, font=('Arial', 9)).pack(side='left', padx=5)
+
+        # Planificacion de disco
+        disco_frame = tk.Frame(config_frame, bg=self.color_panel)
+        disco_frame.pack(fill='x', pady=(10, 0))
+
+        tk.Label(disco_frame, text="Planificacion de Disco:",
+                bg=self.color_panel, fg=self.color_texto,
+                font=('Arial', 9)).pack(side='left')
+
+        ttk.Combobox(disco_frame, textvariable=self.disco_var,
+                     values=['FCFS', 'SSTF', 'SCAN', 'C-LOOK'],
+                     state='readonly', width=8).pack(side='left', padx=10)
+
+        # Protocolo contra inversion de prioridad en archivos
+        protocolo_frame = tk.Frame(config_frame, bg=self.color_panel)
+        protocolo_frame.pack(fill='x', pady=(5, 0))
+
+        tk.Label(protocolo_frame, text="Inversion de Prioridad:",
+                bg=self.color_panel, fg=self.color_texto,
+                font=('Arial', 9)).pack(side='left')
+
+        ttk.Combobox(protocolo_frame, textvariable=self.protocolo_var,
+                     values=['NINGUNO', 'HERENCIA', 'TECHO'],
+                     state='readonly', width=10).pack(side='left', padx=10)
+
+        # Carga de trabajo: los 4 procesos de ejemplo o un generador sintetico
+        carga_frame = tk.Frame(config_frame, bg=self.color_panel)
+        carga_frame.pack(fill='x', pady=(5, 0))
+
+        tk.Label(carga_frame, text="Carga:",
+                bg=self.color_panel, fg=self.color_texto,
+                font=('Arial', 9)).pack(side='left')
+
+        ttk.Combobox(carga_frame, textvariable=self.carga_var,
+                     values=['EJEMPLO', 'POISSON', 'RAFAGAS', 'TRAZA'],
+                     state='readonly', width=10).pack(side='left', padx=10)
+
+        # Velocidad de simulacion (ticks por segundo o sin limite)
+        velocidad_frame = tk.Frame(config_frame, bg=self.color_panel)
+        velocidad_frame.pack(fill='x', pady=(5, 0))
+
+        tk.Label(velocidad_frame, text="Ticks/s:",
+                bg=self.color_panel, fg=self.color_texto,
+                font=('Arial', 9)).pack(side='left')
+
+        self.velocidad_scale = tk.Scale(velocidad_frame, from_=1, to=50, orient='horizontal',
+                                        variable=self.velocidad_var, command=self.cambiar_velocidad,
+                                        bg=self.color_panel, fg=self.color_texto,
+                                        highlightthickness=0, length=120)
+        self.velocidad_scale.pack(side='left', padx=5)
+
+        tk.Checkbutton(velocidad_frame, text="Turbo", variable=self.turbo_var,
+                       command=self.cambiar_velocidad,
+                       bg=self.color_panel, fg=self.color_texto,
+                       selectcolor=self.color_acento, activebackground=self.color_panel,
+                       activeforeground=self.color_texto, font=('Arial', 9)).pack(side='left')
+
+        # Limite de ticks de la corrida
+        ciclos_frame = tk.Frame(config_frame, bg=self.color_panel)
+        ciclos_frame.pack(fill='x', pady=(5, 0))
+
+        tk.Label(ciclos_frame, text="Max. ticks:",
+                bg=self.color_panel, fg=self.color_texto,
+                font=('Arial', 9)).pack(side='left')
+
+        ttk.Spinbox(ciclos_frame, from_=1, to=1000000, increment=100, textvariable=self.max_ciclos_var,
+                    width=8, font=('Arial', 9)).pack(side='left', padx=10)
+
+        # Motor en un proceso aparte para que la GUI y la simulacion no compartan el GIL
+        tk.Checkbutton(config_frame, text="Motor en proceso separado", variable=self.multiproceso_var,
+                       bg=self.color_panel, fg=self.color_texto,
+                       selectcolor=self.color_acento, activebackground=self.color_panel,
+                       activeforeground=self.color_texto, font=('Arial', 9)).pack(anchor='w', pady=(5, 0))
+
+        # Perfilado opcional de las fases del ciclo
+        perfil_frame = tk.Frame(config_frame, bg=self.color_panel)
+        perfil_frame.pack(fill='x', pady=(5, 0))
+
+        tk.Label(perfil_frame, text="Perfilado:",
+                bg=self.color_panel, fg=self.color_texto,
+                font=('Arial', 9)).pack(side='left')
+
+        ttk.Combobox(perfil_frame, textvariable=self.perfil_var,
+                     values=list(MODOS_PERFIL),
+                     state='readonly', width=12).pack(side='left', padx=10)
+
         # Botones de control
         tk.Label(config_frame, text="",
                 bg=self.color_panel, fg=self.color_texto).pack(pady=10)
@@ -215,6 +539,34 @@ class SimuladorGUI:
                                      cursor='hand2', state='disabled')
         self.btn_detener.pack(fill='x', pady=5)
 
+        # Pausa, paso a paso y ejecucion hasta un tiempo
+        paso_frame = tk.Frame(buttons_frame, bg=self.color_panel)
+        paso_frame.pack(fill='x', pady=5)
+
+        self.btn_pausa = tk.Button(paso_frame, text="⏸ PAUSA", command=self.alternar_pausa,
+                                   bg=self.color_acento, fg='white', font=('Arial', 9, 'bold'),
+                                   relief='flat', cursor='hand2', state='disabled')
+        self.btn_pausa.pack(side='left', fill='x', expand=True, padx=(0, 2))
+
+        self.btn_paso = tk.Button(paso_frame, text="⏭ PASO", command=self.paso_simulacion,
+                                  bg=self.color_acento, fg='white', font=('Arial', 9, 'bold'),
+                                  relief='flat', cursor='hand2', state='disabled')
+        self.btn_paso.pack(side='left', fill='x', expand=True, padx=(2, 0))
+
+        hasta_frame = tk.Frame(buttons_frame, bg=self.color_panel)
+        hasta_frame.pack(fill='x', pady=5)
+
+        tk.Label(hasta_frame, text="Hasta T:",
+                bg=self.color_panel, fg=self.color_texto,
+                font=('Arial', 9)).pack(side='left')
+
+        tk.Entry(hasta_frame, textvariable=self.tiempo_objetivo_var, width=6).pack(side='left', padx=5)
+
+        self.btn_hasta = tk.Button(hasta_frame, text="⏩ EJECUTAR", command=self.ejecutar_hasta_tiempo,
+                                   bg=self.color_acento, fg='white', font=('Arial', 9, 'bold'),
+                                   relief='flat', cursor='hand2', state='disabled')
+        self.btn_hasta.pack(side='left', fill='x', expand=True)
+
         self.btn_limpiar = tk.Button(buttons_frame, text="🗑️ LIMPIAR",
                                      command=self.limpiar_pantalla,
                                      bg='#95a5a6', fg='white',
@@ -287,6 +639,16 @@ class SimuladorGUI:
         self.metricas_text.insert('1.0', "Esperando inicio de simulacion...")
         self.metricas_text.config(state='disabled')
 
+        # Linea de tiempo: al terminar una corrida permite volver a cualquier tick
+        tk.Label(estado_frame, text="Linea de tiempo:", bg=self.color_panel,
+                fg=self.color_texto, font=('Arial', 10, 'bold')).pack(anchor='w', pady=(10, 0))
+
+        self.linea_tiempo = tk.Scale(estado_frame, from_=0, to=0, orient='horizontal',
+                                     command=self.mover_linea_tiempo, state='disabled',
+                                     bg=self.color_panel, fg=self.color_texto,
+                                     highlightthickness=0)
+        self.linea_tiempo.pack(fill='x')
+
     def crear_panel_visualizacion(self, parent):
         """Crea el panel de visualizacion principal"""
         # Notebook con pestanas
@@ -304,6 +666,15 @@ class SimuladorGUI:
                                                   relief='flat',
                                                   padx=10, pady=10)
         self.log_text.pack(fill='both', expand=True, padx=5, pady=5)
+
+        # Los tags de color se configuran una sola vez
+        for tag, color in self.colores_log.values():
+            self.log_text.tag_config(tag, foreground=color)
+
+        self.log_descartadas_label = tk.Label(log_frame, text="",
+                                              bg=self.color_panel, fg='#f39c12',
+                                              font=('Arial', 8), anchor='w')
+        self.log_descartadas_label.pack(fill='x', padx=5, pady=(0, 5))
         self.agregar_log("Sistema iniciado. Configurar parametros e iniciar simulacion.", "INFO")
 
         # Pestana de Memoria
@@ -330,13 +701,8 @@ class SimuladorGUI:
         gantt_frame = tk.Frame(notebook, bg=self.color_panel)
         notebook.add(gantt_frame, text="📊 Diagrama de Gantt")
 
-        self.gantt_text = scrolledtext.ScrolledText(gantt_frame,
-                                                    bg='#1c2833',
-                                                    fg=self.color_texto,
-                                                    font=('Courier', 9),
-                                                    relief='flat',
-                                                    padx=10, pady=10)
-        self.gantt_text.pack(fill='both', expand=True, padx=5, pady=5)
+        self.gantt = DiagramaGantt(gantt_frame, self.color_proceso, color_texto=self.color_texto)
+        self.gantt.pack(fill='both', expand=True, padx=5, pady=5)
 
         # Pestana de Metricas Finales
         metricas_frame = tk.Frame(notebook, bg=self.color_panel)
@@ -350,6 +716,13 @@ class SimuladorGUI:
                                                               padx=10, pady=10)
         self.metricas_finales_text.pack(fill='both', expand=True, padx=5, pady=5)
 
+        self.btn_exportar_series = tk.Button(metricas_frame, text="💾 Exportar series por tick",
+                                             command=self.exportar_series,
+                                             bg=self.color_acento, fg='white',
+                                             font=('Arial', 9, 'bold'), relief='flat',
+                                             cursor='hand2', state='disabled')
+        self.btn_exportar_series.pack(anchor='e', padx=5, pady=(0, 5))
+
     def actualizar_quantum_estado(self):
         """Actualiza el estado del spinbox de quantum"""
         if self.algoritmo_var.get() == "RR":
@@ -359,49 +732,149 @@ class SimuladorGUI:
             self.quantum_label.config(state='disabled')
             self.quantum_spinbox.config(state='disabled')
 
+    def cambiar_velocidad(self, *_):
+        """Aplica la velocidad elegida a la simulacion en curso"""
+        if self.control:
+            self.control.fijar_velocidad(0 if self.turbo_var.get() else self.velocidad_var.get())
+
+    def alternar_pausa(self):
+        """Pausa o reanuda la simulacion"""
+        if not self.control:
+            return
+        if self.control.pausado:
+            self.control.reanudar()
+        else:
+            self.control.pausar()
+        self.actualizar_botones_control()
+
+    def paso_simulacion(self):
+        """Ejecuta un unico tick y deja la simulacion en pausa"""
+        if self.control:
+            self.control.paso()
+            self.actualizar_botones_control()
+
+    def ejecutar_hasta_tiempo(self):
+        """Ejecuta sin limite de velocidad hasta el tiempo indicado"""
+        if not self.control:
+            return
+        try:
+            tiempo = int(self.tiempo_objetivo_var.get())
+        except ValueError:
+            messagebox.showwarning("Tiempo invalido", "Ingrese un tiempo entero")
+            return
+        if tiempo > self.max_ciclos:
+            messagebox.showwarning("Tiempo fuera de alcance",
+                                   f"La corrida se detiene en T{self.max_ciclos} (Max. ticks); "
+                                   f"no llegara a T{tiempo}")
+            return
+        self.control.ejecutar_hasta(tiempo)
+        self.actualizar_botones_control()
+
+    def actualizar_botones_control(self):
+        """Sincroniza los botones de pausa/paso con el estado del control"""
+        activo = 'normal' if self.simulacion_activa else 'disabled'
+        for boton in (self.btn_pausa, self.btn_paso, self.btn_hasta):
+            boton.config(state=activo)
+        pausado = self.control is not None and self.control.pausado
+        self.btn_pausa.config(text="▶ REANUDAR" if pausado else "⏸ PAUSA")
+
+    def cargar_linea_tiempo(self, grabacion):
+        """Habilita la linea de tiempo con la grabacion de la corrida terminada"""
+        self.grabacion = grabacion
+        self.linea_tiempo.config(state='normal', to=grabacion.total_ticks)
+        self.linea_tiempo.set(grabacion.total_ticks)
+        self.gantt.cargar(SegmentosGantt.desde_grabacion(grabacion))
+
+    def mover_linea_tiempo(self, _valor):
+        """Agrupa los movimientos del deslizador y salta solo a la ultima posicion"""
+        if self.grabacion is None:
+            return
+        if self.salto_pendiente is not None:
+            self.root.after_cancel(self.salto_pendiente)
+        self.salto_pendiente = self.root.after(50, self.saltar_a_tick)
+
+    def saltar_a_tick(self):
+        """Restaura el checkpoint mas cercano, repite hasta el tick elegido y lo muestra"""
+        self.salto_pendiente = None
+        motor = self.grabacion.restaurar(int(self.linea_tiempo.get()), con_historial=False)
+        instantanea = motor.tomar_instantanea()
+        self.actualizar_estado_sistema(instantanea)
+        self.actualizar_visualizacion_memoria(instantanea)
+        self.actualizar_archivos(instantanea)
+
+    def cargar_series(self, series):
+        """Guarda las series por tick de la corrida terminada para exportarlas"""
+        self.series = series
+        self.btn_exportar_series.config(state='normal')
+
+    def exportar_series(self):
+        """Exporta las series por tick a CSV o al formato binario columnar"""
+        if self.series is None:
+            return
+        ruta = filedialog.asksaveasfilename(title="Exportar series por tick",
+                                            defaultextension='.csv',
+                                            filetypes=[("CSV", "*.csv"), ("Binario columnar", "*.bin")])
+        if not ruta:
+            return
+        if ruta.endswith('.bin'):
+            self.series.exportar_binario(ruta)
+        else:
+            self.series.exportar_csv(ruta)
+        self.agregar_log(f"Series exportadas a {ruta} ({len(self.series)} filas)", "SUCCESS")
+
     def agregar_log(self, mensaje, tipo="INFO"):
         """Agrega un mensaje al log"""
-        self.log_text.config(state='normal')
+        self.agregar_logs([(mensaje, tipo)])
+
+    def agregar_logs(self, mensajes):
+        """Agrega un lote de mensajes al log con una sola insercion"""
+        if not mensajes:
+            return
 
         timestamp = f"[T{getattr(self, 'tiempo_actual', 0):3d}]"
 
-        if tipo == "INFO":
-            color_tag = 'info'
-            self.log_text.tag_config('info', foreground='#00ff00')
-        elif tipo == "SUCCESS":
-            color_tag = 'success'
-            self.log_text.tag_config('success', foreground='#27ae60')
-        elif tipo == "ERROR":
-            color_tag = 'error'
-            self.log_text.tag_config('error', foreground='#e74c3c')
-        elif tipo == "WARNING":
-            color_tag = 'warning'
-            self.log_text.tag_config('warning', foreground='#f39c12')
-        else:
-            color_tag = 'default'
-            self.log_text.tag_config('default', foreground='#ecf0f1')
+        # insert acepta pares (texto, tag) consecutivos
+        argumentos = []
+        for mensaje, tipo in mensajes:
+            color_tag = self.colores_log.get(tipo, self.colores_log[None])[0]
+            argumentos.append(f"{timestamp} [{tipo}] {mensaje}\n")
+            argumentos.append(color_tag)
+
+        self.log_text.config(state='normal')
+        self.log_text.insert('end', *argumentos)
+
+        # Mantener solo las ultimas max_lineas_log lineas
+        lineas = int(self.log_text.index('end-1c').split('.')[0]) - 1
+        exceso = lineas - self.max_lineas_log
+        if exceso > 0:
+            self.log_text.delete('1.0', f'{exceso + 1}.0')
+            self.lineas_log_descartadas += exceso
+            self.log_descartadas_label.config(
+                text=f"Lineas descartadas: {self.lineas_log_descartadas} (se muestran las ultimas {self.max_lineas_log})")
 
-        self.log_text.insert('end', f"{timestamp} [{tipo}] {mensaje}\n", color_tag)
         self.log_text.see('end')
         self.log_text.config(state='disabled')
 
-    def actualizar_visualizacion_memoria(self):
-        """Actualiza la visualizacion de la memoria"""
-        if not self.gestor_memoria:
-            return
-
+    def color_proceso(self, proceso_id):
+        """Devuelve un color estable para cada proceso (sin limite de procesos)"""
+        if proceso_id is None:
+            return self.color_panel
+        color = self.colores_procesos.get(proceso_id)
+        if color is None:
+            # Tono repartido con la razon aurea para que procesos vecinos se distingan
+            tono = (proceso_id * 0.618033988749895) % 1
+            r, g, b = colorsys.hsv_to_rgb(tono, 0.65, 0.85)
+            color = f'#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}'
+            self.colores_procesos[proceso_id] = color
+        return color
+
+    def crear_marcos_memoria(self, width, marcos_totales, algoritmo):
+        """Crea una vez los elementos del canvas de memoria para la disposicion actual"""
         self.memoria_canvas.delete('all')
-        width = self.memoria_canvas.winfo_width()
-        height = self.memoria_canvas.winfo_height()
-
-        if width <= 1:
-            width = 800
-        if height <= 1:
-            height = 600
 
         # Titulo
         self.memoria_canvas.create_text(width/2, 30,
-                                       text=f"MEMORIA RAM - {self.gestor_memoria.algoritmo_reemplazo}",
+                                       text=f"MEMORIA RAM - {algoritmo}",
                                        fill='white', font=('Arial', 12, 'bold'))
 
         # Dibujar marcos
@@ -410,84 +883,81 @@ class SimuladorGUI:
         marco_height = 60
         start_y = 70
 
-        colores_procesos = {
-            1: '#3498db',
-            2: '#e74c3c',
-            3: '#2ecc71',
-            4: '#f39c12',
-            None: '#34495e'
-        }
-
-        for i in range(self.gestor_memoria.marcos_totales):
+        self.items_marcos = []
+        for i in range(marcos_totales):
             fila = i // marcos_por_fila
             col = i % marcos_por_fila
 
             x = 50 + col * marco_width
             y = start_y + fila * (marco_height + 20)
 
-            pagina_id = self.gestor_memoria.marcos[i]
+            rect = self.memoria_canvas.create_rectangle(x, y, x + marco_width - 10, y + marco_height,
+                                                        fill=self.color_proceso(None), outline='white', width=2)
+            texto = self.memoria_canvas.create_text(x + marco_width/2 - 5, y + marco_height/2,
+                                                    text=f"Marco {i}\nLIBRE", fill='white',
+                                                    font=('Arial', 9, 'bold'))
+            self.items_marcos.append((rect, texto))
 
-            # Determinar proceso
-            proceso_id = None
-            if pagina_id is not None:
-                for id_proc, paginas in self.gestor_memoria.tabla_paginas.items():
-                    for pag in paginas:
-                        if pag.id_pagina == pagina_id:
-                            proceso_id = id_proc
-                            break
+        # Estadisticas
+        stats_y = start_y + ((marcos_totales // marcos_por_fila) + 1) * (marco_height + 20)
+        self.item_stats_memoria = self.memoria_canvas.create_text(width/2, stats_y + 20, text="",
+                                                                 fill='#f39c12', font=('Arial', 11, 'bold'))
 
-            color = colores_procesos.get(proceso_id, colores_procesos[None])
+        # -1 obliga a pintar cada marco en la primera actualizacion
+        self.contenido_marcos = [-1] * marcos_totales
+        self.texto_stats_memoria = None
+        self.disposicion_memoria = (width, marcos_totales, algoritmo)
 
-            # Dibujar marco
-            self.memoria_canvas.create_rectangle(x, y, x + marco_width - 10, y + marco_height,
-                                                fill=color, outline='white', width=2)
+    def actualizar_visualizacion_memoria(self, instantanea):
+        """Actualiza la visualizacion de la memoria (solo los marcos que cambiaron)"""
+        width = self.memoria_canvas.winfo_width()
+        if width <= 1:
+            width = 800
 
-            # Texto
-            texto = f"Marco {i}\n"
-            if proceso_id is not None:
-                texto += f"P{proceso_id}"
-            else:
-                texto += "LIBRE"
+        disposicion = (width, len(instantanea.marcos), instantanea.algoritmo_memoria)
+        if disposicion != self.disposicion_memoria:
+            self.crear_marcos_memoria(*disposicion)
 
-            self.memoria_canvas.create_text(x + marco_width/2 - 5, y + marco_height/2,
-                                          text=texto, fill='white',
-                                          font=('Arial', 9, 'bold'))
+        for i, (rect, texto) in enumerate(self.items_marcos):
+            proceso_id = instantanea.marcos[i]
+            if self.contenido_marcos[i] == proceso_id:
+                continue
+            self.contenido_marcos[i] = proceso_id
 
-        # Estadisticas
-        stats_y = start_y + ((self.gestor_memoria.marcos_totales // marcos_por_fila) + 1) * (marco_height + 20)
-        self.memoria_canvas.create_text(width/2, stats_y + 20,
-                                       text=f"Fallos de Pagina: {self.gestor_memoria.fallos_pagina} | Reemplazos: {self.gestor_memoria.reemplazos}",
-                                       fill='#f39c12', font=('Arial', 11, 'bold'))
+            etiqueta = f"P{proceso_id}" if proceso_id is not None else "LIBRE"
+            self.memoria_canvas.itemconfigure(rect, fill=self.color_proceso(proceso_id))
+            self.memoria_canvas.itemconfigure(texto, text=f"Marco {i}\n{etiqueta}")
 
-    def actualizar_estado_sistema(self):
-        """Actualiza el panel de estado del sistema"""
-        if not self.planificador:
-            return
+        stats_mem = instantanea.estadisticas_memoria
+        texto_stats = f"Fallos de Pagina: {stats_mem['fallos_pagina']} | Reemplazos: {stats_mem['reemplazos']}"
+        if texto_stats != self.texto_stats_memoria:
+            self.texto_stats_memoria = texto_stats
+            self.memoria_canvas.itemconfigure(self.item_stats_memoria, text=texto_stats)
 
+    def actualizar_estado_sistema(self, instantanea):
+        """Actualiza el panel de estado del sistema"""
         # Actualizar tiempo
-        self.tiempo_actual = self.planificador.tiempo_actual
+        self.tiempo_actual = instantanea.tiempo
         self.tiempo_label.config(text=f"Tiempo: {self.tiempo_actual}")
 
         # Actualizar CPU
-        if self.planificador.proceso_actual:
-            self.cpu_label.config(text=str(self.planificador.proceso_actual),
-                                fg='#27ae60')
+        if instantanea.cpu:
+            self.cpu_label.config(text=instantanea.cpu, fg='#27ae60')
         else:
             self.cpu_label.config(text="IDLE", fg='#f39c12')
 
         # Actualizar colas
-        listos = [str(p) for p in self.planificador.cola_listos]
+        listos = list(instantanea.listos)
         self.listos_label.config(text=str(listos) if listos else "[]")
 
-        bloqueados = [str(p) for p in self.planificador.cola_bloqueados]
+        bloqueados = list(instantanea.bloqueados)
         self.bloqueados_label.config(text=str(bloqueados) if bloqueados else "[]")
 
         # Actualizar metricas
-        if self.gestor_memoria and self.gestor_archivos:
-            stats_mem = self.gestor_memoria.obtener_estadisticas()
-            stats_arch = self.gestor_archivos.obtener_estadisticas()
+        stats_mem = instantanea.estadisticas_memoria
+        stats_arch = instantanea.estadisticas_archivos
 
-            metricas_texto = f"""
+        metricas_texto = f"""
 MEMORIA:
   Marcos ocupados: {stats_mem['marcos_ocupados']}/{stats_mem['marcos_totales']}
   Fallos pagina: {stats_mem['fallos_pagina']}
@@ -497,23 +967,19 @@ ARCHIVOS:
   Bloqueados: {stats_arch['archivos_bloqueados']}/{stats_arch['archivos_totales']}
   Operaciones: {stats_arch['operaciones_exitosas']}
   Conflictos: {stats_arch['conflictos_totales']}
-            """
+  Cache aciertos: {stats_arch.get('cache', {}).get('tasa_aciertos', 0):.1f}%
+        """
 
-            self.metricas_text.config(state='normal')
-            self.metricas_text.delete('1.0', 'end')
-            self.metricas_text.insert('1.0', metricas_texto.strip())
-            self.metricas_text.config(state='disabled')
+        self.metricas_text.config(state='normal')
+        self.metricas_text.delete('1.0', 'end')
+        self.metricas_text.insert('1.0', metricas_texto.strip())
+        self.metricas_text.config(state='disabled')
 
-    def actualizar_archivos(self):
+    def actualizar_archivos(self, instantanea):
         """Actualiza la visualizacion de archivos"""
-        if not self.gestor_archivos:
-            return
-
         self.archivos_text.config(state='normal')
         self.archivos_text.delete('1.0', 'end')
-
-        texto = self.gestor_archivos.visualizar_estado()
-        self.archivos_text.insert('1.0', texto)
+        self.archivos_text.insert('1.0', instantanea.vista_archivos)
         self.archivos_text.config(state='disabled')
 
     def limpiar_pantalla(self):
@@ -521,20 +987,21 @@ ARCHIVOS:
         self.log_text.config(state='normal')
         self.log_text.delete('1.0', 'end')
         self.log_text.config(state='disabled')
+        self.lineas_log_descartadas = 0
+        self.log_descartadas_label.config(text="")
 
         self.archivos_text.config(state='normal')
         self.archivos_text.delete('1.0', 'end')
         self.archivos_text.config(state='disabled')
 
-        self.gantt_text.config(state='normal')
-        self.gantt_text.delete('1.0', 'end')
-        self.gantt_text.config(state='disabled')
+        self.gantt.cargar(None)
 
         self.metricas_finales_text.config(state='normal')
         self.metricas_finales_text.delete('1.0', 'end')
         self.metricas_finales_text.config(state='disabled')
 
         self.memoria_canvas.delete('all')
+        self.disposicion_memoria = None
 
         self.agregar_log("Pantalla limpiada", "INFO")
 
@@ -543,130 +1010,153 @@ ARCHIVOS:
         Crea procesos de ejemplo.
         Si aleatorio==True genera valores aleatorios para duracion/prioridad/llegada.
         Si seed no es None, se fija la semilla para reproducibilidad.
+        Usa generadores propios (no el global de random) para la carga y los archivos.
         """
-        if seed is not None:
-            random.seed(seed)
-        else:
+        if seed is None:
             # Semilla variable para que cada corrida sea distinta
-            random.seed(time.time_ns() & 0xFFFFFFFF)
+            seed = time.time_ns() & 0xFFFFFFFF
+        rng = random.Random(derivar_semilla(seed, 'carga'))
+        rng_archivos = random.Random(derivar_semilla(seed, 'archivos'))
 
         procesos = []
         num_procs = 4
 
         for i in range(1, num_procs + 1):
-            prioridad = random.randint(1, 5)              # 1..5
-            duracion_total = random.randint(4, 14)        # duracion entre 4 y 14
-            tiempo_llegada = random.randint(0, 6)         # llegada temprana entre 0 y 6
-            memoria_requerida = random.randint(1, 4)      # paginas necesarias
+            prioridad = rng.randint(1, 5)                 # 1..5
+            duracion_total = rng.randint(4, 14)           # duracion entre 4 y 14
+            tiempo_llegada = rng.randint(0, 6)            # llegada temprana entre 0 y 6
+            memoria_requerida = rng.randint(1, 4)         # paginas necesarias
             # Elegir archivos aleatorios (pueden repetirse): tomamos de los archivos conocidos del gestor
             archivos_disponibles = ['config.txt', 'data.db', 'log.txt', 'temp.txt']
-            archivos_necesarios = random.sample(archivos_disponibles, random.randint(0, 2))
+            archivos_necesarios = rng_archivos.sample(archivos_disponibles, rng_archivos.randint(0, 2))
 
             p = Proceso(i, prioridad, duracion_total, tiempo_llegada, memoria_requerida, archivos_necesarios)
             procesos.append(p)
 
         return procesos
 
+    def crear_carga(self, tipo: str):
+        """
+        Procesos de la corrida: la lista de ejemplo, un GeneradorCarga con llegadas
+        Poisson o en rafagas o una traza CSV/JSONL (ambos se leen de a un proceso a
+        medida que avanza el tiempo). None si se cancelo la eleccion de la traza
+        """
+        if tipo == 'EJEMPLO':
+            return self.crear_procesos_ejemplo(aleatorio=True)
+        if tipo == 'TRAZA':
+            ruta = filedialog.askopenfilename(title="Traza de procesos",
+                                              filetypes=[("Trazas", "*.csv *.jsonl"), ("Todos", "*.*")])
+            return LectorTraza(ruta) if ruta else None
+        return GeneradorCarga(total=40, llegadas=tipo, tasa_llegada=0.4,
+                              duracion_media=6, duracion_maxima=30,
+                              semilla=time.time_ns() & 0xFFFFFFFF)
+
     def iniciar_simulacion(self):
         """Inicia la simulacion en un thread separado"""
         if self.simulacion_activa:
             return
 
+        try:
+            procesos = self.crear_carga(self.carga_var.get())
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Carga de trabajo", f"No se pudo abrir la traza: {e}")
+            return
+        if procesos is None:
+            return
+
         self.simulacion_activa = True
         self.btn_iniciar.config(state='disabled')
         self.btn_detener.config(state='normal')
 
         # Limpiar pantalla
         self.limpiar_pantalla()
+        self.grabacion = None
+        self.linea_tiempo.config(state='disabled')
+        self.series = None
+        self.btn_exportar_series.config(state='disabled')
+
+        # Las variables de Tk solo se leen desde el hilo de la interfaz
+        protocolo = self.protocolo_var.get()
+        configuracion = {
+            'algoritmo': self.algoritmo_var.get(),
+            'quantum': self.quantum_var.get(),
+            'algoritmo_memoria': self.memoria_var.get(),
+            'modelo_referencias': self.referencias_var.get(),
+            'admision': self.admision_var.get(),
+            'grado_multiprogramacion': self.grado_var.get() or None,
+            'algoritmo_disco': self.disco_var.get(),
+            'protocolo_prioridad': None if protocolo == 'NINGUNO' else protocolo,
+            'max_archivos_vista': self.max_archivos_vista
+        }
+        ticks_por_segundo = 0 if self.turbo_var.get() else self.velocidad_var.get()
+        perfilado = self.perfil_var.get()
+        try:
+            self.max_ciclos = max(1, self.max_ciclos_var.get())
+        except tk.TclError:
+            self.max_ciclos = MAX_CICLOS
+
+        if self.multiproceso_var.get():
+            # El proceso hijo recibe los comandos por el Pipe; la API es la de ControlVelocidad
+            self.agregar_log(f"Iniciando simulacion en proceso separado: {configuracion['algoritmo']} | Quantum: {configuracion['quantum']} | Memoria: {configuracion['algoritmo_memoria']} | Disco: {configuracion['algoritmo_disco']}", "SUCCESS")
+            self.motor_remoto = MotorRemoto(configuracion, procesos,
+                                            ticks_por_segundo=ticks_por_segundo, max_ciclos=self.max_ciclos,
+                                            perfilado=perfilado)
+            self.control = self.motor_remoto
+            self.actualizar_botones_control()
+            return
+
+        self.motor_remoto = None
+        self.control = ControlVelocidad(ticks_por_segundo=ticks_por_segundo)
+        self.actualizar_botones_control()
 
         # Crear thread de simulacion
-        thread = threading.Thread(target=self.ejecutar_simulacion, daemon=True)
+        thread = threading.Thread(target=self.ejecutar_simulacion,
+                                  args=(configuracion, procesos, self.max_ciclos, perfilado), daemon=True)
         thread.start()
 
     def detener_simulacion(self):
         """Detiene la simulacion"""
         self.simulacion_activa = False
+        if self.control:
+            self.control.detener()
         self.btn_iniciar.config(state='normal')
         self.btn_detener.config(state='disabled')
+        self.actualizar_botones_control()
         self.agregar_log("Simulacion detenida por el usuario", "WARNING")
 
-    def ejecutar_simulacion(self):
+    def ejecutar_simulacion(self, configuracion, procesos, max_ciclos=MAX_CICLOS, perfilado='NINGUNO'):
         """Ejecuta la simulacion (corre en thread separado)"""
         try:
-            algoritmo = self.algoritmo_var.get()
-            quantum = self.quantum_var.get()
-            algoritmo_memoria = self.memoria_var.get()
-
-            self.cola_mensajes.put(('log', f"Iniciando simulacion: {algoritmo} | Quantum: {quantum} | Memoria: {algoritmo_memoria}", "SUCCESS"))
-
-            # Inicializar componentes
-            self.planificador = Planificador(algoritmo=algoritmo, quantum=quantum)
-            self.gestor_memoria = GestorMemoria(marcos_totales=6, algoritmo_reemplazo=algoritmo_memoria)
-            self.gestor_archivos = GestorArchivos(['config.txt', 'data.db', 'log.txt', 'temp.txt'])
-
-            # Crear y agregar procesos
-            procesos = self.crear_procesos_ejemplo(aleatorio=True)
-            for proceso in procesos:
-                self.planificador.agregar_proceso(proceso)
-                self.cola_mensajes.put(('log', f"Proceso P{proceso.id} agregado - Duracion: {proceso.duracion_total}", "INFO"))
-
-            # Ciclo de simulacion
-            max_ciclos = 100
-            ciclo = 0
-
-            while self.planificador.hay_procesos_activos() and ciclo < max_ciclos and self.simulacion_activa:
-                ciclo += 1
-
-                # Sincronizar tiempos
-                self.gestor_memoria.tiempo_actual = self.planificador.tiempo_actual
-                self.gestor_archivos.tiempo_actual = self.planificador.tiempo_actual
-
-                # Verificar llegadas
-                self.planificador.verificar_llegadas()
-
-                # Asignar memoria
-                for proceso in list(self.planificador.cola_listos):
-                    if proceso.id not in self.gestor_memoria.tabla_paginas:
-                        self.gestor_memoria.asignar_memoria(proceso)
-
-                # Ejecutar ciclo
-                if self.planificador.ejecutar_ciclo():
-                    proceso_actual = self.planificador.proceso_actual
-
-                    if proceso_actual:
-                        self.gestor_memoria.acceder_memoria(proceso_actual)
-
-                        # I/O
-                        if proceso_actual.necesita_io():
-                            archivo_necesario = proceso_actual.obtener_archivo_actual()
-
-                            if archivo_necesario:
-                                if self.gestor_archivos.solicitar_acceso(proceso_actual, archivo_necesario):
-                                    proceso_actual.realizar_io()
-                                    self.gestor_archivos.liberar_archivo(archivo_necesario, proceso_actual)
-                                    self.cola_mensajes.put(('log', f"P{proceso_actual.id} accedio a {archivo_necesario}", "SUCCESS"))
-                                else:
-                                    proceso_actual.archivo_actual = archivo_necesario
-                                    self.planificador.bloquear_proceso(proceso_actual)
-                                    self.cola_mensajes.put(('log', f"P{proceso_actual.id} bloqueado esperando {archivo_necesario}", "WARNING"))
-
-                # Verificar desbloqueos
-                self.gestor_archivos.verificar_desbloqueos_pendientes(self.planificador)
-
-                # Actualizar interfaz periodicamente
-                if ciclo % 5 == 0:
-                    self.cola_mensajes.put(('actualizar', None, None))
-
-                # Pequena pausa para visualizacion
-                import time
-                time.sleep(0.1)
-
-            # Liberar memoria
-            for proceso in self.planificador.procesos_terminados:
-                self.gestor_memoria.liberar_memoria(proceso)
+            self.cola_mensajes.put(('log', f"Iniciando simulacion: {configuracion['algoritmo']} | Quantum: {configuracion['quantum']} | Memoria: {configuracion['algoritmo_memoria']} | Disco: {configuracion['algoritmo_disco']}", "SUCCESS"))
+
+            # El motor es propiedad exclusiva de este hilo
+            motor = MotorSimulacion(**configuracion)
+
+            # Agregar procesos (una lista o una fuente que se consume al llegar)
+            self.encolar_logs(motor.agregar_carga(procesos))
+
+            # Ciclo de simulacion (grabado para la linea de tiempo)
+            grabacion = Grabacion()
+            series = SeriesTiempo()
+            perfilador = crear_perfilador(perfilado)
+            if perfilador is not None:
+                perfilador.activar()
+            try:
+                motor.correr(self.control, max_ciclos=max_ciclos,
+                             registrar=self.encolar_logs,
+                             publicar=self.buzon.publicar,
+                             continuar=lambda: self.simulacion_activa,
+                             observadores=(grabacion, series))
+            finally:
+                if perfilador is not None:
+                    perfilador.desactivar()
 
             # Mostrar resultados finales
-            self.cola_mensajes.put(('finalizar', None, None))
+            self.cola_mensajes.put(('grabacion', grabacion, None))
+            self.cola_mensajes.put(('series', series, None))
+            self.cola_mensajes.put(('finalizar', motor.resumen_final(), None))
+            if perfilador is not None:
+                self.cola_mensajes.put(('perfil', perfilador.reporte(), None))
 
         except Exception as e:
             self.cola_mensajes.put(('log', f"Error en simulacion: {str(e)}", "ERROR"))
@@ -674,15 +1164,19 @@ ARCHIVOS:
             self.simulacion_activa = False
             self.cola_mensajes.put(('detener', None, None))
 
-    def mostrar_resultados_finales(self):
-        """Muestra los resultados finales de la simulacion"""
-        if not self.planificador:
-            return
+    def encolar_logs(self, eventos):
+        """Envia a la interfaz los eventos de un tick (llamado desde el hilo de simulacion)"""
+        for mensaje, tipo in eventos:
+            self.cola_mensajes.put(('log', mensaje, tipo))
 
+    def mostrar_resultados_finales(self, resumen):
+        """Muestra los resultados finales de la simulacion"""
         # Metricas
-        metricas = self.planificador.calcular_metricas()
-        stats_mem = self.gestor_memoria.obtener_estadisticas()
-        stats_arch = self.gestor_archivos.obtener_estadisticas()
+        metricas = resumen['metricas']
+        stats_mem = resumen['memoria']
+        stats_arch = resumen['archivos']
+        stats_disco = stats_arch.get('disco', {})
+        stats_cache = stats_arch.get('cache', {})
 
         texto_metricas = f"""
 ╔══════════════════════════════════════════════════════════════╗
@@ -700,8 +1194,9 @@ ARCHIVOS:
   • Marcos totales:            {stats_mem['marcos_totales']}
   • Marcos ocupados:           {stats_mem['marcos_ocupados']}
   • Marcos libres:             {stats_mem['marcos_libres']}
-  • Fallos de pagina:          {stats_mem['fallos_pagina']}
+  • Fallos de pagina:          {stats_mem['fallos_pagina']} ({stats_mem['tasa_fallos']:.2f}% de {stats_mem['accesos']} accesos)
   • Reemplazos:                {stats_mem['reemplazos']}
+  • Marcos liberados al terminar: {stats_mem['marcos_liberados']}
 
 [SISTEMA DE ARCHIVOS]
   • Archivos totales:          {stats_arch['archivos_totales']}
@@ -709,6 +1204,39 @@ ARCHIVOS:
   • Archivos libres:           {stats_arch['archivos_libres']}
   • Operaciones exitosas:      {stats_arch['operaciones_exitosas']}
   • Conflictos totales:        {stats_arch['conflictos_totales']}
+  • Protocolo de prioridad:    {stats_arch['protocolo_prioridad']} ({stats_arch['elevaciones_prioridad']} elevaciones)
+  • Espera alta prio p50/p90/p99: {stats_arch['espera_alta_p50']}/{stats_arch['espera_alta_p90']}/{stats_arch['espera_alta_p99']} ticks
+
+[DISCO]
+  • Planificacion:             {stats_disco.get('algoritmo', '-')}
+  • Peticiones completadas:    {stats_disco.get('solicitudes_completadas', 0)}
+  • Distancia de busqueda:     {stats_disco.get('distancia_busqueda_total', 0)} bloques
+  • Latencia I/O p50/p90/p99:  {stats_disco.get('latencia_p50', 0)}/{stats_disco.get('latencia_p90', 0)}/{stats_disco.get('latencia_p99', 0)} ticks
+  • Utilizacion del disco:     {stats_disco.get('utilizacion', 0):.2f}%
+
+[BUFFER CACHE]
+  • Politica / capacidad:      {stats_cache.get('politica', '-')} / {stats_cache.get('capacidad', 0)} bloques
+  • Tasa de aciertos:          {stats_cache.get('tasa_aciertos', 0):.2f}%
+  • Bloques escritos (flush):  {stats_cache.get('bloques_escritos_flush', 0)} en {stats_cache.get('flushes', 0)} flushes
+  • Bloques escritos (desalojo): {stats_cache.get('bloques_escritos_desalojo', 0)}
+"""
+
+        if 'admision' in metricas:
+            texto_metricas += f"""
+[ADMISION]
+  • Politica:                  {metricas['admision']}
+  • Grado de multiprog. maximo: {metricas['grado_multiprogramacion_max']}
+  • Procesos demorados:        {metricas['procesos_demorados']}
+  • Espera de admision prom.:  {metricas['espera_admision_promedio']:.2f} unidades
+"""
+
+        stats_fuente = resumen.get('fuente', {})
+        if 'segundos_analisis' in stats_fuente:
+            texto_metricas += f"""
+[TRAZA]
+  • Archivo:                   {stats_fuente['ruta']} ({stats_fuente['formato']})
+  • Procesos leidos:           {stats_fuente['procesos']} ({stats_fuente['invalidas']} lineas invalidas, {stats_fuente['desordenados']} fuera de orden)
+  • Rendimiento del analisis:  {stats_fuente['procesos_por_segundo']} procesos/s, {stats_fuente['mb_por_segundo']} MB/s
 """
 
         self.metricas_finales_text.config(state='normal')
@@ -716,38 +1244,85 @@ ARCHIVOS:
         self.metricas_finales_text.insert('1.0', texto_metricas)
         self.metricas_finales_text.config(state='disabled')
 
-        # Diagrama de Gantt
-        gantt = self.planificador.generar_diagrama_gantt()
-        self.gantt_text.config(state='normal')
-        self.gantt_text.delete('1.0', 'end')
-        self.gantt_text.insert('1.0', gantt)
-        self.gantt_text.config(state='disabled')
+        # El diagrama de Gantt se dibuja desde la grabacion (cargar_linea_tiempo)
 
-        # Log de archivos
-        log_archivos = self.gestor_archivos.obtener_log_completo()
         self.agregar_log("Simulacion completada exitosamente", "SUCCESS")
 
+    def recibir_motor_remoto(self):
+        """Procesa los mensajes que el motor en proceso separado envio por el Pipe"""
+        for tipo_msg, contenido in self.motor_remoto.recibir():
+            if tipo_msg == 'estado':
+                eventos, instantanea, _ = contenido
+                self.agregar_logs(eventos)
+                if instantanea is not None:
+                    self.buzon.publicar(instantanea)
+            elif tipo_msg == 'finalizar':
+                self.mostrar_resultados_finales(contenido)
+            elif tipo_msg == 'grabacion':
+                self.cargar_linea_tiempo(contenido)
+            elif tipo_msg == 'series':
+                self.cargar_series(contenido)
+            elif tipo_msg == 'perfil':
+                self.mostrar_perfil(contenido)
+            elif tipo_msg == 'detener':
+                self.motor_remoto = None
+                self.simulacion_activa = False
+                self.btn_iniciar.config(state='normal')
+                self.btn_detener.config(state='disabled')
+                self.actualizar_botones_control()
+                break
+
+    def mostrar_perfil(self, reporte):
+        """Agrega el reporte del perfilador al final de las metricas"""
+        self.metricas_finales_text.config(state='normal')
+        self.metricas_finales_text.insert('end', reporte)
+        self.metricas_finales_text.config(state='disabled')
+
     def actualizar_mensajes(self):
-        """Actualiza la interfaz con mensajes de la cola"""
+        """Actualiza la interfaz con mensajes de la cola y la ultima instantanea"""
+        if self.motor_remoto:
+            self.recibir_motor_remoto()
+
+        logs_pendientes = []
         try:
             while True:
                 mensaje = self.cola_mensajes.get_nowait()
                 tipo_msg, contenido, extra = mensaje
 
                 if tipo_msg == 'log':
-                    self.agregar_log(contenido, extra)
-                elif tipo_msg == 'actualizar':
-                    self.actualizar_estado_sistema()
-                    self.actualizar_visualizacion_memoria()
-                    self.actualizar_archivos()
-                elif tipo_msg == 'finalizar':
-                    self.mostrar_resultados_finales()
+                    logs_pendientes.append((contenido, extra))
+                    continue
+
+                # Volcar los logs acumulados antes de otros eventos para conservar el orden
+                self.agregar_logs(logs_pendientes)
+                logs_pendientes = []
+
+                if tipo_msg == 'finalizar':
+                    self.mostrar_resultados_finales(contenido)
+                elif tipo_msg == 'grabacion':
+                    self.cargar_linea_tiempo(contenido)
+                elif tipo_msg == 'series':
+                    self.cargar_series(contenido)
+                elif tipo_msg == 'perfil':
+                    self.mostrar_perfil(contenido)
                 elif tipo_msg == 'detener':
                     self.btn_iniciar.config(state='normal')
                     self.btn_detener.config(state='disabled')
+                    self.actualizar_botones_control()
         except queue.Empty:
             pass
 
+        self.agregar_logs(logs_pendientes)
+
+        # Las instantaneas intermedias no leidas ya se descartaron en el buzon
+        instantanea = self.buzon.tomar()
+        if instantanea is not None:
+            self.actualizar_estado_sistema(instantanea)
+            self.actualizar_visualizacion_memoria(instantanea)
+            self.actualizar_archivos(instantanea)
+            # "Hasta T" pausa por su cuenta al llegar al objetivo
+            self.actualizar_botones_control()
+
         # Programar siguiente actualizacion
         self.root.after(100, self.actualizar_mensajes)
 
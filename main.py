@@ -0,0 +1,434 @@
+# -*- coding: utf-8 -*-
+"""
+Simulador de Sistema Operativo - Punto de entrada por linea de comandos
+Corre la simulacion sin interfaz grafica e imprime (o escribe) las metricas
+en texto o JSON. tkinter solo se importa con --gui
+
+Uso:
+    python main.py --algoritmo SJF --memoria LRU --marcos 8 --semilla 7
+    python main.py --carga POISSON --procesos 10000 --max-ciclos 100000 --json resultados.json
+    python main.py --traza procesos.csv --json -
+    python main.py --comparar-protocolos --carga POISSON --procesos 500 --semilla 3
+    python main.py --gui
+    python main.py --servidor --puerto 8765 --carga POISSON
+"""
+
+import argparse
+import json
+import random
+import sys
+import os
+import time
+
+# Anadir el directorio actual al path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from Modulo_Procesos.proceso import Proceso
+from Modulo_Procesos.cargaTrabajo import GeneradorCarga
+from Modulo_Procesos.lectorTrazas import LectorTraza
+from Modulo_Procesos.semillas import derivar_semilla
+from Modulo_Procesos.planificador import POLITICAS_ADMISION
+from Modulo_Memoria.referencias import MODELOS_REFERENCIAS
+from Modulo_Archivos.gestorArchivos import PRIORIDAD_ALTA
+from Modulo_Simulacion.motor import MotorSimulacion, ARCHIVOS_EJEMPLO, ARCHIVOS_ESCRITURA_EJEMPLO, MAX_CICLOS
+from Modulo_Simulacion.series import SeriesTiempo
+from Modulo_Simulacion.perfil import MODOS_PERFIL, crear_perfilador
+
+
+class Colors:
+    """Codigos ANSI para colores en terminal"""
+    RESET = '\033[0m'
+    BOLD = '\033[1m'
+    RED = '\033[31m'
+    GREEN = '\033[32m'
+    YELLOW = '\033[33m'
+    CYAN = '\033[36m'
+
+
+COLORES_EVENTO = {'SUCCESS': Colors.GREEN, 'WARNING': Colors.YELLOW, 'ERROR': Colors.RED}
+
+
+def limpiar_pantalla():
+    """Limpia la pantalla de la terminal"""
+    os.system('cls' if os.name == 'nt' else 'clear')
+
+
+def imprimir_banner():
+    """Imprime el banner principal del simulador"""
+    print(Colors.CYAN + Colors.BOLD + """
++==============================================================================+
+|                                                                              |
+|                    SIMULADOR DE SISTEMA OPERATIVO                            |
+|                                                                              |
+|                        Universidad - Proyecto Final                          |
+|                                                                              |
++==============================================================================+
+""" + Colors.RESET)
+
+
+def imprimir_seccion(titulo: str):
+    """Imprime un titulo de seccion"""
+    print(f"\n{Colors.BOLD}>> {titulo}{Colors.RESET}")
+    print("-" * 80)
+
+
+def crear_procesos_ejemplo(semilla=None) -> list:
+    """
+    Crea los 4 procesos de ejemplo (mismas distribuciones que la GUI)
+    """
+    rng = random.Random(derivar_semilla(semilla, 'carga'))
+    rng_archivos = random.Random(derivar_semilla(semilla, 'archivos'))
+    procesos = []
+    for i in range(1, 5):
+        prioridad = rng.randint(1, 5)
+        duracion_total = rng.randint(4, 14)
+        tiempo_llegada = rng.randint(0, 6)
+        memoria_requerida = rng.randint(1, 4)
+        archivos_necesarios = rng_archivos.sample(ARCHIVOS_EJEMPLO, rng_archivos.randint(0, 2))
+        procesos.append(Proceso(i, prioridad, duracion_total, tiempo_llegada, memoria_requerida, archivos_necesarios))
+    return procesos
+
+
+def crear_carga(carga: str = 'EJEMPLO', procesos: int = 100, traza=None, semilla=None,
+                archivos=None, tasa_llegada: float = 0.1):
+    """
+    Procesos de la corrida: lista de ejemplo, GeneradorCarga o LectorTraza
+    """
+    if traza:
+        return LectorTraza(traza)
+    if carga == 'EJEMPLO':
+        return crear_procesos_ejemplo(semilla)
+    return GeneradorCarga(total=procesos, llegadas=carga, tasa_llegada=tasa_llegada,
+                          archivos=archivos, semilla=semilla)
+
+
+def mostrar_estado_actual(motor: MotorSimulacion, eventos: list):
+    """Muestra los eventos del tick y el estado del sistema"""
+    planificador = motor.planificador
+    print(f"\n{Colors.BOLD}T{planificador.tiempo_actual}{Colors.RESET}"
+          f"  CPU: {planificador.proceso_actual or 'IDLE'}"
+          f"  | Listos: {', '.join(f'P{p.id}' for p in planificador.cola_listos) or 'Vacia'}"
+          f"  | Bloqueados: {', '.join(f'P{p.id}' for p in planificador.cola_bloqueados) or 'Ninguno'}")
+    for mensaje, tipo in eventos:
+        print(f"  {COLORES_EVENTO.get(tipo, '')}[{tipo}] {mensaje}{Colors.RESET}")
+
+
+def mostrar_metricas_finales(resultado: dict):
+    """Muestra las metricas finales de la simulacion"""
+    metricas = resultado['metricas']
+    memoria = resultado['memoria']
+    archivos = resultado['archivos']
+    disco = archivos.get('disco', {})
+    cache = archivos.get('cache', {})
+
+    imprimir_seccion("METRICAS FINALES DE RENDIMIENTO")
+    print(f"  Ciclos simulados:          {resultado['ciclos']} en {resultado['segundos']:.3f} s"
+          f" ({resultado['ticks_por_segundo']:,} ticks/s)")
+    print("\n[*] PLANIFICACION DE PROCESOS")
+    print(f"  |- Procesos completados:      {metricas['procesos_completados']}")
+    print(f"  |- Tiempo espera promedio:    {metricas.get('tiempo_espera_promedio', 0):.2f} unidades")
+    print(f"  |- Tiempo retorno promedio:   {metricas.get('tiempo_retorno_promedio', 0):.2f} unidades")
+    print(f"  +- Cambios de contexto:       {metricas['cambios_contexto']}")
+    print("\n[*] GESTION DE MEMORIA")
+    print(f"  |- Algoritmo:                 {memoria['algoritmo']}")
+    print(f"  |- Modelo de referencias:     {memoria['modelo_referencias']}")
+    print(f"  |- Marcos totales:            {memoria['marcos_totales']}")
+    print(f"  |- Fallos de pagina:          {memoria['fallos_pagina']} ({memoria['tasa_fallos']:.2f}% de {memoria['accesos']} accesos)")
+    print(f"  +- Reemplazos:                {memoria['reemplazos']}")
+    if 'admision' in metricas:
+        print("\n[*] ADMISION")
+        print(f"  |- Politica:                  {metricas['admision']}")
+        print(f"  |- Grado de multiprog. max:   {metricas['grado_multiprogramacion_max']}")
+        print(f"  |- Procesos demorados:        {metricas['procesos_demorados']}")
+        print(f"  +- Espera de admision prom.:  {metricas['espera_admision_promedio']:.2f} unidades")
+    print("\n[*] SISTEMA DE ARCHIVOS")
+    print(f"  |- Archivos totales:          {archivos['archivos_totales']}")
+    print(f"  |- Operaciones exitosas:      {archivos['operaciones_exitosas']}")
+    print(f"  |- Conflictos totales:        {archivos['conflictos_totales']}")
+    print(f"  |- Latencia I/O p50/p90/p99:  {disco.get('latencia_p50', 0)}/{disco.get('latencia_p90', 0)}/{disco.get('latencia_p99', 0)} ticks")
+    print(f"  +- Aciertos de cache:         {cache.get('tasa_aciertos', 0):.2f}%")
+
+    fuente = resultado.get('fuente', {})
+    if 'segundos_analisis' in fuente:
+        print("\n[*] TRAZA")
+        print(f"  |- Procesos leidos:           {fuente['procesos']} ({fuente['invalidas']} lineas invalidas)")
+        print(f"  +- Rendimiento del analisis:  {fuente['procesos_por_segundo']} procesos/s, {fuente['mb_por_segundo']} MB/s")
+
+
+def ejecutar_simulacion(algoritmo: str = 'RR', quantum: int = 3, algoritmo_memoria: str = 'FIFO',
+                        mostrar_estados: bool = False, marcos_totales: int = 6,
+                        algoritmo_disco: str = 'FCFS', protocolo_prioridad=None,
+                        archivos=None, archivos_escritura=None, semilla=None,
+                        carga='EJEMPLO', procesos: int = 100, tasa_llegada: float = 0.1, traza=None,
+                        max_ciclos: int = MAX_CICLOS, perfilado: str = 'NINGUNO',
+                        ruta_series=None, silencioso: bool = False,
+                        modelo_referencias: str = 'UNIFORME', admision: str = 'NINGUNA',
+                        grado_multiprogramacion=None) -> dict:
+    """
+    Ejecuta la simulacion del sistema operativo sin interfaz grafica
+
+    Args:
+        algoritmo: Algoritmo de planificacion ('RR', 'SJF', 'PRIORIDAD')
+        quantum: Quantum para Round Robin
+        algoritmo_memoria: Algoritmo de reemplazo de paginas ('FIFO', 'LRU')
+        mostrar_estados: Imprimir los eventos y el estado de cada tick
+        carga: 'EJEMPLO' o una distribucion de llegadas de GeneradorCarga
+        procesos: Procesos a generar si la carga es sintetica
+        tasa_llegada: Llegadas medias por tick de la carga sintetica (0.1 con la
+                      duracion media de 8 ticks ocupa la CPU un 80%)
+        traza: Archivo CSV/JSONL de procesos (reemplaza a la carga)
+        max_ciclos: Limite de ticks
+        perfilado: Modo de Perfilador ('NINGUNO', 'FASES', 'CPROFILE', 'TRACEMALLOC')
+        ruta_series: CSV opcional con las metricas por tick
+        silencioso: No imprimir nada (salida JSON por stdout)
+        modelo_referencias: Accesos a memoria ('UNIFORME', 'FASES', 'SECUENCIAL', 'BUCLE', 'ZIPF')
+        admision: Control de admision ('NINGUNA', 'MARCOS', 'CONJUNTO')
+        grado_multiprogramacion: Maximo de procesos admitidos a la vez (None = sin limite)
+
+    Returns:
+        Resultados de la corrida (configuracion, metricas y estadisticas), serializables a JSON
+    """
+    configuracion = {
+        'algoritmo': algoritmo.upper(),
+        'quantum': quantum,
+        'algoritmo_memoria': algoritmo_memoria.upper(),
+        'marcos_totales': marcos_totales,
+        'modelo_referencias': modelo_referencias.upper(),
+        'admision': admision.upper(),
+        'grado_multiprogramacion': grado_multiprogramacion,
+        'algoritmo_disco': algoritmo_disco.upper(),
+        'protocolo_prioridad': protocolo_prioridad,
+        'archivos': archivos if archivos is not None else ARCHIVOS_EJEMPLO,
+        'archivos_escritura': archivos_escritura if archivos_escritura is not None else ARCHIVOS_ESCRITURA_EJEMPLO,
+        'semilla': semilla
+    }
+    # Con cargas grandes los procesos terminados no se conservan (las metricas se acumulan igual)
+    motor = MotorSimulacion(conservar_terminados=carga == 'EJEMPLO' and not traza, **configuracion)
+
+    if not silencioso:
+        imprimir_seccion("CONFIGURACION DE LA SIMULACION")
+        for clave, valor in configuracion.items():
+            print(f"  |- {clave:<22}{valor}")
+        print(f"  +- {'carga':<22}{traza or carga}")
+
+    eventos = motor.agregar_carga(crear_carga(carga, procesos, traza, semilla, archivos, tasa_llegada))
+    if mostrar_estados and not silencioso:
+        imprimir_seccion("EJECUTANDO SIMULACION")
+        for mensaje, tipo in eventos:
+            print(f"  [{tipo}] {mensaje}")
+
+    series = SeriesTiempo() if ruta_series else None
+    if series is not None:
+        series.iniciar(motor)
+    perfilador = crear_perfilador(perfilado)
+    if perfilador is not None:
+        perfilador.activar()
+
+    inicio = time.perf_counter()
+    try:
+        while motor.hay_procesos_activos() and motor.ciclo < max_ciclos:
+            eventos = motor.ejecutar_tick()
+            if series is not None:
+                series.registrar(motor)
+            if mostrar_estados and not silencioso:
+                mostrar_estado_actual(motor, eventos)
+    finally:
+        segundos = time.perf_counter() - inicio
+        if perfilador is not None:
+            perfilador.desactivar()
+
+    if series is not None:
+        series.finalizar(motor)
+        series.exportar_csv(ruta_series)
+
+    resumen = motor.resumen_final()
+    resultado = {
+        'configuracion': {**configuracion, 'carga': traza or carga, 'max_ciclos': max_ciclos},
+        'ciclos': motor.ciclo,
+        'completa': not motor.hay_procesos_activos(),
+        'segundos': round(segundos, 4),
+        'ticks_por_segundo': round(motor.ciclo / segundos) if segundos else 0,
+        'metricas': resumen['metricas'],
+        'memoria': resumen['memoria'],
+        'archivos': resumen['archivos'],
+        'fuente': resumen['fuente']
+    }
+    if perfilador is not None:
+        resultado['perfil'] = perfilador.obtener_estadisticas()
+
+    if not silencioso:
+        if motor.ciclo <= 200:
+            print(resumen['gantt'])
+        mostrar_metricas_finales(resultado)
+        if perfilador is not None:
+            print(perfilador.reporte())
+    return resultado
+
+
+def comparar_protocolos(silencioso: bool = False, **opciones) -> dict:
+    """
+    Corre la misma carga con planificacion PRIORIDAD sin protocolo, con HERENCIA
+    y con TECHO, y compara la espera por archivos de los procesos de alta prioridad
+
+    Args:
+        opciones: Argumentos de ejecutar_simulacion (sin algoritmo ni protocolo)
+
+    Returns:
+        {protocolo: metricas de espera y retorno}
+    """
+    # Sin semilla cada corrida generaria otra carga y la comparacion no tendria sentido
+    if opciones.get('semilla') is None:
+        opciones['semilla'] = random.randrange(2 ** 32)
+    comparacion = {}
+    for protocolo in (None, 'HERENCIA', 'TECHO'):
+        resultado = ejecutar_simulacion(algoritmo='PRIORIDAD', protocolo_prioridad=protocolo,
+                                        silencioso=True, **opciones)
+        archivos = resultado['archivos']
+        comparacion[protocolo or 'NINGUNO'] = {
+            'espera_alta_p50': archivos['espera_alta_p50'],
+            'espera_alta_p90': archivos['espera_alta_p90'],
+            'espera_alta_p99': archivos['espera_alta_p99'],
+            'elevaciones_prioridad': archivos['elevaciones_prioridad'],
+            'tiempo_retorno_promedio': resultado['metricas'].get('tiempo_retorno_promedio', 0),
+            'ciclos': resultado['ciclos']
+        }
+
+    if not silencioso:
+        imprimir_seccion(f"INVERSION DE PRIORIDAD (PRIORIDAD, semilla {opciones['semilla']})")
+        print(f"  {'protocolo':<10}{'espera p50':>12}{'p90':>8}{'p99':>8}{'elevaciones':>13}{'retorno medio':>15}")
+        for protocolo, fila in comparacion.items():
+            print(f"  {protocolo:<10}{fila['espera_alta_p50']:>12}{fila['espera_alta_p90']:>8}"
+                  f"{fila['espera_alta_p99']:>8}{fila['elevaciones_prioridad']:>13}"
+                  f"{fila['tiempo_retorno_promedio']:>15.2f}")
+        print(f"\n  Espera = ticks que un proceso de prioridad <= {PRIORIDAD_ALTA} pasa bloqueado por un archivo")
+    return {'semilla': opciones['semilla'], 'protocolos': comparacion}
+
+
+def iniciar_gui():
+    """Abre la interfaz grafica (tkinter se importa recien aqui)"""
+    import tkinter as tk
+    from gui import SimuladorGUI
+
+    root = tk.Tk()
+    SimuladorGUI(root)
+    root.mainloop()
+
+
+def iniciar_servidor(configuracion: dict, puerto: int, ticks_por_segundo: float, max_ciclos: int):
+    """Sirve la simulacion a cualquier cantidad de visores (asyncio se importa recien aqui)"""
+    import asyncio
+    from Modulo_Simulacion.servidor import ServidorEstado
+
+    def crear_procesos(opciones: dict):
+        return crear_carga(opciones.get('carga', 'EJEMPLO'), opciones.get('procesos', 100),
+                           opciones.get('traza'), opciones.get('semilla'), opciones.get('archivos'),
+                           opciones.get('tasa_llegada', 0.1))
+
+    servidor = ServidorEstado(configuracion, crear_procesos=crear_procesos, puerto=puerto,
+                              ticks_por_segundo=ticks_por_segundo, max_ciclos=max_ciclos)
+    print(f"Visor en http://127.0.0.1:{puerto}/  (eventos en /eventos, comandos en /control; Ctrl+C para salir)")
+    try:
+        asyncio.run(servidor.servir())
+    except KeyboardInterrupt:
+        pass
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    """Opciones de linea de comandos"""
+    parser = argparse.ArgumentParser(description="Simulador de Sistema Operativo (sin interfaz grafica)")
+    parser.add_argument('--gui', action='store_true', help="Abrir la interfaz grafica")
+    parser.add_argument('--servidor', action='store_true',
+                        help="Servir la simulacion a varios visores por HTTP (SSE) en localhost")
+    parser.add_argument('--puerto', type=int, default=8765, help="Puerto del servidor")
+    parser.add_argument('--ticks', type=float, default=10,
+                        help="Ritmo inicial del servidor en ticks por segundo (0 = sin limite)")
+    parser.add_argument('--algoritmo', default='RR', choices=['RR', 'SJF', 'PRIORIDAD'], type=str.upper)
+    parser.add_argument('--quantum', type=int, default=3)
+    parser.add_argument('--memoria', default='FIFO', choices=['FIFO', 'LRU'], type=str.upper,
+                        help="Algoritmo de reemplazo de paginas")
+    parser.add_argument('--marcos', type=int, default=6, help="Marcos de memoria fisica")
+    parser.add_argument('--referencias', default='UNIFORME', choices=list(MODELOS_REFERENCIAS), type=str.upper,
+                        help="Modelo de accesos a memoria (localidad)")
+    parser.add_argument('--admision', default='NINGUNA', choices=list(POLITICAS_ADMISION), type=str.upper,
+                        help="Control de admision segun los marcos libres o el conjunto de trabajo")
+    parser.add_argument('--grado', type=int, default=None,
+                        help="Grado maximo de multiprogramacion (procesos admitidos a la vez)")
+    parser.add_argument('--disco', default='FCFS', choices=['FCFS', 'SSTF', 'SCAN', 'C-LOOK'], type=str.upper)
+    parser.add_argument('--protocolo', default=None, choices=['HERENCIA', 'TECHO'], type=str.upper,
+                        help="Protocolo contra inversion de prioridad")
+    parser.add_argument('--comparar-protocolos', action='store_true',
+                        help="Comparar la espera de alta prioridad sin protocolo, con HERENCIA y con TECHO")
+    parser.add_argument('--archivos', default=None,
+                        help="Archivos del sistema separados por coma (por defecto los de ejemplo)")
+    parser.add_argument('--archivos-escritura', default=None,
+                        help="Archivos que se escriben, separados por coma")
+    parser.add_argument('--semilla', type=int, default=None)
+    parser.add_argument('--carga', default='EJEMPLO', choices=['EJEMPLO', 'POISSON', 'RAFAGAS', 'UNIFORME'],
+                        type=str.upper, help="Procesos de ejemplo o carga sintetica")
+    parser.add_argument('--procesos', type=int, default=100, help="Procesos de la carga sintetica")
+    parser.add_argument('--tasa-llegada', type=float, default=0.1,
+                        help="Llegadas medias por tick de la carga sintetica")
+    parser.add_argument('--traza', default=None, help="Traza CSV/JSONL de procesos")
+    parser.add_argument('--max-ciclos', type=int, default=MAX_CICLOS)
+    parser.add_argument('--estados', action='store_true', help="Mostrar cada tick")
+    parser.add_argument('--perfil', default='NINGUNO', choices=list(MODOS_PERFIL), type=str.upper)
+    parser.add_argument('--series', default=None, help="Exportar las metricas por tick a este CSV")
+    parser.add_argument('--json', default=None, metavar='RUTA',
+                        help="Escribir los resultados en JSON ('-' = salida estandar)")
+    return parser
+
+
+def main(argumentos=None):
+    """Funcion principal del programa"""
+    args = crear_parser().parse_args(argumentos)
+    if args.gui:
+        iniciar_gui()
+        return
+
+    separar = lambda texto: [n.strip() for n in texto.split(',') if n.strip()] if texto else None
+    if args.servidor:
+        configuracion = {
+            'algoritmo': args.algoritmo, 'quantum': args.quantum, 'algoritmo_memoria': args.memoria,
+            'marcos_totales': args.marcos, 'modelo_referencias': args.referencias,
+            'admision': args.admision, 'grado_multiprogramacion': args.grado,
+            'algoritmo_disco': args.disco, 'protocolo_prioridad': args.protocolo,
+            'archivos': separar(args.archivos), 'archivos_escritura': separar(args.archivos_escritura),
+            'semilla': args.semilla, 'carga': args.carga, 'procesos': args.procesos,
+            'tasa_llegada': args.tasa_llegada, 'traza': args.traza
+        }
+        iniciar_servidor(configuracion, args.puerto, args.ticks, args.max_ciclos)
+        return
+
+    silencioso = args.json == '-'
+    if not silencioso:
+        imprimir_banner()
+
+    opciones = dict(
+        quantum=args.quantum, algoritmo_memoria=args.memoria, marcos_totales=args.marcos,
+        algoritmo_disco=args.disco, archivos=separar(args.archivos),
+        archivos_escritura=separar(args.archivos_escritura), semilla=args.semilla,
+        carga=args.carga, procesos=args.procesos, tasa_llegada=args.tasa_llegada, traza=args.traza,
+        max_ciclos=args.max_ciclos, modelo_referencias=args.referencias, admision=args.admision,
+        grado_multiprogramacion=args.grado)
+    try:
+        if args.comparar_protocolos:
+            resultado = comparar_protocolos(silencioso=silencioso, **opciones)
+        else:
+            resultado = ejecutar_simulacion(
+                algoritmo=args.algoritmo, protocolo_prioridad=args.protocolo, mostrar_estados=args.estados,
+                perfilado=args.perfil, ruta_series=args.series, silencioso=silencioso, **opciones)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    if args.json == '-':
+        json.dump(resultado, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    elif args.json:
+        with open(args.json, 'w', encoding='utf-8') as archivo:
+            json.dump(resultado, archivo, indent=2, ensure_ascii=False)
+        print(f"\nResultados guardados en {args.json}")
+
+
+if __name__ == "__main__":
+    main()
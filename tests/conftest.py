@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+"""
+Configuracion de pytest: los modulos se importan desde la raiz del proyecto
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
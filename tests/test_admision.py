@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas del control de admision (planificador de largo plazo)
+"""
+
+from Modulo_Procesos.proceso import Proceso, NUEVO, LISTO
+from Modulo_Procesos.planificador import Planificador
+from Modulo_Memoria.gestorMemoria import GestorMemoria
+
+
+def planificador_con_memoria(admision, marcos=4, grado=None):
+    gestor = GestorMemoria(marcos_totales=marcos)
+    return Planificador('RR', quantum=2, gestor_memoria=gestor, admision=admision,
+                        grado_multiprogramacion=grado)
+
+
+def test_admite_por_orden_de_llegada_aunque_la_lista_no_este_ordenada():
+    planificador = planificador_con_memoria('NINGUNA', grado=1)
+    tardio = Proceso(1, 3, 5, 4, 1, [])
+    temprano = Proceso(2, 3, 5, 1, 1, [])
+    planificador.agregar_proceso(tardio)
+    planificador.agregar_proceso(temprano)
+    planificador.tiempo_actual = 4
+    planificador.verificar_llegadas()
+    assert list(planificador.cola_listos) == [temprano]
+    assert tardio.codigo_estado == NUEVO
+    assert planificador.procesos_demorados == 1
+
+
+def test_empate_de_llegada_se_resuelve_por_id():
+    planificador = planificador_con_memoria('NINGUNA', grado=1)
+    procesos = [Proceso(i, 3, 5, 0, 1, []) for i in (3, 1, 2)]
+    for proceso in procesos:
+        planificador.agregar_proceso(proceso)
+    planificador.verificar_llegadas()
+    assert [p.id for p in planificador.cola_listos] == [1]
+
+
+def test_marcos_demora_lo_que_no_cabe_y_admite_al_liberar():
+    planificador = planificador_con_memoria('MARCOS', marcos=4)
+    grande = Proceso(1, 3, 2, 0, 3, [])
+    otro = Proceso(2, 3, 2, 0, 2, [])
+    planificador.agregar_proceso(grande)
+    planificador.agregar_proceso(otro)
+    planificador.verificar_llegadas()
+    assert grande.codigo_estado == LISTO and otro.codigo_estado == NUEVO
+    assert planificador.marcos_comprometidos == 3
+
+    while grande.tiempo_finalizacion is None:
+        planificador.ejecutar_ciclo()
+    planificador.verificar_llegadas()
+    assert otro.codigo_estado == LISTO
+    assert planificador.marcos_comprometidos == 2
+    metricas = planificador.calcular_metricas()
+    assert metricas['procesos_demorados'] == 1
+    assert metricas['grado_multiprogramacion_max'] == 1
+
+
+def test_el_primer_proceso_siempre_entra_aunque_no_quepa():
+    planificador = planificador_con_memoria('MARCOS', marcos=2)
+    enorme = Proceso(1, 3, 2, 0, 10, [])
+    planificador.agregar_proceso(enorme)
+    planificador.verificar_llegadas()
+    assert enorme.codigo_estado == LISTO
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas de humo de la suite de benchmarks (tamanos pequenos, sin procesos hijos)
+"""
+
+import json
+
+import benchmark
+
+
+def test_casos_pequenos_completan(capsys):
+    resultados = benchmark.ejecutar_benchmarks(['planificador', 'memoria', 'archivos'], [50],
+                                               limite=5.0, semilla=1, aislar=False)
+    assert len(resultados) == len(benchmark.generar_casos(['planificador', 'memoria', 'archivos'],
+                                                          [50], 5.0, 1))
+    assert all(r['completo'] for r in resultados)
+    planificador = [r for r in resultados if r['componente'] == 'planificador']
+    assert all(r['procesos_completados'] == 50 for r in planificador)
+    assert 'planificador/RR/50' in capsys.readouterr().out
+
+
+def test_comparar_detecta_regresiones(tmp_path, capsys):
+    base = tmp_path / 'base.json'
+    base.write_text(json.dumps({'resultados': [
+        {'nombre': 'a', 'ops_por_segundo': 1000, 'memoria_pico_kb': 0},
+        {'nombre': 'b', 'ops_por_segundo': 1000, 'memoria_pico_kb': 0}]}))
+    actuales = [{'nombre': 'a', 'ops_por_segundo': 950, 'memoria_pico_kb': 0},
+                {'nombre': 'b', 'ops_por_segundo': 500, 'memoria_pico_kb': 0},
+                {'nombre': 'c', 'ops_por_segundo': 10, 'memoria_pico_kb': 0}]
+    assert benchmark.comparar(actuales, str(base), umbral=0.10) == 1
+    assert 'REGRESION' in capsys.readouterr().out
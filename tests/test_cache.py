@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas de la buffer cache de bloques (LRU, 2Q y escritura diferida)
+"""
+
+import pytest
+
+from Modulo_Archivos.cache import CacheBloques
+
+
+def test_lru_desaloja_el_menos_usado():
+    cache = CacheBloques(capacidad=2)
+    cache.insertar(1)
+    cache.insertar(2)
+    assert cache.leer([1])
+    cache.insertar(3)
+    assert cache.contiene(1) and cache.contiene(3)
+    assert not cache.contiene(2)
+    assert cache.desalojos == 1
+
+
+def test_escritura_diferida_devuelve_sucios_al_desalojar():
+    cache = CacheBloques(capacidad=2)
+    assert cache.escribir([1, 2]) == []
+    assert cache.escribir([3]) == [1]
+    assert cache.flush() == [2, 3]
+    assert not cache.sucios
+
+
+def test_2q_un_recorrido_no_expulsa_los_bloques_calientes():
+    cache = CacheBloques(capacidad=4, politica='2Q')
+    # 1 entra, sale a A1out y al volver pasa a la cola principal
+    cache.insertar(1)
+    for bloque in range(10, 15):
+        cache.insertar(bloque)
+    cache.insertar(1)
+    assert 1 in cache.principal
+    # Un recorrido secuencial solo rota A1in
+    for bloque in range(20, 40):
+        cache.insertar(bloque)
+    assert cache.contiene(1)
+
+
+def test_politica_desconocida():
+    with pytest.raises(ValueError):
+        CacheBloques(politica='MRU')
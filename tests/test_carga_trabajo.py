@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas del generador de cargas sinteticas y de su consumo perezoso
+"""
+
+import itertools
+import pickle
+
+import pytest
+
+from Modulo_Procesos import GeneradorCarga
+from Modulo_Simulacion import MotorSimulacion
+
+
+def resumen(procesos):
+    return [(p.id, p.prioridad, p.duracion_total, p.tiempo_llegada, p.memoria_requerida,
+             p.archivos_necesarios) for p in procesos]
+
+
+@pytest.mark.parametrize('llegadas', ['POISSON', 'RAFAGAS', 'UNIFORME'])
+def test_misma_semilla_misma_carga_ordenada(llegadas):
+    a = resumen(GeneradorCarga(total=200, llegadas=llegadas, semilla=11))
+    b = resumen(GeneradorCarga(total=200, llegadas=llegadas, semilla=11))
+    assert a == b
+    llegadas_ticks = [p[3] for p in a]
+    assert llegadas_ticks == sorted(llegadas_ticks)
+    assert all(d >= 1 and 1 <= m <= 4 and 1 <= pr <= 5 for _, pr, d, _, m, _ in a)
+
+
+def test_sin_total_es_infinito_y_continua_tras_pickle():
+    generador = GeneradorCarga(semilla=2)
+    primeros = list(itertools.islice(generador, 50))
+    copia = pickle.loads(pickle.dumps(generador))
+    assert resumen(itertools.islice(copia, 50)) == resumen(itertools.islice(generador, 50))
+    assert primeros[-1].id == 50
+
+
+def test_distribucion_desconocida():
+    with pytest.raises(ValueError):
+        next(GeneradorCarga(duracion='CAUCHY', semilla=1))
+
+
+def test_motor_consume_la_fuente_de_a_poco():
+    motor = MotorSimulacion(semilla=1, conservar_terminados=False)
+    generador = GeneradorCarga(total=2000, tasa_llegada=0.05, duracion_media=4, max_archivos=0, semilla=1)
+    motor.agregar_fuente(generador)
+    maximo_en_memoria = 0
+    while motor.hay_procesos_activos():
+        motor.ejecutar_tick()
+        maximo_en_memoria = max(maximo_en_memoria, len(motor.planificador.todos_procesos))
+    assert motor.planificador.metricas['procesos_completados'] == 2000
+    # Solo se materializan los procesos que ya llegaron y aun no se purgaron
+    assert maximo_en_memoria < 200
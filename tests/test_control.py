@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas del control de velocidad: pausa, paso a paso, ejecutar hasta T y turbo
+"""
+
+import threading
+import time
+
+from Modulo_Procesos.proceso import Proceso
+from Modulo_Simulacion.motor import MotorSimulacion
+from Modulo_Simulacion.control import ControlVelocidad
+
+
+def iniciar(control):
+    motor = MotorSimulacion(semilla=1)
+    motor.agregar_procesos([Proceso(1, 1, 500, 0, 1, [])])
+    publicadas = []
+    hilo = threading.Thread(target=motor.correr, daemon=True,
+                            args=(control, 1000, lambda eventos: None, publicadas.append))
+    hilo.start()
+    return motor, hilo, publicadas
+
+
+def esperar(condicion, limite=5.0):
+    fin = time.monotonic() + limite
+    while not condicion() and time.monotonic() < fin:
+        time.sleep(0.005)
+    return condicion()
+
+
+def test_paso_a_paso_y_ejecutar_hasta():
+    control = ControlVelocidad(ticks_por_segundo=0)
+    control.pausar()
+    motor, hilo, publicadas = iniciar(control)
+    control.paso(3)
+    assert esperar(lambda: motor.ciclo == 3)
+    time.sleep(0.05)
+    assert motor.ciclo == 3
+    control.ejecutar_hasta(40)
+    assert esperar(lambda: control.pausado and motor.planificador.tiempo_actual == 40)
+    time.sleep(0.05)
+    assert motor.planificador.tiempo_actual == 40
+    # En pausa se publica el estado del tick alcanzado
+    assert publicadas[-1].tiempo == 40
+    control.detener()
+    hilo.join(timeout=5)
+    assert not hilo.is_alive()
+
+
+def test_sin_limite_termina_sin_dormir():
+    control = ControlVelocidad(ticks_por_segundo=0)
+    motor, hilo, publicadas = iniciar(control)
+    hilo.join(timeout=5)
+    assert not hilo.is_alive()
+    assert not motor.hay_procesos_activos()
+    # La instantanea final siempre se publica
+    assert publicadas[-1].tiempo == motor.planificador.tiempo_actual
+
+
+def test_cambio_de_velocidad_despierta_la_espera():
+    control = ControlVelocidad(ticks_por_segundo=0.5)
+    motor, hilo, _ = iniciar(control)
+    assert esperar(lambda: motor.ciclo == 1)
+    control.fijar_velocidad(0)
+    hilo.join(timeout=5)
+    assert not hilo.is_alive()
+
+
+def test_argumentos_fuera_de_rango_se_acotan():
+    control = ControlVelocidad(ticks_por_segundo=float('inf'))
+    assert control.ticks_por_segundo == 0
+    control.paso(-3)
+    assert control.pausado and control.pasos_pendientes == 0
+    control.ejecutar_hasta(-5)
+    assert control.tiempo_objetivo == 0
+    control.fijar_velocidad(float('nan'))
+    assert control.ticks_por_segundo == 0
+    control.fijar_velocidad(-2)
+    assert control.ticks_por_segundo == 0
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas del disco simulado y de sus percentiles de latencia
+"""
+
+import math
+import random
+
+import pytest
+
+from Modulo_Archivos.disco import Disco, SolicitudIO, Histograma
+
+
+def percentil_ordenando(valores, percentil):
+    ordenados = sorted(valores)
+    return ordenados[max(1, math.ceil(percentil / 100 * len(ordenados))) - 1]
+
+
+def test_histograma_coincide_con_ordenar_la_lista():
+    rng = random.Random(5)
+    valores = [rng.randint(0, 300) for _ in range(5000)]
+    histograma = Histograma()
+    for valor in valores:
+        histograma.registrar(valor)
+    assert len(histograma) == len(valores)
+    assert len(histograma.conteos) <= 301
+    for percentil in (1, 50, 90, 99, 100):
+        assert histograma.percentil(percentil) == percentil_ordenando(valores, percentil)
+
+
+def test_histograma_vacio_y_recalculo_tras_nueva_muestra():
+    histograma = Histograma()
+    assert histograma.percentil(50) == 0
+    histograma.registrar(3)
+    assert histograma.percentil(99) == 3
+    histograma.registrar(10)
+    assert histograma.percentil(99) == 10
+
+
+def test_latencias_del_disco():
+    disco = Disco(bloques_totales=100, pistas_por_tick=10, bloques_por_tick=1)
+    disco.encolar(SolicitudIO(None, 'a.txt', 50, 2, tiempo_llegada=0))
+    disco.encolar(SolicitudIO(None, 'b.txt', 0, 1, tiempo_llegada=0))
+    completadas = []
+    tiempo = 0
+    while disco.esta_ocupado():
+        tiempo += 1
+        completadas += disco.avanzar(tiempo)
+    assert [s.nombre_archivo for s in completadas] == ['a.txt', 'b.txt']
+    estadisticas = disco.obtener_estadisticas()
+    assert estadisticas['solicitudes_completadas'] == 2
+    assert estadisticas['latencia_p50'] == completadas[0].tiempo_fin
+    assert estadisticas['latencia_p99'] == completadas[1].tiempo_fin
+
+
+def atender(algoritmo, bloques, cabezal=50):
+    disco = Disco(bloques_totales=100, algoritmo=algoritmo, pistas_por_tick=10, bloques_por_tick=1)
+    disco.cabezal = cabezal
+    for bloque in bloques:
+        disco.encolar(SolicitudIO(None, f"b{bloque}", bloque, 1, tiempo_llegada=0))
+    orden = []
+    tiempo = 0
+    while disco.esta_ocupado():
+        tiempo += 1
+        orden += [s.bloque_inicio for s in disco.avanzar(tiempo)]
+    return orden, disco
+
+
+@pytest.mark.parametrize('algoritmo, esperado', [
+    ('FCFS', [10, 60, 90, 45]),
+    ('SSTF', [45, 60, 90, 10]),
+    ('SCAN', [60, 90, 45, 10]),
+    ('C-LOOK', [60, 90, 10, 45]),
+])
+def test_orden_de_atencion_del_brazo(algoritmo, esperado):
+    orden, _ = atender(algoritmo, [10, 60, 90, 45])
+    assert orden == esperado
+
+
+def test_sstf_recorre_menos_que_fcfs():
+    rng = random.Random(2)
+    bloques = [rng.randrange(100) for _ in range(30)]
+    _, fcfs = atender('FCFS', bloques)
+    _, sstf = atender('SSTF', bloques)
+    assert sstf.distancia_busqueda_total < fcfs.distancia_busqueda_total
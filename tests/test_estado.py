@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas del guardado y la restauracion del estado completo del simulador
+"""
+
+import pickle
+import struct
+import zlib
+
+import pytest
+
+from Modulo_Procesos import GeneradorCarga
+from Modulo_Procesos.lectorTrazas import LectorTraza
+from Modulo_Memoria.gestorMemoria import GestorMemoria
+from Modulo_Simulacion import MotorSimulacion
+from Modulo_Simulacion.estado import (guardar_estado, cargar_estado, estado_a_bytes,
+                                      estado_desde_bytes, serializar_motor, huella_clases,
+                                      atributos_clase, CABECERA, FIRMA, VERSION_ESTADO,
+                                      HUELLA_ESTADO)
+
+EJECUTADOS = []
+
+
+def ejecutar_al_cargar(valor):
+    EJECUTADOS.append(valor)
+
+
+class Malicioso:
+    def __reduce__(self):
+        return ejecutar_al_cargar, ('pwned',)
+
+
+def terminar(motor):
+    while motor.hay_procesos_activos():
+        motor.ejecutar_tick()
+    resumen = motor.resumen_final()
+    resumen.pop('fuente')
+    return resumen
+
+
+def test_continuar_tras_cargar_da_el_mismo_resultado(tmp_path):
+    motor = MotorSimulacion(semilla=3, protocolo_prioridad='HERENCIA', algoritmo='PRIORIDAD')
+    motor.agregar_carga(GeneradorCarga(total=30, tasa_llegada=0.5, semilla=3))
+    for _ in range(40):
+        motor.ejecutar_tick()
+    ruta = str(tmp_path / 'estado.bin')
+    guardar_estado(motor, ruta)
+    restaurado = cargar_estado(ruta)
+    assert restaurado.ciclo == motor.ciclo
+    assert terminar(restaurado) == terminar(motor)
+
+
+def test_referencias_compartidas_se_conservan():
+    motor = MotorSimulacion(semilla=5)
+    motor.agregar_carga(GeneradorCarga(total=15, tasa_llegada=1.0, semilla=5))
+    for _ in range(25):
+        motor.ejecutar_tick()
+    restaurado = estado_desde_bytes(estado_a_bytes(motor))
+    procesos = {p.id: p for p in restaurado.planificador.todos_procesos}
+    for proceso in restaurado.planificador.cola_listos:
+        assert procesos[proceso.id] is proceso
+    for archivo in restaurado.gestor_archivos.archivos.values():
+        for proceso in archivo.cola_espera:
+            assert procesos[proceso.id] is proceso
+
+
+def test_traza_sigue_desde_su_posicion(tmp_path):
+    ruta = tmp_path / 'traza.csv'
+    ruta.write_text("id,llegada,duracion\n" + "".join(f"{i},{i * 2},3\n" for i in range(1, 21)))
+    motor = MotorSimulacion(semilla=1)
+    motor.agregar_carga(LectorTraza(str(ruta)))
+    for _ in range(15):
+        motor.ejecutar_tick()
+    restaurado = estado_desde_bytes(estado_a_bytes(motor))
+    assert terminar(restaurado) == terminar(motor)
+    assert restaurado.planificador.metricas['procesos_completados'] == 20
+
+
+def test_estado_corrupto_o_de_otra_version():
+    datos = bytearray(estado_a_bytes(MotorSimulacion(semilla=1)))
+    with pytest.raises(ValueError, match="corrupto"):
+        estado_desde_bytes(bytes(datos[:-1]) + bytes([datos[-1] ^ 1]))
+    datos[4] += 1
+    with pytest.raises(ValueError, match="Version"):
+        estado_desde_bytes(bytes(datos))
+    with pytest.raises(ValueError):
+        estado_desde_bytes(b'SOES')
+
+
+def test_estado_de_formato_anterior_se_rechaza(tmp_path):
+    # Version 5: misma firma, sin huella de clases en la cabecera
+    motor = MotorSimulacion(semilla=1)
+    datos = serializar_motor(motor)
+    ruta = tmp_path / 'viejo.bin'
+    ruta.write_bytes(struct.pack('<4sHIII', FIRMA, 5, motor.ciclo, zlib.crc32(datos), len(datos)) + datos)
+    with pytest.raises(ValueError, match="Version de estado no soportada: 5"):
+        cargar_estado(str(ruta))
+
+
+def test_otra_disposicion_de_clases_se_rechaza():
+    datos = bytearray(estado_a_bytes(MotorSimulacion(semilla=1)))
+    datos[6:14] = bytes(8)
+    with pytest.raises(ValueError, match="disposicion"):
+        estado_desde_bytes(bytes(datos))
+
+
+def test_huella_sigue_los_atributos_de_las_clases():
+    class Antes:
+        def __init__(self):
+            self.a = 1
+
+    class Despues:
+        def __init__(self):
+            self.a = 1
+            self.iniciar()
+
+        def iniciar(self):
+            self.b = []
+
+    Despues.__qualname__ = Antes.__qualname__
+    assert atributos_clase(Antes) == ['a'] and atributos_clase(Despues) == ['a', 'b']
+    assert huella_clases((Antes,)) != huella_clases((Despues,))
+    assert {'rng', 'lote_accesos', 'referencias'} <= set(atributos_clase(GestorMemoria))
+    assert huella_clases() == HUELLA_ESTADO
+
+
+def test_objetos_ajenos_al_simulador_no_se_ejecutan():
+    carga = zlib.compress(pickle.dumps(Malicioso()))
+    datos = CABECERA.pack(FIRMA, VERSION_ESTADO, HUELLA_ESTADO, 0, zlib.crc32(carga), len(carga)) + carga
+    with pytest.raises(ValueError, match="no permitido"):
+        estado_desde_bytes(datos)
+    assert EJECUTADOS == []
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas de los tramos del diagrama de Gantt y su nivel de detalle
+"""
+
+from Modulo_Simulacion.gantt import SegmentosGantt
+
+
+def test_tramos_por_proceso():
+    segmentos = SegmentosGantt.desde_historial([(1, 1), (2, 1), (3, 2), (4, 1), (6, 1)])
+    assert segmentos.procesos == [1, 2]
+    assert list(zip(segmentos.inicios[1], segmentos.fines[1])) == [(1, 2), (4, 4), (6, 6)]
+    assert segmentos.obtener_estadisticas() == {'procesos': 2, 'tramos': 4, 'tiempo_final': 6}
+
+
+def test_ventana_sin_reducir():
+    segmentos = SegmentosGantt.desde_historial([(1, 1), (2, 1), (4, 1), (6, 1)])
+    assert segmentos.tramos_visibles(1, 2, 5, columnas=100) == [(1, 3), (4, 5)]
+    assert segmentos.tramos_visibles(1, 7, 9, columnas=100) == []
+    assert segmentos.tramos_visibles(9, 0, 9, columnas=100) == []
+
+
+def test_nivel_de_detalle_acota_los_tramos_al_ancho():
+    # Un proceso que corre un tick si y otro no durante 100000 ticks
+    segmentos = SegmentosGantt.desde_historial([(t, 1) for t in range(0, 100000, 2)])
+    tramos = segmentos.tramos_visibles(1, 0, 100000, columnas=200)
+    assert len(tramos) <= 200
+    # Cada columna tiene algun tick del proceso: se dibuja como una sola barra
+    assert tramos == [(0, 100000)]
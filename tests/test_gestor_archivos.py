@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas del espacio de nombres jerarquico y de los bloqueos de GestorArchivos
+"""
+
+import pytest
+
+from Modulo_Procesos.proceso import Proceso
+from Modulo_Archivos.gestorArchivos import GestorArchivos, normalizar_ruta
+from Modulo_Archivos.disco import Disco
+
+
+def proceso(id, archivos=()):
+    return Proceso(id, 3, 10, 0, 1, list(archivos))
+
+
+def test_normalizar_ruta():
+    assert normalizar_ruta('a.txt') == 'a.txt'
+    assert normalizar_ruta('/a.txt') == 'a.txt'
+    assert normalizar_ruta('//home//ana/notas.txt/') == 'home/ana/notas.txt'
+    for ruta in ('', '/', '///'):
+        with pytest.raises(ValueError):
+            normalizar_ruta(ruta)
+
+
+def test_rutas_equivalentes_son_un_solo_archivo():
+    gestor = GestorArchivos(['a.txt', '/a.txt', 'home//ana/notas.txt', '/home/ana/notas.txt/'])
+    assert sorted(gestor.archivos) == ['a.txt', 'home/ana/notas.txt']
+    assert gestor.listar_directorio('/home/ana') == {'directorios': [], 'archivos': ['notas.txt']}
+
+    p1, p2 = proceso(1), proceso(2)
+    assert gestor.solicitar_acceso(p1, '/a.txt')
+    assert not gestor.solicitar_acceso(p2, 'a.txt')
+    assert gestor.obtener_proceso_propietario('a.txt/') == 1
+    assert gestor.liberar_archivo('a.txt', p1) is p2
+    assert gestor.obtener_proceso_propietario('/a.txt') == 2
+
+
+def test_rutas_invalidas():
+    with pytest.raises(ValueError, match="vacia"):
+        GestorArchivos([''])
+    with pytest.raises(ValueError, match="directorio"):
+        GestorArchivos(['home/ana.txt', 'home'])
+    with pytest.raises(ValueError, match="archivo"):
+        GestorArchivos(['home', 'home/ana.txt'])
+    # Un nombre inexistente o vacio en una peticion se rechaza sin excepcion
+    gestor = GestorArchivos(['a.txt'])
+    assert not gestor.solicitar_acceso(proceso(1), '')
+    assert not gestor.solicitar_acceso(proceso(1), 'b.txt')
+
+
+def test_bloqueo_de_directorio_cubre_el_subarbol():
+    gestor = GestorArchivos(['home/ana/notas.txt', 'home/luis/datos.db', 'tmp/x'])
+    p1, p2 = proceso(1), proceso(2)
+    assert gestor.bloquear_directorio(p1, '/home')
+    assert gestor.solicitar_acceso(p1, 'home/ana/notas.txt')
+    assert not gestor.solicitar_acceso(p2, 'home/luis/datos.db')
+    assert gestor.solicitar_acceso(p2, 'tmp/x')
+    # No se puede bloquear un directorio con archivos en uso por otro proceso
+    assert not gestor.bloquear_directorio(p1, '/tmp')
+    assert gestor.liberar_directorio('/home', p1) == [p2]
+    assert gestor.solicitar_acceso(p2, 'home/luis/datos.db')
+
+
+def test_al_terminar_se_liberan_los_directorios_bloqueados():
+    from Modulo_Procesos.planificador import Planificador
+
+    gestor = GestorArchivos(['home/ana/notas.txt', 'home/luis/datos.db'])
+    planificador = Planificador('RR', gestor_archivos=gestor)
+    p1, p2 = proceso(1), proceso(2)
+    assert gestor.bloquear_directorio(p1, '/home/ana')
+    assert gestor.solicitar_acceso(p1, 'home/ana/notas.txt')
+    assert gestor.bloquear_directorio(p1, '/home')
+    assert not gestor.solicitar_acceso(p2, 'home/luis/datos.db')
+    p2.archivo_actual = 'home/luis/datos.db'
+    planificador.bloquear_proceso(p2)
+
+    planificador.liberar_recursos(p1)
+    assert gestor.directorios_bloqueados == set()
+    assert gestor.buscar_directorio('/home').en_uso == {}
+    assert gestor.verificar_desbloqueos_pendientes(planificador) == [p2]
+    assert gestor.obtener_proceso_propietario('home/luis/datos.db') == 2
+
+
+def test_registrar_archivos_reparte_bloques_de_nuevo():
+    gestor = GestorArchivos(['a.txt'], disco=Disco(bloques_totales=100))
+    assert gestor.registrar_archivos(['/b.txt', 'a.txt', 'c/d.txt']) == ['b.txt', 'c/d.txt']
+    inicios = [gestor.archivos[n].bloque_inicio for n in ('a.txt', 'b.txt', 'c/d.txt')]
+    assert inicios == [0, 33, 66]
+    assert gestor._archivo_de_bloque(70) == 'c/d.txt'
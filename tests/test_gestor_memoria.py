@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas del reemplazo de paginas de GestorMemoria
+"""
+
+import random
+
+import pytest
+
+from Modulo_Procesos.proceso import Proceso
+from Modulo_Memoria.gestorMemoria import GestorMemoria
+
+
+def victima_por_busqueda(gestor, atributo):
+    """
+    Marco que elegiria una busqueda completa por las tablas de paginas
+    """
+    cargadas = [p for paginas in gestor.tabla_paginas.values() for p in paginas if p.cargada]
+    return min(cargadas, key=lambda p: (getattr(p, atributo), p.marco_asignado)).marco_asignado
+
+
+def cargar(gestor, proceso, indice, tiempo):
+    gestor.tiempo_actual = tiempo
+    gestor.cargar_pagina(gestor.tabla_paginas[proceso.id][indice])
+
+
+def test_fifo_saca_la_pagina_cargada_primero():
+    gestor = GestorMemoria(marcos_totales=3, algoritmo_reemplazo='FIFO')
+    proceso = Proceso(1, 3, 10, 0, 5, [])
+    gestor.asignar_memoria(proceso)  # pagina 0 en el marco 0 en T0
+    cargar(gestor, proceso, 1, 1)
+    cargar(gestor, proceso, 2, 2)
+    cargar(gestor, proceso, 0, 3)  # acierto: no cambia el orden FIFO
+    cargar(gestor, proceso, 3, 4)
+    assert gestor.marcos == [3, 1, 2]
+    assert gestor.reemplazos == 1
+
+
+def test_lru_saca_la_pagina_usada_hace_mas_tiempo():
+    gestor = GestorMemoria(marcos_totales=3, algoritmo_reemplazo='LRU')
+    proceso = Proceso(1, 3, 10, 0, 5, [])
+    gestor.asignar_memoria(proceso)
+    cargar(gestor, proceso, 1, 1)
+    cargar(gestor, proceso, 2, 2)
+    cargar(gestor, proceso, 0, 3)  # la pagina 0 pasa a ser la mas reciente
+    cargar(gestor, proceso, 3, 4)
+    assert gestor.marcos == [0, 3, 2]
+
+
+@pytest.mark.parametrize('algoritmo, atributo', [('FIFO', 'tiempo_carga'), ('LRU', 'ultimo_acceso')])
+def test_victima_del_indice_coincide_con_la_busqueda_completa(algoritmo, atributo):
+    rng = random.Random(7)
+    gestor = GestorMemoria(marcos_totales=16, algoritmo_reemplazo=algoritmo, semilla=1)
+    procesos = [Proceso(i, 3, 50, 0, rng.randint(1, 8), []) for i in range(1, 20)]
+    for tiempo in range(1, 2000):
+        gestor.tiempo_actual = tiempo
+        proceso = rng.choice(procesos)
+        gestor.asignar_memoria(proceso)
+        if rng.random() < 0.02:
+            gestor.liberar_memoria(proceso)
+            continue
+        pagina = rng.choice(gestor.tabla_paginas[proceso.id])
+        if not pagina.cargada and None not in gestor.marcos:
+            esperado = victima_por_busqueda(gestor, atributo)
+            gestor.cargar_pagina(pagina)
+            assert pagina.marco_asignado == esperado
+        else:
+            gestor.cargar_pagina(pagina)
+    assert gestor.reemplazos > 100
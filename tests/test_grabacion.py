@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas de la grabacion: salto a cualquier tick desde el checkpoint anterior
+"""
+
+import pytest
+
+from Modulo_Procesos import GeneradorCarga
+from Modulo_Simulacion import MotorSimulacion
+from Modulo_Simulacion.grabacion import Grabacion
+
+
+def nuevo_motor():
+    motor = MotorSimulacion(semilla=7)
+    motor.agregar_carga(GeneradorCarga(total=20, tasa_llegada=0.4, semilla=7))
+    return motor
+
+
+def correr_hasta(motor, tick):
+    while motor.hay_procesos_activos() and motor.ciclo < tick:
+        motor.ejecutar_tick()
+    return motor
+
+
+def estado(motor):
+    return (motor.planificador.tiempo_actual,
+            motor.planificador.calcular_metricas(),
+            motor.gestor_memoria.obtener_estadisticas(),
+            motor.gestor_archivos.obtener_estadisticas(),
+            list(motor.planificador.historial_ejecucion))
+
+
+@pytest.fixture(scope='module')
+def grabacion():
+    motor = nuevo_motor()
+    grabacion = Grabacion(intervalo_checkpoint=7)
+    grabacion.iniciar(motor)
+    while motor.hay_procesos_activos():
+        motor.ejecutar_tick()
+        grabacion.registrar(motor)
+    grabacion.finalizar(motor)
+    return grabacion
+
+
+@pytest.mark.parametrize('tick', [0, 1, 7, 33, 90])
+def test_restaurar_coincide_con_una_corrida_directa(grabacion, tick):
+    assert estado(grabacion.restaurar(tick)) == estado(correr_hasta(nuevo_motor(), tick))
+
+
+def test_restaurar_al_final_no_repite_ticks(grabacion):
+    motor = grabacion.restaurar(grabacion.total_ticks)
+    assert motor.ciclo == grabacion.total_ticks
+    assert not motor.hay_procesos_activos()
+
+
+def test_serializacion_binaria(grabacion):
+    copia = Grabacion.desde_bytes(grabacion.a_bytes())
+    assert copia.total_ticks == grabacion.total_ticks
+    assert copia.tiempos_checkpoint == grabacion.tiempos_checkpoint
+    assert copia.historial_hasta(copia.total_ticks) == grabacion.historial_hasta(grabacion.total_ticks)
+    with pytest.raises(ValueError):
+        Grabacion.desde_bytes(b'XXXX' + grabacion.a_bytes()[4:])
+    datos = bytearray(grabacion.a_bytes())
+    datos[6:14] = bytes(8)
+    with pytest.raises(ValueError, match="disposicion"):
+        Grabacion.desde_bytes(bytes(datos))
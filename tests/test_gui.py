@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas de la interfaz: canvas de memoria incremental, log acotado y
+limite de ticks (se saltan si no hay pantalla disponible)
+"""
+
+import pytest
+
+tk = pytest.importorskip('tkinter')
+
+from Modulo_Procesos.proceso import Proceso
+from Modulo_Simulacion.motor import MotorSimulacion
+
+
+@pytest.fixture
+def gui():
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("Sin pantalla para tkinter")
+    root.withdraw()
+    from gui import SimuladorGUI
+    aplicacion = SimuladorGUI(root)
+    yield aplicacion
+    root.destroy()
+
+
+def instantanea(ticks):
+    motor = MotorSimulacion(semilla=1, marcos_totales=6)
+    motor.agregar_procesos([Proceso(1, 1, 20, 0, 3, []), Proceso(2, 2, 20, 0, 3, [])])
+    for _ in range(ticks):
+        motor.ejecutar_tick()
+    return motor.tomar_instantanea()
+
+
+def test_canvas_de_memoria_solo_actualiza_marcos_cambiados(gui):
+    vacia, ocupada = instantanea(0), instantanea(4)
+    gui.actualizar_visualizacion_memoria(vacia)
+    elementos = len(gui.memoria_canvas.find_all())
+
+    cambios = []
+    original = gui.memoria_canvas.itemconfigure
+    gui.memoria_canvas.itemconfigure = lambda item, **opciones: (cambios.append(item), original(item, **opciones))
+    gui.actualizar_visualizacion_memoria(vacia)
+    assert cambios == []
+
+    gui.actualizar_visualizacion_memoria(ocupada)
+    marcos_cambiados = sum(1 for a, b in zip(vacia.marcos, ocupada.marcos) if a != b)
+    assert marcos_cambiados > 0
+    # Rectangulo y texto por marco cambiado, mas el texto de estadisticas
+    assert len(cambios) == 2 * marcos_cambiados + 1
+    assert len(gui.memoria_canvas.find_all()) == elementos
+
+
+def test_log_conserva_las_ultimas_lineas(gui):
+    gui.max_lineas_log = 100
+    gui.agregar_logs([(f"mensaje {i}", 'INFO') for i in range(250)])
+    lineas = gui.log_text.get('1.0', 'end-1c').splitlines()
+    assert len(lineas) == 100
+    assert lineas[-1].endswith("mensaje 249")
+    assert gui.lineas_log_descartadas == 150
+
+
+def test_ejecutar_hasta_avisa_si_supera_el_limite(gui, monkeypatch):
+    import gui as modulo_gui
+    from Modulo_Simulacion.control import ControlVelocidad
+    avisos = []
+    monkeypatch.setattr(modulo_gui.messagebox, 'showwarning', lambda *args: avisos.append(args))
+    gui.control = ControlVelocidad(ticks_por_segundo=0)
+    gui.max_ciclos = 100
+
+    gui.tiempo_objetivo_var.set("150")
+    gui.ejecutar_hasta_tiempo()
+    assert len(avisos) == 1 and gui.control.tiempo_objetivo is None
+
+    gui.tiempo_objetivo_var.set("80")
+    gui.ejecutar_hasta_tiempo()
+    assert len(avisos) == 1 and gui.control.tiempo_objetivo == 80
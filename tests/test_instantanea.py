@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas de las instantaneas inmutables y del buzon de una posicion
+"""
+
+import pickle
+
+import pytest
+
+from Modulo_Procesos.proceso import Proceso
+from Modulo_Simulacion.motor import MotorSimulacion
+from Modulo_Simulacion.instantanea import BuzonInstantaneas
+
+
+def motor_en_marcha():
+    motor = MotorSimulacion(semilla=1)
+    motor.agregar_procesos([Proceso(1, 1, 5, 0, 2, []), Proceso(2, 2, 5, 0, 2, [])])
+    for _ in range(3):
+        motor.ejecutar_tick()
+    return motor
+
+
+def test_instantanea_es_de_solo_lectura_y_no_cambia_con_el_motor():
+    motor = motor_en_marcha()
+    instantanea = motor.tomar_instantanea()
+    with pytest.raises(TypeError):
+        instantanea.estadisticas_memoria['fallos_pagina'] = 0
+    fallos = instantanea.estadisticas_memoria['fallos_pagina']
+    motor.ejecutar_tick()
+    assert instantanea.estadisticas_memoria['fallos_pagina'] == fallos
+    assert instantanea.tiempo < motor.planificador.tiempo_actual
+
+
+def test_instantanea_se_serializa_con_pickle():
+    instantanea = motor_en_marcha().tomar_instantanea()
+    copia = pickle.loads(pickle.dumps(instantanea))
+    assert copia == instantanea
+    with pytest.raises(TypeError):
+        copia.estadisticas_archivos['conflictos_totales'] = 0
+
+
+def test_buzon_conserva_solo_la_ultima():
+    buzon = BuzonInstantaneas()
+    motor = motor_en_marcha()
+    primera = motor.tomar_instantanea()
+    motor.ejecutar_tick()
+    ultima = motor.tomar_instantanea()
+    buzon.publicar(primera)
+    buzon.publicar(ultima)
+    assert buzon.tomar() is ultima
+    assert buzon.tomar() is None
+    assert (buzon.publicadas, buzon.descartadas) == (2, 1)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas de herencia y techo de prioridad sobre bloqueos de archivos
+"""
+
+import pytest
+
+from Modulo_Procesos.proceso import Proceso
+from Modulo_Simulacion.motor import MotorSimulacion
+
+
+def correr_inversion(protocolo, ticks_seccion_critica=2):
+    """
+    P1 (baja) toma data.db, P2 (alta) lo espera y P3..P5 (media) compiten por la CPU
+    """
+    motor = MotorSimulacion(algoritmo='PRIORIDAD', protocolo_prioridad=protocolo,
+                            archivos=['data.db'], archivos_escritura=[],
+                            ticks_seccion_critica=ticks_seccion_critica)
+    procesos = [Proceso(1, 5, 10, 0, 1, ['data.db']), Proceso(2, 1, 10, 2, 1, ['data.db'])]
+    procesos += [Proceso(i, 3, 8, 3, 1, []) for i in range(3, 6)]
+    motor.agregar_procesos(procesos)
+    while motor.hay_procesos_activos() and motor.ciclo < 500:
+        motor.ejecutar_tick()
+    assert not motor.hay_procesos_activos()
+    return motor.gestor_archivos.obtener_estadisticas(), procesos
+
+
+def test_sin_protocolo_la_prioridad_media_retrasa_a_la_alta():
+    estadisticas, procesos = correr_inversion(None)
+    # P2 espera a que las tres de prioridad media terminen antes de que P1 suelte el archivo
+    assert estadisticas['espera_alta_p50'] > 3 * 8 - 5
+    assert procesos[0].tiempo_finalizacion > max(p.tiempo_finalizacion for p in procesos[2:])
+
+
+@pytest.mark.parametrize('protocolo', ['HERENCIA', 'TECHO'])
+def test_protocolo_acorta_la_espera_de_alta_prioridad(protocolo):
+    sin_protocolo, _ = correr_inversion(None)
+    estadisticas, procesos = correr_inversion(protocolo)
+    assert estadisticas['elevaciones_prioridad'] > 0
+    assert estadisticas['espera_alta_p50'] < sin_protocolo['espera_alta_p50']
+    assert procesos[1].tiempo_finalizacion < min(p.tiempo_finalizacion for p in procesos[2:])
+    # Al soltar el archivo P1 recupera su prioridad base
+    assert procesos[0].prioridad_efectiva() == 5
+
+
+def test_sin_seccion_critica_los_protocolos_no_cambian_nada():
+    esperas = {protocolo: correr_inversion(protocolo, ticks_seccion_critica=0)[0]['espera_alta_p50']
+               for protocolo in (None, 'HERENCIA', 'TECHO')}
+    assert len(set(esperas.values())) == 1
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas del lector de trazas (CSV y JSONL)
+"""
+
+import json
+
+import pytest
+
+from Modulo_Procesos.lectorTrazas import LectorTraza
+from Modulo_Procesos.proceso import Proceso
+from Modulo_Simulacion.motor import MotorSimulacion
+
+
+def escribir(tmp_path, nombre, texto):
+    ruta = tmp_path / nombre
+    ruta.write_text(texto, encoding='utf-8')
+    return str(ruta)
+
+
+def test_lee_csv_con_alias_y_archivos(tmp_path):
+    ruta = escribir(tmp_path, 'traza.csv',
+                    "pid,arrival,burst,priority,pages,files\n"
+                    "1,0,5,2,3,a.txt;b.txt\n"
+                    "2,4,1,,,\n")
+    procesos = list(LectorTraza(ruta))
+    assert [p.id for p in procesos] == [1, 2]
+    assert procesos[0].archivos_necesarios == ['a.txt', 'b.txt']
+    assert procesos[0].memoria_requerida == 3
+    # Campos vacios toman los valores por defecto
+    assert procesos[1].prioridad == 3
+    assert procesos[1].memoria_requerida == 1
+
+
+def test_lee_jsonl(tmp_path):
+    lineas = [{'id': 1, 'llegada': 0, 'duracion': 2, 'archivos': ['x.db']},
+              {'id': 2, 'llegada': 1, 'duracion': 3, 'archivos': 'y.db;z.db'}]
+    ruta = escribir(tmp_path, 'traza.jsonl', "\n".join(json.dumps(l) for l in lineas) + "\n")
+    procesos = list(LectorTraza(ruta))
+    assert [p.archivos_necesarios for p in procesos] == [['x.db'], ['y.db', 'z.db']]
+
+
+@pytest.mark.parametrize('fila', ["1,0,5,1,0,", "1,0,5,0,1,", "1,0,5,6,1,", "1,0,0,1,1,", "1,0,x,1,1,"])
+def test_filas_invalidas_se_cuentan(tmp_path, fila):
+    ruta = escribir(tmp_path, 'traza.csv',
+                    "id,llegada,duracion,prioridad,memoria,archivos\n" + fila + "\n2,1,3,1,1,\n")
+    lector = LectorTraza(ruta)
+    assert [p.id for p in lector] == [2]
+    assert lector.obtener_estadisticas()['invalidas'] == 1
+
+
+def test_estricto_lanza_con_numero_de_linea(tmp_path):
+    ruta = escribir(tmp_path, 'traza.csv',
+                    "id,llegada,duracion,prioridad,memoria,archivos\n1,0,5,1,0,\n")
+    with pytest.raises(ValueError, match="linea 1: memoria invalida"):
+        list(LectorTraza(ruta, estricto=True))
+
+
+def test_nombres_archivos_no_mueve_la_lectura(tmp_path):
+    ruta = escribir(tmp_path, 'traza.csv',
+                    "id,llegada,duracion,archivos\n1,0,5,a.txt;b.txt\n2,1,3,b.txt;c/d.txt\n")
+    lector = LectorTraza(ruta)
+    assert next(lector).id == 1
+    assert lector.nombres_archivos() == ['a.txt', 'b.txt', 'c/d.txt']
+    assert next(lector).id == 2
+
+
+def test_traza_con_archivos_nuevos_termina(tmp_path):
+    ruta = escribir(tmp_path, 'traza.csv',
+                    "id,llegada,duracion,archivos\n1,0,5,nofile.txt\n2,1,4,datos/otro.db\n")
+    motor = MotorSimulacion(semilla=1)
+    motor.agregar_carga(LectorTraza(ruta))
+    assert motor.gestor_archivos.existe_archivo('/nofile.txt')
+    for _ in range(200):
+        if not motor.hay_procesos_activos():
+            break
+        motor.ejecutar_tick()
+    assert motor.planificador.metricas['procesos_completados'] == 2
+    assert motor.gestor_archivos.operaciones_exitosas == 2
+
+
+def test_archivos_inexistentes_se_ignoran_al_agregar():
+    motor = MotorSimulacion(semilla=1)
+    eventos = motor.agregar_procesos([Proceso(1, 1, 5, 0, 1, ['nofile.txt'])])
+    assert motor.planificador.todos_procesos[0].archivos_necesarios == []
+    assert eventos[0][1] == 'WARNING'
+    for _ in range(50):
+        if not motor.hay_procesos_activos():
+            break
+        motor.ejecutar_tick()
+    assert motor.planificador.metricas['procesos_completados'] == 1
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas del motor por lotes: cada fila debe coincidir con MotorSimulacion
+"""
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from Modulo_Procesos import GeneradorCarga
+from Modulo_Simulacion import MotorSimulacion
+from Modulo_Simulacion.lote import MotorLote
+
+
+def carga(semilla):
+    return list(GeneradorCarga(total=12, tasa_llegada=0.3, duracion_media=5, max_archivos=0,
+                               memoria_max=5, semilla=semilla))
+
+
+@pytest.mark.parametrize('algoritmo', ['FIFO', 'LRU'])
+def test_lote_equivale_al_motor_escalar(algoritmo):
+    semillas = list(range(20))
+    lote = MotorLote(carga, semillas, quantum=3, algoritmo_memoria=algoritmo, marcos_totales=4,
+                     registrar_historial=True)
+    lote.correr(2000)
+    for indice, semilla in enumerate(semillas):
+        motor = MotorSimulacion(algoritmo='RR', quantum=3, algoritmo_memoria=algoritmo,
+                                marcos_totales=4, semilla=semilla)
+        motor.agregar_procesos(carga(semilla))
+        while motor.hay_procesos_activos() and motor.ciclo < 2000:
+            motor.ejecutar_tick()
+        resultado = lote.resultados(indice)
+        assert resultado['metricas'] == motor.planificador.calcular_metricas()
+        assert resultado['memoria'] == motor.gestor_memoria.obtener_estadisticas()
+        assert resultado['tiempo'] == motor.planificador.tiempo_actual
+        assert lote.historial_ejecucion(indice) == motor.planificador.historial_ejecucion
+
+
+def test_lote_rechaza_procesos_con_archivos():
+    with pytest.raises(ValueError):
+        MotorLote(lambda semilla: list(GeneradorCarga(total=5, max_archivos=2, semilla=semilla)), [1])
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas del punto de entrada por linea de comandos
+"""
+
+import json
+import subprocess
+import sys
+import os
+
+import pytest
+
+import main
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_json_por_salida_estandar(capsys):
+    main.main(['--carga', 'POISSON', '--procesos', '30', '--semilla', '5', '--json', '-'])
+    resultado = json.loads(capsys.readouterr().out)
+    assert resultado['completa']
+    assert resultado['metricas']['procesos_completados'] == 30
+    assert resultado['configuracion']['semilla'] == 5
+
+
+def test_misma_semilla_mismos_resultados(tmp_path):
+    rutas = [str(tmp_path / f'r{i}.json') for i in range(2)]
+    for ruta in rutas:
+        main.main(['--semilla', '9', '--memoria', 'LRU', '--json', ruta])
+    resultados = []
+    for ruta in rutas:
+        with open(ruta, encoding='utf-8') as archivo:
+            resultado = json.load(archivo)
+        resultado.pop('segundos')
+        resultado.pop('ticks_por_segundo')
+        resultados.append(resultado)
+    assert resultados[0] == resultados[1]
+
+
+def test_traza_inexistente_termina_con_error(capsys):
+    with pytest.raises(SystemExit) as salida:
+        main.main(['--traza', 'no_existe.csv', '--json', '-'])
+    assert salida.value.code == 2
+    assert 'Error' in capsys.readouterr().err
+
+
+def test_no_importa_tkinter_sin_gui():
+    codigo = "import sys, main; main.main(['--semilla', '1', '--json', '-']); assert 'tkinter' not in sys.modules"
+    proceso = subprocess.run([sys.executable, '-c', codigo], cwd=RAIZ, capture_output=True, text=True)
+    assert proceso.returncode == 0, proceso.stderr
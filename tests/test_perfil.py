@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas del perfilador de fases
+"""
+
+import pytest
+
+from Modulo_Procesos import GeneradorCarga
+from Modulo_Procesos.planificador import Planificador
+from Modulo_Simulacion import MotorSimulacion
+from Modulo_Simulacion.perfil import Perfilador, crear_perfilador
+
+
+def correr(ticks=30):
+    motor = MotorSimulacion(semilla=4)
+    motor.agregar_carga(GeneradorCarga(total=10, tasa_llegada=0.5, semilla=4))
+    for _ in range(ticks):
+        motor.ejecutar_tick()
+    return motor
+
+
+def test_cuenta_llamadas_y_restaura_los_metodos():
+    original = Planificador.ejecutar_ciclo
+    with Perfilador() as perfilador:
+        assert Planificador.ejecutar_ciclo is not original
+        correr(30)
+    assert Planificador.ejecutar_ciclo is original
+    estadisticas = perfilador.obtener_estadisticas()
+    assert estadisticas['tick']['llamadas'] == 30
+    assert estadisticas['ciclo']['llamadas'] == 30
+    assert estadisticas['tick']['tiempo'] >= estadisticas['ciclo']['tiempo']
+    assert 'PERFIL DE FASES' in perfilador.reporte()
+
+
+def test_no_cambia_el_resultado_de_la_simulacion():
+    sin_perfil = correr().resumen_final()
+    with Perfilador(usar_cprofile=True):
+        con_perfil = correr().resumen_final()
+    assert con_perfil['metricas'] == sin_perfil['metricas']
+    assert con_perfil['memoria'] == sin_perfil['memoria']
+
+
+def test_solo_un_perfilador_activo():
+    with Perfilador():
+        with pytest.raises(RuntimeError):
+            Perfilador().activar()
+
+
+def test_crear_perfilador():
+    assert crear_perfilador('ninguno') is None
+    assert crear_perfilador('TRACEMALLOC').usar_tracemalloc
+    with pytest.raises(ValueError):
+        crear_perfilador('GPU')
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas del planificador de corto plazo
+"""
+
+from Modulo_Procesos.proceso import Proceso
+from Modulo_Procesos.planificador import Planificador, MAX_HISTORIAL
+
+
+def correr(planificador, ciclos=100):
+    for _ in range(ciclos):
+        if not planificador.hay_procesos_activos():
+            break
+        planificador.ejecutar_ciclo()
+
+
+def test_round_robin_con_un_solo_proceso_no_cambia_de_contexto():
+    planificador = Planificador('RR', quantum=2)
+    planificador.agregar_proceso(Proceso(1, 1, 7, 0, 1, []))
+    correr(planificador)
+    assert planificador.metricas['procesos_completados'] == 1
+    assert planificador.metricas['cambios_contexto'] == 0
+
+
+def test_round_robin_alterna_y_cuenta_cada_cambio():
+    planificador = Planificador('RR', quantum=2)
+    planificador.agregar_proceso(Proceso(1, 1, 4, 0, 1, []))
+    planificador.agregar_proceso(Proceso(2, 1, 4, 0, 1, []))
+    correr(planificador)
+    assert [pid for _, pid in planificador.historial_ejecucion] == [1, 1, 2, 2, 1, 1, 2, 2]
+    # Se cuentan las expulsiones por quantum (1 -> 2 y 2 -> 1); al terminar P1 no hay expulsion
+    assert planificador.metricas['cambios_contexto'] == 2
+
+
+def test_llegadas_futuras_entran_en_su_tick_y_en_orden():
+    planificador = Planificador('RR', quantum=10)
+    planificador.agregar_proceso(Proceso(1, 1, 2, 3, 1, []))
+    planificador.agregar_proceso(Proceso(2, 1, 2, 1, 1, []))
+    planificador.agregar_proceso(Proceso(3, 1, 2, 1, 1, []))
+    assert planificador.hay_procesos_activos()
+    correr(planificador)
+    assert not planificador.hay_procesos_activos()
+    assert not planificador.llegadas_pendientes
+    assert [pid for _, pid in planificador.historial_ejecucion] == [2, 2, 3, 3, 1, 1]
+
+
+def test_historial_acotado_sin_conservar_terminados():
+    planificador = Planificador('RR', quantum=2, conservar_terminados=False)
+    for pid in range(1, 7):
+        planificador.agregar_proceso(Proceso(pid, 1, MAX_HISTORIAL // 4, 0, 1, []))
+    correr(planificador, ciclos=2 * MAX_HISTORIAL)
+    assert planificador.metricas['procesos_completados'] == 6
+    assert len(planificador.historial_ejecucion) == MAX_HISTORIAL
+    assert planificador.historial_ejecucion[-1][0] == planificador.tiempo_actual
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas del PCB con __slots__ y estados codificados como enteros
+"""
+
+import pickle
+
+import pytest
+
+from Modulo_Procesos.proceso import Proceso, NUEVO, LISTO, TERMINADO
+
+
+def test_estado_por_nombre_y_por_codigo():
+    proceso = Proceso(1, 3, 4, 0, 1, [])
+    assert proceso.codigo_estado == NUEVO and proceso.estado == 'NUEVO'
+    proceso.estado = 'LISTO'
+    assert proceso.codigo_estado == LISTO
+    proceso.estado = TERMINADO
+    assert proceso.estado == 'TERMINADO'
+    with pytest.raises(KeyError):
+        proceso.estado = 'ZOMBI'
+
+
+def test_slots_sin_diccionario():
+    proceso = Proceso(1, 3, 4, 0, 1, ['a.txt'])
+    assert not hasattr(proceso, '__dict__')
+    with pytest.raises(AttributeError):
+        proceso.atributo_nuevo = 1
+
+
+def test_listas_propias_y_pickle():
+    archivos = ['a.txt', 'b.txt']
+    a = Proceso(1, 3, 4, 0, 1, archivos)
+    b = Proceso(2, 3, 4, 0, 1, archivos)
+    assert a.archivos_necesarios is not archivos and a.archivos_necesarios is not b.archivos_necesarios
+    a.archivos_usados.append('a.txt')
+    a.paginas_asignadas.append(7)
+    assert b.archivos_usados == [] and b.paginas_asignadas == []
+    a.ejecutar(2)
+    copia = pickle.loads(pickle.dumps(a))
+    assert (copia.id, copia.tiempo_restante, copia.estado, copia.archivos_necesarios,
+            copia.archivos_usados) == (1, 2, 'NUEVO', ['a.txt', 'b.txt'], ['a.txt'])
+
+
+def test_ejecutar_hasta_terminar():
+    proceso = Proceso(1, 3, 3, 0, 1, [])
+    assert proceso.ejecutar(2) == 2
+    assert proceso.ejecutar(2) == 1
+    assert proceso.codigo_estado == TERMINADO
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas de los modelos de referencias a memoria con localidad
+"""
+
+import random
+
+import pytest
+
+from Modulo_Memoria.gestorMemoria import GestorMemoria
+from Modulo_Memoria.referencias import generar_referencias, MODELOS_REFERENCIAS, LARGO_MAXIMO
+from Modulo_Procesos.proceso import Proceso
+
+
+def paginas_alternadas(paginas, largo, rng):
+    return [i % 2 for i in range(largo)]
+
+
+@pytest.mark.parametrize('modelo', MODELOS_REFERENCIAS)
+def test_indices_dentro_del_proceso(modelo):
+    referencias = generar_referencias(modelo, 16, 500, random.Random(1))
+    assert len(referencias) == 500
+    assert all(0 <= r < 16 for r in referencias)
+
+
+def test_largo_acotado_y_secuencial():
+    assert len(generar_referencias('SECUENCIAL', 4, 10 ** 6, random.Random(1))) == LARGO_MAXIMO
+    assert list(generar_referencias('SECUENCIAL', 3, 7, random.Random(1))) == [0, 1, 2, 0, 1, 2, 0]
+
+
+def test_modelo_a_medida_y_desconocido():
+    assert list(generar_referencias(paginas_alternadas, 8, 4, random.Random(1))) == [0, 1, 0, 1]
+    with pytest.raises(ValueError):
+        generar_referencias('ALEATORIO', 8, 4, random.Random(1))
+    with pytest.raises(ValueError):
+        GestorMemoria(modelo_referencias='ALEATORIO')
+
+
+def tasa_fallos(modelo):
+    gestor = GestorMemoria(marcos_totales=8, algoritmo_reemplazo='LRU', semilla=3,
+                           modelo_referencias=modelo)
+    proceso = Proceso(1, 1, 2000, 0, 32, [])
+    gestor.asignar_memoria(proceso)
+    for tiempo in range(2000):
+        gestor.tiempo_actual = tiempo
+        gestor.acceder_memoria(proceso)
+        proceso.ejecutar(1)
+    return gestor.obtener_estadisticas()['tasa_fallos']
+
+
+def test_la_localidad_reduce_los_fallos():
+    uniforme = tasa_fallos('UNIFORME')
+    assert tasa_fallos('BUCLE') < uniforme
+    assert tasa_fallos('FASES') < uniforme
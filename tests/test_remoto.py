@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas del motor en un proceso hijo
+"""
+
+import time
+
+from Modulo_Procesos.proceso import Proceso
+from Modulo_Simulacion.remoto import MotorRemoto
+
+
+def recibir_hasta_terminar(remoto, limite=30.0):
+    mensajes = []
+    fin = time.monotonic() + limite
+    while not remoto.terminado and time.monotonic() < fin:
+        mensajes.extend(remoto.recibir())
+        time.sleep(0.01)
+    return mensajes
+
+
+def test_motor_remoto_corre_y_envia_resultados():
+    procesos = [Proceso(1, 1, 6, 0, 2, ['config.ini']), Proceso(2, 2, 4, 1, 1, [])]
+    remoto = MotorRemoto({'semilla': 1}, procesos, ticks_por_segundo=0, max_ciclos=200)
+    mensajes = recibir_hasta_terminar(remoto)
+    tipos = [tipo for tipo, _ in mensajes]
+    assert tipos[-1] == 'detener'
+    assert {'estado', 'grabacion', 'series', 'finalizar'} <= set(tipos)
+    resumen = dict(mensajes)['finalizar']
+    assert resumen['metricas']['procesos_completados'] == 2
+    # La ultima instantanea corresponde al final de la corrida
+    ultimo_estado = [contenido for tipo, contenido in mensajes if tipo == 'estado'][-1]
+    assert ultimo_estado[1].cpu is None
+    assert ultimo_estado[1].tiempo == dict(mensajes)['grabacion'].total_ticks
+    assert not remoto.proceso.is_alive()
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas de las semillas por subsistema y del lote de accesos a memoria
+"""
+
+import random
+
+import pytest
+
+from Modulo_Procesos import GeneradorCarga
+from Modulo_Procesos.semillas import derivar_semilla, SUBSISTEMAS
+from Modulo_Memoria.gestorMemoria import GestorMemoria, TAM_LOTE_ACCESOS
+
+
+def test_semillas_estables_e_independientes():
+    semillas = [derivar_semilla(42, s) for s in SUBSISTEMAS]
+    assert len(set(semillas)) == len(SUBSISTEMAS)
+    assert semillas == [derivar_semilla(42, s) for s in SUBSISTEMAS]
+    assert all(0 <= s < 2 ** 64 for s in semillas)
+    assert derivar_semilla(None, 'carga') is None
+    with pytest.raises(ValueError):
+        derivar_semilla(42, 'disco')
+
+
+def test_cambiar_archivos_no_altera_el_resto_de_la_carga():
+    def sin_archivos(generador):
+        return [(p.prioridad, p.duracion_total, p.tiempo_llegada, p.memoria_requerida) for p in generador]
+
+    base = sin_archivos(GeneradorCarga(total=100, semilla=8))
+    otra = sin_archivos(GeneradorCarga(total=100, semilla=8, archivos=['x', 'y'], max_archivos=1))
+    assert base == otra
+
+
+def test_lote_de_accesos_igual_a_llamadas_sueltas():
+    gestor = GestorMemoria(semilla=123)
+    referencia = random.Random(123)
+    n = 2 * TAM_LOTE_ACCESOS + 5
+    assert [gestor.siguiente_aleatorio() for _ in range(n)] == [referencia.getrandbits(32) for _ in range(n)]
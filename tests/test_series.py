@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas de las series de tiempo por tick y su exportacion
+"""
+
+import csv
+
+import pytest
+
+from Modulo_Procesos import GeneradorCarga
+from Modulo_Simulacion import MotorSimulacion
+from Modulo_Simulacion.series import SeriesTiempo
+
+
+def grabar(*series):
+    motor = MotorSimulacion(semilla=2)
+    motor.agregar_carga(GeneradorCarga(total=15, tasa_llegada=0.3, semilla=2))
+    for s in series:
+        s.iniciar(motor)
+    while motor.hay_procesos_activos():
+        motor.ejecutar_tick()
+        for s in series:
+            s.registrar(motor)
+    for s in series:
+        s.finalizar(motor)
+    return motor
+
+
+def test_agregacion_conserva_los_totales():
+    por_tick, agregada = SeriesTiempo(), SeriesTiempo(factor=10)
+    motor = grabar(por_tick, agregada)
+    assert len(por_tick) == motor.ciclo
+    assert len(agregada) == -(-motor.ciclo // 10)
+    for nombre in ('fallos_pagina', 'conflictos'):
+        assert sum(agregada.columnas[nombre]) == sum(por_tick.columnas[nombre])
+    assert sum(por_tick.columnas['fallos_pagina']) == motor.gestor_memoria.fallos_pagina
+    ocupados = sum(por_tick.columnas['utilizacion_cpu'])
+    assert ocupados == len(motor.planificador.historial_ejecucion)
+    assert agregada.columnas['tiempo'][-1] == por_tick.columnas['tiempo'][-1]
+
+
+def test_exportar_y_cargar_binario(tmp_path):
+    series = SeriesTiempo(factor=3)
+    grabar(series)
+    ruta = str(tmp_path / 'series.bin')
+    series.exportar_binario(ruta)
+    cargada = SeriesTiempo.cargar_binario(ruta)
+    assert cargada.factor == 3
+    assert cargada.columnas == series.columnas
+
+
+def test_exportar_csv(tmp_path):
+    series = SeriesTiempo()
+    grabar(series)
+    ruta = tmp_path / 'series.csv'
+    series.exportar_csv(str(ruta))
+    with open(ruta, newline='', encoding='utf-8') as archivo:
+        filas = list(csv.reader(archivo))
+    assert filas[0][0] == 'tiempo'
+    assert len(filas) == len(series) + 1
+
+
+def test_cargar_binario_rechaza_otro_formato(tmp_path):
+    ruta = tmp_path / 'otro.bin'
+    ruta.write_bytes(b'XXXX' + bytes(20))
+    with pytest.raises(ValueError):
+        SeriesTiempo.cargar_binario(str(ruta))
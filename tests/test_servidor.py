@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas del servidor de estado: comandos por POST y flujo SSE a varios visores
+"""
+
+import asyncio
+import json
+
+from Modulo_Simulacion.servidor import ServidorEstado
+
+
+async def peticion(puerto, metodo, ruta, cuerpo=None, tipo='application/json'):
+    lector, escritor = await asyncio.open_connection('127.0.0.1', puerto)
+    datos = json.dumps(cuerpo).encode() if cuerpo is not None else b''
+    escritor.write(f"{metodo} {ruta} HTTP/1.1\r\nHost: x\r\nContent-Type: {tipo}\r\n"
+                   f"Content-Length: {len(datos)}\r\n\r\n".encode() + datos)
+    respuesta = await lector.read()
+    escritor.close()
+    cabecera, _, cuerpo = respuesta.partition(b'\r\n\r\n')
+    return int(cabecera.split()[1]), json.loads(cuerpo)
+
+
+async def leer_eventos(puerto, hasta='fin'):
+    lector, escritor = await asyncio.open_connection('127.0.0.1', puerto)
+    escritor.write(b"GET /eventos HTTP/1.1\r\nHost: x\r\n\r\n")
+    eventos = []
+    while True:
+        linea = (await lector.readline()).decode().rstrip('\n')
+        if linea.startswith('event: '):
+            nombre = linea[7:]
+            datos = json.loads((await lector.readline()).decode()[6:])
+            eventos.append((nombre, datos))
+            if nombre == hasta:
+                break
+    escritor.close()
+    return eventos
+
+
+def con_servidor(prueba):
+    async def correr():
+        servidor = ServidorEstado({'procesos': 20, 'semilla': 1}, ticks_por_segundo=0, puerto=0)
+        tarea = asyncio.ensure_future(servidor.servir())
+        while servidor.servidor is None:
+            await asyncio.sleep(0.01)
+        try:
+            return await asyncio.wait_for(prueba(servidor, servidor.puerto), 30)
+        finally:
+            tarea.cancel()
+    return asyncio.run(correr())
+
+
+def test_varios_visores_reciben_la_corrida_completa():
+    async def prueba(servidor, puerto):
+        visores = [asyncio.ensure_future(leer_eventos(puerto)) for _ in range(3)]
+        while len(servidor.visores) < 3:
+            await asyncio.sleep(0.01)
+        codigo, respuesta = await peticion(puerto, 'POST', '/control', {'accion': 'iniciar'})
+        assert (codigo, respuesta['corrida']) == (200, 1)
+        for eventos in await asyncio.gather(*visores):
+            nombres = [nombre for nombre, _ in eventos]
+            assert 'estado' in nombres
+            fin = eventos[-1][1]
+            assert fin['completa'] and fin['metricas']['procesos_completados'] == 20
+    con_servidor(prueba)
+
+
+def test_errores_de_peticion():
+    async def prueba(servidor, puerto):
+        assert (await peticion(puerto, 'POST', '/control', {'accion': 'pausar'}))[0] == 409
+        assert (await peticion(puerto, 'POST', '/control', {'accion': 'x'}, tipo='text/plain'))[0] == 415
+        assert (await peticion(puerto, 'POST', '/control', {'accion': 'iniciar',
+                                                            'configuracion': {'nada': 1}}))[0] == 400
+        assert (await peticion(puerto, 'POST', '/control', {'accion': 'iniciar',
+                                                            'ticks_por_segundo': 'inf'}))[0] == 400
+        assert (await peticion(puerto, 'GET', '/otra'))[0] == 404
+        assert (await peticion(puerto, 'DELETE', '/estado'))[0] == 405
+        codigo, estado = await peticion(puerto, 'GET', '/estado')
+        assert codigo == 200 and estado['corrida'] == 0
+
+        assert (await peticion(puerto, 'POST', '/control', {'accion': 'iniciar'}))[0] == 200
+        assert (await peticion(puerto, 'POST', '/control', {'accion': 'pausar'}))[0] == 200
+        for invalido in ({'accion': 'paso', 'pasos': -1}, {'accion': 'paso', 'pasos': 0},
+                         {'accion': 'hasta', 'tiempo': -5},
+                         {'accion': 'velocidad', 'ticks_por_segundo': 'inf'},
+                         {'accion': 'velocidad', 'ticks_por_segundo': 'nan'}):
+            assert (await peticion(puerto, 'POST', '/control', invalido))[0] == 400, invalido
+        assert servidor.control.pasos_pendientes == 0 and servidor.control.pausado
+        assert (await peticion(puerto, 'POST', '/control', {'accion': 'detener'}))[0] == 200
+    con_servidor(prueba)